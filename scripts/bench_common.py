@@ -0,0 +1,60 @@
+"""Shared helpers for the benchmark scripts in this directory."""
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import cv2
+import numpy as np
+
+from src.config import Config
+
+SAMPLE_VIDEOS = [
+    Config.PROJECT_ROOT / 'data' / 'ebike2.mp4',
+    Config.PROJECT_ROOT / 'data' / 'ebike3.mp4',
+    Config.PROJECT_ROOT / 'data' / 'ebike4.mp4',
+    Config.PROJECT_ROOT / 'data' / 'gara.mp4',
+]
+
+
+def read_frames(path: Path, max_frames: int = 0, stride: int = 1) -> List[np.ndarray]:
+    """Decode up to max_frames frames (0 = all) from a video, keeping every stride-th one."""
+    cap = cv2.VideoCapture(str(path))
+    frames = []
+    index = 0
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if index % stride == 0:
+                frames.append(frame)
+                if max_frames and len(frames) >= max_frames:
+                    break
+            index += 1
+    finally:
+        cap.release()
+    return frames
+
+
+def time_call(fn: Callable[[], object], repeat: int = 1) -> float:
+    """Return the best wall-clock time in seconds of repeat calls to fn."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def format_table(rows: List[Dict[str, object]]) -> str:
+    """Render a list of dicts sharing the same keys as a fixed-width text table."""
+    if not rows:
+        return ''
+    headers = list(rows[0].keys())
+    cells = [[f'{row[h]:.2f}' if isinstance(row[h], float) else str(row[h]) for h in headers]
+             for row in rows]
+    widths = [max(len(h), *(len(c[i]) for c in cells)) for i, h in enumerate(headers)]
+    lines = ['  '.join(h.ljust(w) for h, w in zip(headers, widths)),
+             '  '.join('-' * w for w in widths)]
+    lines += ['  '.join(c.ljust(w) for c, w in zip(row, widths)) for row in cells]
+    return '\n'.join(lines)
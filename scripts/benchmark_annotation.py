@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Micro-benchmark AnnotationRenderer against the per-box Detector.draw_detection.
+
+Usage:
+  python -m scripts.benchmark_annotation --boxes 1 5 20 50
+"""
+import argparse
+
+import cv2
+import numpy as np
+
+from src.config import Config
+from src.fire_detector import Detector
+from scripts.bench_common import format_table, time_call
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--boxes', type=int, nargs='+', default=[1, 5, 20, 50], help='Boxes per frame')
+    p.add_argument('--repeat', type=int, default=20, help='Timed repetitions (best is kept)')
+    return p.parse_args()
+
+
+def random_detections(count, width, height, rng):
+    corners = rng.integers(0, [width - 40, height - 40], size=(count, 2))
+    sizes = rng.integers(40, [width // 3, height // 3], size=(count, 2))
+    boxes = np.concatenate([corners, np.minimum(corners + sizes, [width - 1, height - 1])], axis=1)
+    names = rng.choice(['Fire', 'Smoke'], size=count)
+    confidences = rng.uniform(0.5, 1.0, size=count)
+    return boxes, names, confidences
+
+
+def main():
+    args = parse_args()
+    detector = Detector(Config.MODEL_PATH)
+    renderer = detector.renderer
+    frame = detector.resize_frame(cv2.imread(str(Config.PROJECT_ROOT / 'data' / 'house.png')))
+    height, width = frame.shape[:2]
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for count in args.boxes:
+        boxes, names, confidences = random_detections(count, width, height, rng)
+
+        def legacy():
+            canvas = frame.copy()
+            for box, name, confidence in zip(boxes, names, confidences):
+                detector.draw_detection(canvas, box, name, confidence)
+
+        def cached():
+            renderer.draw_boxes(frame.copy(), boxes, names, confidences)
+
+        cached()  # Populate the label sprite cache
+        legacy_ms = time_call(legacy, args.repeat) * 1000
+        cached_ms = time_call(cached, args.repeat) * 1000
+        rows.append({'stage': 'boxes', 'count': count, 'draw_detection_ms': legacy_ms,
+                     'renderer_ms': cached_ms, 'speedup': legacy_ms / cached_ms})
+
+    def footer_cold():
+        renderer._footers.clear()
+        detector._add_frame_info(frame.copy(), 'Fire')
+
+    def footer_warm():
+        detector._add_frame_info(frame.copy(), 'Fire')
+
+    cold_ms = time_call(footer_cold, args.repeat) * 1000
+    warm_ms = time_call(footer_warm, args.repeat) * 1000
+    rows.append({'stage': 'footer', 'count': 1, 'draw_detection_ms': cold_ms,
+                 'renderer_ms': warm_ms, 'speedup': cold_ms / warm_ms})
+
+    print(format_table(rows))
+    print('(footer row: uncached render vs cached render)')
+
+
+if __name__ == '__main__':
+    main()
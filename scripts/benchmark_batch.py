@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Compare Detector.process_batch against the single-frame process_frame loop.
+
+Usage:
+  python -m scripts.benchmark_batch --frames 120 --batch-sizes 2 4 8
+"""
+import argparse
+from pathlib import Path
+
+from src.config import Config
+from src.fire_detector import Detector
+from src.inference_backends import BACKENDS
+from scripts.bench_common import SAMPLE_VIDEOS, format_table, read_frames, time_call
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('videos', type=Path, nargs='*', default=SAMPLE_VIDEOS, help='Input videos')
+    p.add_argument('--frames', type=int, default=120, help='Frames decoded per video')
+    p.add_argument('--batch-sizes', type=int, nargs='+', default=[2, 4, 8], help='Batch sizes to try')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    detector = Detector(args.model, backend=args.backend)
+
+    rows = []
+    for video in args.videos:
+        frames = read_frames(video, args.frames)
+        if not frames:
+            print(f'Skipping {video}: no frames decoded')
+            continue
+
+        # Warm the model up so the first measured call is not a cold start
+        detector.process_batch(frames[:max(args.batch_sizes)])
+
+        single = time_call(lambda: [detector.process_frame(f) for f in frames])
+        rows.append({'video': video.name, 'batch': 1, 'fps': len(frames) / single, 'speedup': 1.0})
+
+        for batch_size in args.batch_sizes:
+            def run_batched():
+                for i in range(0, len(frames), batch_size):
+                    detector.process_batch(frames[i:i + batch_size])
+            elapsed = time_call(run_batched)
+            rows.append({'video': video.name, 'batch': batch_size,
+                         'fps': len(frames) / elapsed, 'speedup': single / elapsed})
+
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Compare worker memory when each process loads the model vs forking from a warmed parent.
+
+Usage:
+  python -m scripts.benchmark_fork_memory --workers 4 --frames 50
+
+Each worker processes frames of one sample video, like one process per
+camera, then waits while its memory is read from /proc/<pid>/smaps_rollup.
+USS is what a worker costs on its own; PSS sums to the real total.
+"""
+import argparse
+import multiprocessing as mp
+from pathlib import Path
+
+from src.config import Config
+from src.fire_detector import Detector
+from src.fork_launcher import ForkLauncher, process_memory
+from src.inference_backends import BACKENDS
+from scripts.bench_common import SAMPLE_VIDEOS, format_table, read_frames
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--workers', type=int, default=4, help='Worker processes')
+    p.add_argument('--frames', type=int, default=50, help='Frames each worker processes')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    return p.parse_args()
+
+
+def camera_worker(detector, video, max_frames, model_path, backend, done, release):
+    """Process one video's frames, report, and stay alive until measured."""
+    if detector is None:  # Spawned: this worker loads its own model
+        detector = Detector(model_path, backend=backend)
+    for frame in read_frames(video, max_frames):
+        detector.detect(frame)
+    done.put(None)
+    release.wait()
+
+
+def measure(mode, processes, done, release, parent_pid=None):
+    for _ in processes:
+        done.get()
+    rows = []
+    pids = ([parent_pid] if parent_pid else []) + [p.pid for p in processes]
+    for pid in pids:
+        usage = process_memory(pid)
+        rows.append({'mode': mode, 'process': 'parent' if pid == parent_pid else f'worker {pid}',
+                     'uss_mb': usage.uss, 'pss_mb': usage.pss, 'rss_mb': usage.rss})
+    release.set()
+    for process in processes:
+        process.join()
+    return rows
+
+
+def main():
+    args = parse_args()
+    videos = [SAMPLE_VIDEOS[i % len(SAMPLE_VIDEOS)] for i in range(args.workers)]
+    worker_args = [(video, args.frames, args.model, args.backend) for video in videos]
+
+    # Baseline: every worker is a fresh process loading its own copy
+    spawn = mp.get_context('spawn')
+    done, release = spawn.Queue(), spawn.Event()
+    processes = [spawn.Process(target=camera_worker, args=(None, *a, done, release))
+                 for a in worker_args]
+    for process in processes:
+        process.start()
+    rows = measure('spawn', processes, done, release)
+
+    # Shared: load and warm up once, then fork
+    frame_shape = read_frames(videos[0], 1)[0].shape
+    launcher = ForkLauncher(args.model, frame_shape=frame_shape, backend=args.backend)
+    launcher.prepare()
+    fork = mp.get_context('fork')
+    done, release = fork.Queue(), fork.Event()
+    processes = launcher.start(camera_worker, [(*a, done, release) for a in worker_args])
+    rows += measure('fork', processes, done, release, parent_pid=process_memory().pid)
+
+    print(format_table(rows))
+    totals = [{'mode': mode,
+               'worker_uss_mb': sum(r['uss_mb'] for r in rows
+                                    if r['mode'] == mode and r['process'] != 'parent'),
+               'total_pss_mb': sum(r['pss_mb'] for r in rows if r['mode'] == mode)}
+              for mode in ('spawn', 'fork')]
+    print(format_table(totals))
+
+
+if __name__ == '__main__':
+    main()
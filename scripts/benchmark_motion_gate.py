@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Quantify the CPU time MotionGate saves on the sample videos.
+
+Runs detect() on every frame, then again behind a MotionGate, and reports
+process CPU time for both, the gate hit rate and how often the gated
+Fire/Smoke decision differs from running the model on every frame.
+
+Usage:
+  python -m scripts.benchmark_motion_gate --frames 300 --max-skip 30
+"""
+import argparse
+import time
+from pathlib import Path
+
+from src.config import Config
+from src.fire_detector import Detector
+from src.motion_gate import MotionGate
+from scripts.bench_common import SAMPLE_VIDEOS, format_table, read_frames
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('videos', type=Path, nargs='*', default=SAMPLE_VIDEOS, help='Input videos')
+    p.add_argument('--frames', type=int, default=300, help='Frames decoded per video (0 = all)')
+    p.add_argument('--max-skip', type=int, default=30, help='MotionGate max_skip_frames')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    detector = Detector(args.model)
+
+    rows = []
+    for video in args.videos:
+        frames = read_frames(video, args.frames)
+        if not frames:
+            continue
+        detector.detect(frames[0])  # Warm-up
+
+        start = time.process_time()
+        baseline = [detector.detect(frame).detection for frame in frames]
+        baseline_cpu = time.process_time() - start
+
+        gate = MotionGate(max_skip_frames=args.max_skip)
+        gated, last = [], None
+        start = time.process_time()
+        for frame in frames:
+            if gate.should_infer(frame) or last is None:
+                last = detector.detect(frame)
+            gated.append(last.detection)
+        gated_cpu = time.process_time() - start
+
+        rows.append({
+            'video': video.name,
+            'frames': len(frames),
+            'hit_rate_%': 100 * gate.stats.hit_rate,
+            'cpu_s': baseline_cpu,
+            'gated_cpu_s': gated_cpu,
+            'cpu_saved_%': 100 * (1 - gated_cpu / baseline_cpu),
+            'decision_diff': sum(a != b for a, b in zip(baseline, gated)),
+        })
+
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Measure how DetectorPool throughput scales with the number of worker processes.
+
+Usage:
+  python -m scripts.benchmark_pool --frames 60 --workers 1 2 4
+
+Each sample video is submitted as its own source, round-robin, like cameras
+feeding the pool. The baseline is the same frames through one in-process
+Detector. Worker start-up (model load and warm-up) is not timed.
+"""
+import argparse
+import os
+import time
+from itertools import zip_longest
+from pathlib import Path
+
+from src.config import Config
+from src.detector_pool import DetectorPool
+from src.fire_detector import Detector
+from src.inference_backends import BACKENDS
+from scripts.bench_common import SAMPLE_VIDEOS, format_table, read_frames, time_call
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('videos', type=Path, nargs='*', default=SAMPLE_VIDEOS, help='Input videos')
+    p.add_argument('--frames', type=int, default=60, help='Frames decoded per video')
+    p.add_argument('--workers', type=int, nargs='+',
+                   default=sorted({1, 2, os.cpu_count() or 1}), help='Pool sizes to try')
+    p.add_argument('--threads-per-worker', type=int, default=1,
+                   help='Inference threads per worker process')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    streams = {video.name: read_frames(video, args.frames) for video in args.videos}
+    streams = {name: frames for name, frames in streams.items() if frames}
+    # Interleave the videos like cameras submitting at the same time
+    order = [(name, frame) for group in zip_longest(*[[(name, f) for f in frames]
+                                                      for name, frames in streams.items()])
+             for name, frame in filter(None, group)]
+    max_shape = max((frame.shape for _, frame in order), key=lambda s: s[0] * s[1])
+    print(f'{len(order)} frames from {len(streams)} videos, {os.cpu_count()} CPU cores')
+
+    detector = Detector(args.model, backend=args.backend)
+    detector.warmup(max_shape)
+    baseline = time_call(lambda: [detector.detect(frame) for _, frame in order])
+    rows = [{'mode': 'in-process', 'workers': 1, 'fps': len(order) / baseline,
+             'speedup': 1.0, 'efficiency': 1.0}]
+
+    for workers in args.workers:
+        with DetectorPool(args.model, workers=workers, max_frame_shape=max_shape,
+                          threads_per_worker=args.threads_per_worker,
+                          backend=args.backend) as pool:
+            start = time.perf_counter()
+            received = 0
+            for name, frame in order:
+                pool.submit(name, frame)
+                received += len(pool.results())
+            received += len(pool.results(wait=True))
+            elapsed = time.perf_counter() - start
+        assert received == len(order)
+        rows.append({'mode': 'pool', 'workers': workers, 'fps': len(order) / elapsed,
+                     'speedup': baseline / elapsed, 'efficiency': baseline / elapsed / workers})
+
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare the "resize" and single-pass "letterbox" preprocessing modes of Detector.
+
+Reports detect() throughput for each mode and how closely letterbox results
+agree with the current resize path: matching Fire/Smoke decisions, and the
+share of resize-mode boxes found again (same class, IoU >= --match-iou).
+
+Usage:
+  python -m scripts.benchmark_preprocess --frames 100
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.config import Config
+from src.detections import box_iou
+from src.fire_detector import Detector
+from scripts.bench_common import SAMPLE_VIDEOS, format_table, read_frames
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('videos', type=Path, nargs='*', default=SAMPLE_VIDEOS, help='Input videos')
+    p.add_argument('--frames', type=int, default=100, help='Frames decoded per video')
+    p.add_argument('--match-iou', type=float, default=0.5, help='IoU for a box to count as matched')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    return p.parse_args()
+
+
+def run(detector, frames):
+    detector.detect(frames[0])  # Warm-up
+    start = time.perf_counter()
+    results = [detector.detect(frame) for frame in frames]
+    return results, time.perf_counter() - start
+
+
+def matched_boxes(reference, candidate, min_iou):
+    if len(reference) == 0 or len(candidate) == 0:
+        return 0, []
+    iou = box_iou(reference.boxes, candidate.boxes)
+    iou[reference.class_ids[:, None] != candidate.class_ids[None, :]] = 0
+    best = iou.max(axis=1)
+    hits = best[best >= min_iou]
+    return len(hits), list(hits)
+
+
+def main():
+    args = parse_args()
+    resize = Detector(args.model, preprocess="resize")
+    letterbox = Detector(args.model, preprocess="letterbox")
+
+    rows = []
+    for video in args.videos:
+        frames = read_frames(video, args.frames)
+        if not frames:
+            continue
+        reference, resize_time = run(resize, frames)
+        candidate, letterbox_time = run(letterbox, frames)
+
+        decisions = np.mean([r.detection == c.detection for r, c in zip(reference, candidate)])
+        total = sum(len(r) for r in reference)
+        matches = [matched_boxes(r, c, args.match_iou) for r, c in zip(reference, candidate)]
+        found = sum(count for count, _ in matches)
+        ious = [iou for _, hits in matches for iou in hits]
+
+        rows.append({
+            'video': video.name,
+            'resize_fps': len(frames) / resize_time,
+            'letterbox_fps': len(frames) / letterbox_time,
+            'speedup': resize_time / letterbox_time,
+            'decision_agree_%': 100 * decisions,
+            'box_recall_%': 100 * found / total if total else 100.0,
+            'mean_iou': float(np.mean(ious)) if ious else float('nan'),
+        })
+
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Measure the wall-clock speedup of segment-parallel processing of one video.
+
+Usage:
+  python -m scripts.benchmark_segments data/gara.mp4 --frames 300 --segments 2 4
+
+The sequential baseline is the same video as a single segment, so both sides
+include worker start-up (one model load per worker) and stitching. The
+timelines of all runs are compared, since detections near the cuts may only
+differ when tracking.
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.config import Config
+from src.inference_backends import BACKENDS
+from src.segment_runner import SegmentRunner
+from scripts.bench_common import SAMPLE_VIDEOS, format_table
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('video', type=Path, nargs='?', default=SAMPLE_VIDEOS[-1], help='Input video')
+    p.add_argument('--frames', type=int, default=300, help='Frames processed (0 = all)')
+    p.add_argument('--segments', type=int, nargs='+',
+                   default=sorted({2, os.cpu_count() or 1} - {1}) or [2],
+                   help='Segment counts to try')
+    p.add_argument('--overlap', type=int, default=15, help='Warm-up frames before each cut')
+    p.add_argument('--threads-per-worker', type=int, default=1,
+                   help='Inference threads per worker process')
+    p.add_argument('--track', action='store_true', help='Track between keyframes')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    return p.parse_args()
+
+
+def run(args, segments: int, tmp: Path):
+    runner = SegmentRunner(args.model, segments, overlap=args.overlap,
+                           threads_per_worker=args.threads_per_worker, track=args.track,
+                           backend=args.backend)
+    start = time.perf_counter()
+    report = runner.run(args.video, tmp / f'segments_{segments}', args.frames)
+    written = runner.stitch(report, tmp / f'out_{segments}.mp4')
+    return time.perf_counter() - start, written, report
+
+
+def main():
+    args = parse_args()
+    print(f'{args.video.name}, {args.frames or "all"} frames, {os.cpu_count()} CPU cores')
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline, frames, base_report = run(args, 1, Path(tmp))
+        rows = [{'segments': 1, 'frames': frames, 'wall_s': baseline, 'fps': frames / baseline,
+                 'speedup': 1.0, 'same_timeline': 'yes'}]
+        for segments in args.segments:
+            elapsed, written, report = run(args, segments, Path(tmp))
+            rows.append({'segments': segments, 'frames': written, 'wall_s': elapsed,
+                         'fps': written / elapsed, 'speedup': baseline / elapsed,
+                         'same_timeline': 'yes' if report.timeline == base_report.timeline
+                         else 'no'})
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
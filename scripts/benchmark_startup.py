@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Measure startup cost: package import, model load and first-frame latency.
+
+Usage:
+  python -m scripts.benchmark_startup --repeats 3 --backends ultralytics onnxruntime
+
+Each measurement runs in a fresh interpreter so imports are cold. The first
+frame is timed with and without Detector.warmup() beforehand; "steady" is the
+latency of a later frame for reference.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from src.config import Config
+from scripts.bench_common import SAMPLE_VIDEOS, format_table
+
+
+# Runs in a fresh interpreter, so nothing from src is imported before timing starts
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import src
+from src.config import Config
+package = time.perf_counter()
+from src.fire_detector import Detector
+imported = time.perf_counter()
+
+import cv2
+cap = cv2.VideoCapture(sys.argv[1])
+frames = [cap.read()[1] for _ in range(2)]
+cap.release()
+
+detector = Detector(sys.argv[2], backend=sys.argv[3])
+loaded = time.perf_counter()
+warmup = detector.warmup(frames[0].shape) if sys.argv[4] == '1' else 0.0
+
+first_start = time.perf_counter()
+detector.process_frame(frames[0])
+first = time.perf_counter() - first_start
+steady_start = time.perf_counter()
+detector.process_frame(frames[1])
+steady = time.perf_counter() - steady_start
+
+print(json.dumps({
+    'import_package': package - start,
+    'import_detector': imported - package,
+    'model_load': loaded - imported,
+    'warmup': warmup,
+    'first_frame': first,
+    'steady_frame': steady,
+}))
+"""
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--video', type=Path, default=SAMPLE_VIDEOS[-1], help='Video providing the first frame')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backends', nargs='+', default=['ultralytics', 'onnxruntime'],
+                   help='Inference backends to measure')
+    p.add_argument('--repeats', type=int, default=3, help='Fresh processes per configuration')
+    return p.parse_args()
+
+
+def run_child(args, backend: str, warmup: bool) -> dict:
+    cmd = [sys.executable, '-c', CHILD, str(args.video), str(args.model), backend,
+           '1' if warmup else '0']
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True,
+                         cwd=Config.PROJECT_ROOT).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    args = parse_args()
+    rows = []
+    for backend in args.backends:
+        for warmup in (False, True):
+            runs = [run_child(args, backend, warmup) for _ in range(args.repeats)]
+            row = {'backend': backend, 'warmup': 'yes' if warmup else 'no'}
+            for key in runs[0]:
+                row[f'{key}_ms'] = statistics.median(run[key] for run in runs) * 1000
+            rows.append(row)
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
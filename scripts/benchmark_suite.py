@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks of the per-frame components, with a regression check against a baseline.
+
+Usage:
+  python -m scripts.benchmark_suite --out benchmarks/current.json
+  python -m scripts.benchmark_suite --compare benchmarks/baseline.json --threshold 15
+  python -m scripts.benchmark_suite --current benchmarks/current.json \\
+      --compare benchmarks/baseline.json
+
+Every stage runs on the bundled data/ assets and reports mean, p50, p95 and
+p99 in milliseconds. With --compare, the run (or the --current file) is
+checked against a saved result and the script exits with status 1 when a
+stage's --metric got slower by more than --threshold percent, or when a stage
+of either result is missing (or skipped) in the other. Baselines are only
+comparable on the same machine and settings.
+"""
+import argparse
+import json
+import logging
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from src.config import Config
+from src.fire_detector import Detector
+from src.inference_backends import BACKENDS
+from scripts.bench_common import format_table
+
+STAGES = ['resize_frame', 'inference', 'draw_detection', 'add_frame_info', 'save_frame',
+          'jpeg_encode', 'label_parsing']
+METRICS = ['mean_ms', 'p50_ms', 'p95_ms', 'p99_ms']
+# Statuses of compare() that fail the check, with how they are reported
+FAILURES = {
+    'REGRESSION': 'slower than the baseline by more than {threshold:.0f}%',
+    'MISSING': 'in the baseline but not measured now',
+    'NO BASELINE': 'measured now but not in the baseline',
+}
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='Stages to run')
+    p.add_argument('--runs', type=int, default=200, help='Timed calls per stage')
+    p.add_argument('--inference-runs', type=int, default=50,
+                   help='Timed calls for the (slow) inference stage')
+    p.add_argument('--warmup', type=int, default=5, help='Untimed calls before each stage')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    p.add_argument('--out', type=Path, default=None, help='Write the results to this JSON file')
+    p.add_argument('--current', type=Path, default=None,
+                   help='Compare this saved result instead of running the benchmarks')
+    p.add_argument('--compare', type=Path, default=None, help='Baseline JSON to compare against')
+    p.add_argument('--threshold', type=float, default=10.0,
+                   help='Allowed slowdown in percent before a stage counts as a regression')
+    p.add_argument('--metric', choices=METRICS, default='p50_ms',
+                   help='Statistic compared against the baseline')
+    return p.parse_args()
+
+
+def summarize(times: List[float]) -> Dict[str, float]:
+    """Summary statistics in milliseconds of per-call times in seconds."""
+    ms = np.asarray(times) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {'runs': len(ms), 'mean_ms': float(ms.mean()), 'p50_ms': float(p50),
+            'p95_ms': float(p95), 'p99_ms': float(p99), 'min_ms': float(ms.min())}
+
+
+def measure(fn: Callable[[int], object], runs: int, warmup: int,
+            reset: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """Time runs calls of fn(i); reset, if given, runs untimed before each call."""
+    times = []
+    for i in range(warmup + runs):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        fn(i)
+        if i >= warmup:
+            times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def load_images() -> List[np.ndarray]:
+    """Still images and one frame of each video from data/."""
+    data = Config.PROJECT_ROOT / 'data'
+    images = [cv2.imread(str(path)) for path in sorted(data.glob('*.png'))]
+    for video in sorted(data.glob('*.mp4')):
+        cap = cv2.VideoCapture(str(video))
+        ret, frame = cap.read()
+        cap.release()
+        if ret:
+            images.append(frame)
+    return [image for image in images if image is not None and image.ndim == 3]
+
+
+def run_suite(args, tmp: Path) -> Dict[str, dict]:
+    images = load_images()
+    if not images:
+        raise SystemExit('No images found in data/')
+    detector = Detector(args.model, backend=args.backend)
+    canvas = detector.resize_frame(images[0])
+    height, width = canvas.shape[:2]
+    box = np.array([width * 0.3, height * 0.3, width * 0.6, height * 0.7]).astype(int)
+
+    def save_frame():
+        from src.notification_service import NotificationService
+        # Unbound calls on a stand-in: the real constructor connects to the alert services
+        service = SimpleNamespace(config=SimpleNamespace(DETECTED_FIRES_DIR=tmp))
+        return (lambda i: NotificationService.save_frame(service, canvas)), None
+
+    def label_parsing():
+        try:
+            from tests import TEST_DATA_DIR
+            from tests.clean_labels import YOLODatasetPreprocessor
+        except SyntaxError as e:  # Uses f-string syntax from Python 3.12
+            return None, (f'tests/clean_labels.py does not compile on Python '
+                          f'{platform.python_version()}: {e.msg}')
+        labels = tmp / 'labels'
+
+        def reset():
+            # process_labels rewrites the files, so every run starts from the originals
+            shutil.rmtree(labels, ignore_errors=True)
+            shutil.copytree(TEST_DATA_DIR / 'train', labels / 'train')
+        preprocessor = YOLODatasetPreprocessor(str(labels))
+        preprocessor.logger.setLevel(logging.ERROR)
+        return (lambda i: preprocessor.process_labels()), reset
+
+    stages = {
+        'resize_frame': lambda: (lambda i: detector.resize_frame(images[i % len(images)]), None),
+        'inference': lambda: (lambda i: detector.detect(images[i % len(images)]), None),
+        'draw_detection': lambda: (lambda i: detector.draw_detection(canvas, box, 'fire', 0.87),
+                                   None),
+        'add_frame_info': lambda: (lambda i: detector._add_frame_info(canvas, 'Fire'), None),
+        'save_frame': save_frame,
+        'jpeg_encode': lambda: (lambda i: cv2.imencode('.jpg', images[i % len(images)]), None),
+        'label_parsing': label_parsing,
+    }
+
+    results = {}
+    for name in args.stages:
+        fn, reset = stages[name]()
+        if fn is None:
+            results[name] = {'skipped': reset}
+            print(f'{name}: skipped ({reset})')
+            continue
+        runs = args.inference_runs if name == 'inference' else args.runs
+        results[name] = measure(fn, runs, args.warmup, reset)
+        print(f'{name}: p50 {results[name]["p50_ms"]:.3f} ms')
+    return results
+
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], metric: str,
+            threshold: float) -> List[Dict[str, object]]:
+    """
+    One row per stage of either result, flagging regressions.
+
+    A stage measured in the baseline but absent or skipped in the current
+    results is MISSING, and one measured now but not in the baseline has NO
+    BASELINE; both fail the check like a REGRESSION, so a dropped, renamed
+    or skipped stage cannot pass it. Stages skipped in both are only listed.
+    """
+    rows = []
+    for name in list(baseline) + [name for name in current if name not in baseline]:
+        now, before = current.get(name, {}).get(metric), baseline.get(name, {}).get(metric)
+        change = None
+        if now is None and before is None:
+            status = 'skipped'
+        elif now is None:
+            status = 'MISSING'
+        elif before is None:
+            status = 'NO BASELINE'
+        else:
+            change = (now / before - 1) * 100 if before else 0.0
+            status = 'REGRESSION' if change > threshold else 'ok'
+        rows.append({'stage': name, f'baseline_{metric}': '-' if before is None else before,
+                     f'current_{metric}': '-' if now is None else now,
+                     'change_%': '-' if change is None else change, 'status': status})
+    return rows
+
+
+def main():
+    args = parse_args()
+    if args.current is not None:
+        report = json.loads(args.current.read_text())
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            stages = run_suite(args, Path(tmp))
+        report = {
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'opencv': cv2.__version__,
+                'model': str(args.model),
+                'backend': args.backend,
+            },
+            'stages': stages,
+        }
+        print(format_table([{'stage': name, **stats}
+                            for name, stats in stages.items() if 'skipped' not in stats]))
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2))
+        print(f'Results written to {args.out}')
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        rows = compare(report['stages'], baseline['stages'], args.metric, args.threshold)
+        print(format_table(rows))
+        failed = False
+        for status, problem in FAILURES.items():
+            stages = [row['stage'] for row in rows if row['status'] == status]
+            if stages:
+                print(f'{len(stages)} stage(s) {problem.format(threshold=args.threshold)}: '
+                      f'{", ".join(stages)}')
+                failed = True
+        if failed:
+            sys.exit(1)
+        print(f'No stage regressed by more than {args.threshold:.0f}% ({args.metric})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Latency cost of tiled inference per tile count.
+
+Sample frames are upscaled to the camera resolution (4K by default) and run
+through Detector with and without tiling for several tile sizes.
+
+Usage:
+  python -m scripts.benchmark_tiling --resolution 3840x2160 --tile-sizes 1280 960 640
+"""
+import argparse
+from pathlib import Path
+
+import cv2
+
+from src.config import Config
+from src.fire_detector import Detector
+from src.tiling import TilingConfig, make_tiles
+from scripts.bench_common import SAMPLE_VIDEOS, format_table, read_frames, time_call
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--video', type=Path, default=SAMPLE_VIDEOS[-1], help='Source of sample frames')
+    p.add_argument('--frames', type=int, default=5, help='Frames timed per configuration')
+    p.add_argument('--resolution', default='3840x2160', help='Camera resolution WIDTHxHEIGHT')
+    p.add_argument('--tile-sizes', type=int, nargs='+', default=[1280, 960, 640])
+    p.add_argument('--overlap', type=float, default=0.2)
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    width, height = map(int, args.resolution.lower().split('x'))
+    frames = [cv2.resize(frame, (width, height))
+              for frame in read_frames(args.video, args.frames, stride=10)]
+
+    configs = [('full frame', None)]
+    for size in args.tile_sizes:
+        configs.append((f'tiles {size}', TilingConfig(tile_size=size, overlap=args.overlap)))
+        configs.append((f'tiles {size} + full', TilingConfig(
+            tile_size=size, overlap=args.overlap, include_full_frame=True)))
+
+    rows = []
+    baseline = None
+    for name, tiling in configs:
+        detector = Detector(args.model, tiling=tiling)
+        detector.detect(frames[0])  # Warm-up
+        elapsed = time_call(lambda: [detector.detect(frame) for frame in frames]) / len(frames)
+        tiles = 1 if tiling is None else \
+            len(make_tiles(frames[0].shape, tiling.tile_size, tiling.overlap)) + tiling.include_full_frame
+        baseline = baseline or elapsed
+        rows.append({'mode': name, 'tiles': tiles, 'ms_per_frame': elapsed * 1000,
+                     'ms_per_tile': elapsed * 1000 / tiles, 'x_full_frame': elapsed / baseline})
+
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
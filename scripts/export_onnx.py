@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Export YOLO weights to ONNX for the onnxruntime inference backend.
+
+Usage:
+  python -m scripts.export_onnx models/best_nano_111.pt
+
+The .onnx file is written next to the weights with a dynamic input shape, so
+the backend can feed stride-aligned rectangular inputs and batches.
+"""
+import argparse
+from pathlib import Path
+
+from src.config import Config
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('model', type=Path, nargs='?', default=Config.MODEL_PATH, help='Path to .pt weights')
+    p.add_argument('--imgsz', type=int, default=640, help='Nominal input size stored in the model')
+    p.add_argument('--static', action='store_true',
+                   help='Export a fixed imgsz x imgsz input instead of a dynamic shape')
+    p.add_argument('--simplify', action='store_true', help='Run the ONNX graph simplifier')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    from ultralytics import YOLO
+
+    path = YOLO(str(args.model)).export(format='onnx', imgsz=args.imgsz,
+                                        dynamic=not args.static, simplify=args.simplify)
+    print(f'Exported {args.model} -> {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Build a statically quantized INT8 ONNX model and report how it compares with FP32.
+
+Usage:
+  python -m scripts.quantize_int8 --model models/best_nano_111.pt --frames-per-video 40
+
+Calibration frames are sampled evenly from data/*.mp4 plus data/*.png and go
+through the same preprocessing Detector uses at runtime. Every other sampled
+frame is held out to measure latency, model size and detection agreement
+between the FP32 and INT8 models. The INT8 model is written next to the FP32
+one (best_nano_111.int8.onnx) and loads with Detector like any .onnx file.
+"""
+import argparse
+import json
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from src.config import Config
+from src.detections import box_iou
+from src.fire_detector import Detector
+from scripts.bench_common import format_table, read_frames
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH,
+                   help='FP32 weights; the .onnx next to them is quantized')
+    p.add_argument('--out', type=Path, default=None,
+                   help='Output path (default: <model>.int8.onnx)')
+    p.add_argument('--data', type=Path, default=Config.PROJECT_ROOT / 'data',
+                   help='Directory with sample .mp4 and .png files')
+    p.add_argument('--frames-per-video', type=int, default=40, help='Frames sampled per video')
+    p.add_argument('--preprocess', choices=['resize', 'letterbox'], default='resize',
+                   help='Detector preprocessing used for calibration and evaluation')
+    p.add_argument('--method', choices=['minmax', 'percentile', 'entropy'], default='minmax',
+                   help='Calibration method')
+    p.add_argument('--exclude-head', choices=['decode', 'all', 'none'], default='decode',
+                   help='Keep the detection head in FP32: only its box/score decoding '
+                        '(default), the whole head, or nothing')
+    p.add_argument('--per-channel', action=argparse.BooleanOptionalAction, default=True,
+                   help='Per-channel weight quantization')
+    p.add_argument('--conf', type=float, default=0.25,
+                   help='Confidence threshold used to compare detections')
+    p.add_argument('--report', type=Path, default=None,
+                   help='JSON report path (default: next to the output model)')
+    return p.parse_args()
+
+
+def sample_frames(data_dir: Path, frames_per_video: int) -> List[np.ndarray]:
+    """Frames spread evenly over each video, followed by the still images."""
+    frames = []
+    for video in sorted(data_dir.glob('*.mp4')):
+        cap = cv2.VideoCapture(str(video))
+        total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+        stride = max(1, total // max(1, frames_per_video))
+        frames += read_frames(video, frames_per_video, stride)
+    for image in sorted(data_dir.glob('*.png')):
+        frame = cv2.imread(str(image))
+        if frame is not None:
+            frames.append(frame)
+    return frames
+
+
+def model_inputs(detector: Detector, frames: List[np.ndarray]) -> List[np.ndarray]:
+    """Model input tensors for frames, built exactly as Detector.detect builds them."""
+    blobs = []
+    for frame in frames:
+        images, _ = detector._prepare([frame])
+        blob, _ = detector.backend.preprocess(images, detector.target_height)
+        blobs.append(blob.copy())
+    return blobs
+
+
+def excluded_nodes(model_path: Path, mode: str) -> List[str]:
+    """Names of detection-head nodes to keep in FP32."""
+    if mode == 'none':
+        return []
+    import onnx
+
+    graph = onnx.load(str(model_path)).graph
+    # ultralytics names nodes /model.<layer>/...; the head is the last layer
+    layers = [int(m.group(1)) for node in graph.node
+              for m in [re.match(r'/model\.(\d+)/', node.name)] if m]
+    if not layers:
+        return []
+    prefix = f'/model.{max(layers)}/'
+    return [node.name for node in graph.node if node.name.startswith(prefix)
+            and (mode == 'all' or node.op_type != 'Conv')]
+
+
+def quantize(fp32_path: Path, out_path: Path, blobs: List[np.ndarray], input_name: str,
+             args) -> None:
+    from onnxruntime.quantization import (CalibrationDataReader, CalibrationMethod,
+                                          QuantFormat, QuantType, quantize_static)
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    class Reader(CalibrationDataReader):
+        def __init__(self):
+            self._blobs = iter(blobs)
+
+        def get_next(self):
+            blob = next(self._blobs, None)
+            return None if blob is None else {input_name: blob}
+
+    methods = {'minmax': CalibrationMethod.MinMax, 'percentile': CalibrationMethod.Percentile,
+               'entropy': CalibrationMethod.Entropy}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Shape inference and graph cleanup recommended before static quantization.
+        # Symbolic shape inference does not handle the dynamic YOLO export, so
+        # only ONNX shape inference and the ONNX Runtime graph optimizer run.
+        prepared = Path(tmp) / 'prepared.onnx'
+        try:
+            quant_pre_process(str(fp32_path), str(prepared), skip_symbolic_shape=True)
+        except Exception as e:
+            print(f'Pre-processing skipped ({e}); quantizing the model as exported')
+            prepared = fp32_path
+
+        quantize_static(
+            str(prepared), str(out_path), Reader(),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=args.per_channel,
+            calibrate_method=methods[args.method],
+            nodes_to_exclude=excluded_nodes(prepared, args.exclude_head),
+        )
+
+
+def latency_ms(detector: Detector, blobs: List[np.ndarray]) -> Dict[str, float]:
+    """Median and p95 model latency over single-frame inputs."""
+    session, name = detector.backend.session, detector.backend.input_name
+    session.run(None, {name: blobs[0]})  # Warm-up
+    times = []
+    for blob in blobs:
+        start = time.perf_counter()
+        session.run(None, {name: blob})
+        times.append((time.perf_counter() - start) * 1000)
+    return {'p50': float(np.percentile(times, 50)), 'p95': float(np.percentile(times, 95))}
+
+
+def agreement(reference: Detector, candidate: Detector, frames: List[np.ndarray],
+              blobs: List[np.ndarray]) -> Dict[str, float]:
+    """How closely candidate reproduces reference's detections and raw class scores."""
+    matched = expected_total = actual_total = decisions = 0
+    for frame in frames:
+        expected, actual = reference.detect(frame), candidate.detect(frame)
+        expected_total += len(expected)
+        actual_total += len(actual)
+        decisions += expected.detection == actual.detection
+        if len(expected) and len(actual):
+            iou = box_iou(expected.boxes, actual.boxes)
+            iou[expected.class_ids[:, None] != actual.class_ids[None, :]] = 0
+            # Greedy one-to-one matching at IoU >= 0.5
+            for e in np.argsort(-expected.confidences):
+                a = int(iou[e].argmax())
+                if iou[e, a] >= 0.5:
+                    matched += 1
+                    iou[:, a] = 0
+
+    score_errors = []
+    for blob in blobs:
+        ref = reference.backend.session.run(None, {reference.backend.input_name: blob})[0]
+        out = candidate.backend.session.run(None, {candidate.backend.input_name: blob})[0]
+        score_errors.append(np.abs(ref[:, 4:] - out[:, 4:]).mean())
+
+    precision = matched / actual_total if actual_total else 1.0
+    recall = matched / expected_total if expected_total else 1.0
+    return {
+        'fp32_boxes': expected_total,
+        'int8_boxes': actual_total,
+        'precision': precision,
+        'recall': recall,
+        'f1': 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+        'decision_agreement': decisions / len(frames) if frames else 1.0,
+        'score_mae': float(np.mean(score_errors)) if score_errors else 0.0,
+    }
+
+
+def main():
+    args = parse_args()
+    fp32_path = args.model.with_suffix('.onnx')
+    if not fp32_path.exists():
+        raise SystemExit(f'{fp32_path} not found; run: python -m scripts.export_onnx {args.model}')
+    out_path = args.out or fp32_path.with_name(f'{fp32_path.stem}.int8.onnx')
+    report_path = args.report or out_path.with_suffix('.json')
+
+    reference = Detector(fp32_path, min_confidence=args.conf, preprocess=args.preprocess)
+    frames = sample_frames(args.data, args.frames_per_video)
+    if len(frames) < 2:
+        raise SystemExit(f'Not enough sample frames in {args.data}')
+    calibration, holdout = frames[0::2], frames[1::2]
+    print(f'Calibrating on {len(calibration)} frames, evaluating on {len(holdout)}')
+
+    start = time.perf_counter()
+    quantize(fp32_path, out_path, model_inputs(reference, calibration),
+             reference.backend.input_name, args)
+    print(f'Quantized in {time.perf_counter() - start:.1f}s -> {out_path}')
+
+    candidate = Detector(out_path, min_confidence=args.conf, preprocess=args.preprocess)
+    blobs = model_inputs(reference, holdout)
+    fp32_latency, int8_latency = latency_ms(reference, blobs), latency_ms(candidate, blobs)
+    report = {
+        'fp32_model': str(fp32_path),
+        'int8_model': str(out_path),
+        'calibration_frames': len(calibration),
+        'holdout_frames': len(holdout),
+        'settings': {'method': args.method, 'exclude_head': args.exclude_head,
+                     'per_channel': args.per_channel, 'preprocess': args.preprocess,
+                     'conf': args.conf},
+        'size_mb': {'fp32': fp32_path.stat().st_size / 1e6, 'int8': out_path.stat().st_size / 1e6},
+        'latency_ms': {'fp32': fp32_latency, 'int8': int8_latency},
+        'agreement': agreement(reference, candidate, holdout, blobs),
+    }
+    report_path.write_text(json.dumps(report, indent=2))
+
+    print(format_table([
+        {'model': name, 'size_mb': report['size_mb'][name],
+         'p50_ms': report['latency_ms'][name]['p50'], 'p95_ms': report['latency_ms'][name]['p95'],
+         'speedup': fp32_latency['p50'] / report['latency_ms'][name]['p50']}
+        for name in ('fp32', 'int8')
+    ]))
+    print(format_table([report['agreement']]))
+    print(f'Report written to {report_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Bulk runner: detection summaries for every video and image under the given paths.
+
+Usage:
+  python -m scripts.run_batch data/ --out detected_fires/batch.jsonl --workers 4
+  python -m scripts.run_batch 'archive/**/*.mp4' --stride 5 --out detected_fires/archive.jsonl
+
+Each worker process loads the model once and takes whole files. Finished
+files and their summaries are recorded in a manifest next to --out
+(--manifest), so running the same command again after an interruption only
+processes what is left. --out holds one JSON line per finished file; it is
+rebuilt from the manifest on every run, so a file processed again replaces
+its line. Throughput and the ETA are logged after every file.
+"""
+import argparse
+import logging
+import os
+from pathlib import Path
+
+from src.batch_runner import BatchRunner, discover_inputs
+from src.config import Config, setup_logging
+from src.inference_backends import BACKENDS
+
+
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument('inputs', nargs='+', help='Files, directories or glob patterns (quoted)')
+    p.add_argument('--out', type=Path, default=Path('detected_fires/batch.jsonl'),
+                   help='JSON Lines file of per-file summaries')
+    p.add_argument('--manifest', type=Path, default=None,
+                   help='Resumable manifest (default: --out with .manifest.json suffix)')
+    p.add_argument('--restart', action='store_true',
+                   help='Ignore the manifest and process every file again')
+    p.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                   help='Detector processes (0 = run in this process)')
+    p.add_argument('--threads-per-worker', type=int, default=1,
+                   help='Inference threads per worker (workers x threads should fit the cores)')
+    p.add_argument('--stride', type=int, default=1, help='Infer every Nth video frame')
+    p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    return p.parse_args()
+
+
+def main():
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    args = parse_args()
+
+    files = discover_inputs(args.inputs)
+    if not files:
+        logger.error(f"No videos or images found in: {', '.join(args.inputs)}")
+        raise SystemExit(1)
+    runner = BatchRunner(args.model, args.out, args.manifest, workers=args.workers,
+                         backend=args.backend, stride=args.stride,
+                         threads_per_worker=args.threads_per_worker)
+    if args.restart:
+        runner.manifest_path.unlink(missing_ok=True)
+    logger.info(f"Processing {len(files)} files with {args.workers} workers")
+
+    stats = runner.run(files)
+    logger.info(f"Done. {stats.done} files processed, {stats.failed} failed, "
+                f"{stats.skipped} already done; {stats.frames_inferred} frames inferred in "
+                f"{stats.seconds:.1f}s. Summaries in {args.out}")
+    if stats.failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
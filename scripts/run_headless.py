@@ -3,13 +3,38 @@
 
 Usage:
   python scripts/run_headless.py input.mp4 --out detected_fires/out.mp4 --max-frames 300
+  python scripts/run_headless.py archive.mp4 --scan --events-out detected_fires/archive.json
+
+Decoding, inference and encoding run as pipelined stages connected by bounded
+queues (see --queue-size); per-stage utilization is logged at the end.
+
+With --scan, no video is written: a coarse pass infers one frame per
+--scan-interval seconds, a fine pass infers every frame around the hits, and
+the events (first and last detection time) are written as JSON.
+
+With --segments N, the video is split into N time segments annotated by
+parallel worker processes (each with its own model) and stitched back in
+order; the detection timeline goes next to the output as JSON.
 """
 import argparse
+import json
+import shutil
 from pathlib import Path
+from typing import Optional
 import cv2
 import logging
 from src.config import Config, setup_logging
 from src.fire_detector import Detector
+from src.forensic_scan import ForensicScanner
+from src.frame_cache import FrameCache
+from src.inference_backends import BACKENDS
+from src.latency_governor import LatencyGovernor
+from src.metrics import metrics
+from src.motion_gate import MotionGate
+from src.segment_runner import SegmentRunner
+from src.tiling import TilingConfig
+from src.tracker import KeyframePolicy, KeyframeTracker
+from src.video_pipeline import FramePipeline
 
 
 def parse_args():
@@ -18,9 +43,92 @@ def parse_args():
     p.add_argument('--out', type=Path, default=Path('detected_fires/out.mp4'), help='Output video path')
     p.add_argument('--max-frames', type=int, default=0, help='Max frames to process (0 = all)')
     p.add_argument('--model', type=Path, default=Config.MODEL_PATH, help='Path to model file')
+    p.add_argument('--backend', choices=BACKENDS, default=Config.INFERENCE_BACKEND,
+                   help='Inference backend (onnxruntime uses the .onnx next to --model)')
+    p.add_argument('--queue-size', type=int, default=8,
+                   help='Frames buffered between pipeline stages (backpressure limit)')
+    p.add_argument('--motion-gate', action='store_true',
+                   help='Re-use the previous result on frames without motion')
+    p.add_argument('--gate-max-skip', type=int, default=30,
+                   help='With --motion-gate, force an inference after this many skipped frames')
+    p.add_argument('--tile-size', type=int, default=0,
+                   help='Run tiled inference on full-resolution tiles of this size (0 = off)')
+    p.add_argument('--tile-overlap', type=float, default=0.2, help='Overlap between tiles (0-1)')
+    p.add_argument('--tile-hybrid', action='store_true',
+                   help='With --tile-size, also run the whole resized frame')
+    p.add_argument('--track', action='store_true',
+                   help='Run the model on keyframes only and track boxes in between')
+    p.add_argument('--max-keyframe-interval', type=int, default=8,
+                   help='With --track, longest gap between keyframes while tracks are stable')
+    p.add_argument('--frame-cache', action='store_true',
+                   help='Re-use results for frozen or duplicated frames')
+    p.add_argument('--metrics-port', type=int, default=Config.METRICS_PORT,
+                   help='Serve stage timings at http://127.0.0.1:PORT/metrics (0 = off)')
+    p.add_argument('--target-fps', type=float, default=0,
+                   help='Lower resolution, tile count and inference rate at runtime to '
+                        'keep up with this frame rate (0 = fixed settings)')
+    p.add_argument('--cpu-budget', type=float, default=None,
+                   help='With --target-fps, also keep CPU use under this many cores')
+    p.add_argument('--scan', action='store_true',
+                   help='Search for detections instead of writing an annotated video')
+    p.add_argument('--scan-interval', type=float, default=1.0,
+                   help='With --scan, seconds of video between coarse samples')
+    p.add_argument('--events-out', type=Path, default=None,
+                   help='With --scan, JSON file for the events (default: --out with '
+                        '.events.json suffix)')
+    p.add_argument('--segments', type=int, default=1,
+                   help='Split the video into this many segments processed in parallel')
+    p.add_argument('--segment-overlap', type=int, default=15,
+                   help='With --segments, frames processed before each cut to warm up '
+                        'tracker state, but not written')
+    p.add_argument('--workers', type=int, default=None,
+                   help='With --segments, worker processes (default: one per segment)')
     return p.parse_args()
 
 
+class FrameProcessor:
+    def __init__(self, detector: Detector, gate: Optional[MotionGate] = None,
+                 tracker: Optional[KeyframeTracker] = None,
+                 governor: Optional[LatencyGovernor] = None):
+        """
+        Detect and annotate one frame, with the optional motion gate, tracker
+        and latency governor.
+
+        The governor's stride is applied whatever produces the detections:
+        on frames it skips, the last result (tracked or inferred) is drawn
+        again.
+        """
+        self.detector = detector
+        self.gate = gate
+        self.tracker = tracker
+        self.governor = governor
+        self.last_detections = None
+
+    def __call__(self, frame):
+        if self.governor is None:
+            return self._process(frame)
+        with self.governor.measure():
+            return self._process(frame)
+
+    def _process(self, frame):
+        detector = self.detector
+        # Asked on every frame, so the governor's frame count stays in step
+        skip = self.governor is not None and not self.governor.should_infer()
+        if skip and self.last_detections is not None:
+            detections = self.last_detections
+        elif self.tracker is not None:
+            detections = self.tracker.detect(frame)
+        elif self.gate is None and self.governor is None:
+            processed, detection = detector.process_frame(frame)
+            return processed
+        elif self.gate is None or self.gate.should_infer(frame) or self.last_detections is None:
+            detections = detector.detect(frame)
+        else:
+            detections = self.last_detections
+        self.last_detections = detections
+        return detector.annotate(detector.output_frame(frame), detections)
+
+
 def main():
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -35,9 +143,50 @@ def main():
         raise SystemExit(1)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.metrics_port:
+        metrics.serve(args.metrics_port, Config.METRICS_HOST)
 
     # Initialize detector
-    detector = Detector(args.model)
+    tiling = TilingConfig(tile_size=args.tile_size, overlap=args.tile_overlap,
+                          include_full_frame=args.tile_hybrid) if args.tile_size else None
+    tmp_out = out_path.with_suffix('.tmp.mp4')
+
+    if args.segments > 1:
+        if args.motion_gate or args.target_fps or args.frame_cache:
+            logger.warning("--motion-gate, --target-fps and --frame-cache are ignored "
+                           "with --segments")
+        runner = SegmentRunner(args.model, args.segments, workers=args.workers,
+                               overlap=args.segment_overlap, track=args.track,
+                               max_keyframe_interval=args.max_keyframe_interval,
+                               backend=args.backend, tiling=tiling)
+        try:
+            report = runner.run(in_path, out_path.parent / f'{out_path.stem}.segments',
+                                max_frames)
+        except IOError as e:
+            logger.error(str(e))
+            raise SystemExit(1)
+        report.log(logger)
+        frame_count = runner.stitch(report, tmp_out)
+        shutil.rmtree(out_path.parent / f'{out_path.stem}.segments', ignore_errors=True)
+        # The segments' own processing time approximates one sequential pass;
+        # python -m scripts.benchmark_segments measures the real one
+        logger.info(f"Estimated speedup over a sequential pass: "
+                    f"{report.work_seconds / report.seconds:.2f}x")
+        timeline_out = out_path.with_suffix('.timeline.json')
+        timeline_out.write_text(json.dumps({
+            'input': str(in_path), 'fps': report.fps, 'frames': report.frames,
+            'events': [event.to_dict() for event in report.events],
+            'detections': [{'frame': index, 'time': index / report.fps, 'detection': label,
+                            'confidence': confidence}
+                           for index, (label, confidence) in sorted(report.timeline.items())],
+        }, indent=2))
+        logger.info(f"Detection timeline saved to: {timeline_out}")
+        finish_output(tmp_out, out_path, logger)
+        logger.info(f"Done. Processed {frame_count} frames. Output saved to: {out_path}")
+        return
+
+    frame_cache = FrameCache() if args.frame_cache else None
+    detector = Detector(args.model, tiling=tiling, backend=args.backend, frame_cache=frame_cache)
 
     cap = cv2.VideoCapture(str(in_path))
     if not cap.isOpened():
@@ -45,47 +194,72 @@ def main():
         raise SystemExit(1)
 
     fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+    detector.warmup((int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))))
 
-    writer = None
-    frame_count = 0
+    if args.scan:
+        try:
+            report = ForensicScanner(detector, interval=args.scan_interval).scan(cap, max_frames)
+        finally:
+            cap.release()
+        report.log(logger)
+        events_out = args.events_out or out_path.with_suffix('.events.json')
+        events_out.parent.mkdir(parents=True, exist_ok=True)
+        events_out.write_text(json.dumps({'input': str(in_path), **report.to_dict()}, indent=2))
+        logger.info(f"Done. Found {len(report.events)} events. Saved to: {events_out}")
+        return
 
-    # We'll write to a temporary container first, then re-encode to H.264 for
-    # maximum compatibility using ffmpeg (if available).
-    tmp_out = out_path.with_suffix('.tmp.mp4')
-
-    try:
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            processed, detection = detector.process_frame(frame)
-
-            # initialize writer using processed frame dimensions
-            if writer is None:
-                h, w = processed.shape[:2]
-                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                writer = cv2.VideoWriter(str(tmp_out), fourcc, fps, (w, h))
-                if not writer.isOpened():
-                    logger.error(f"Failed to open video writer for {tmp_out}")
-                    raise SystemExit(1)
-
-            writer.write(processed)
+    writer = None
 
-            frame_count += 1
-            if max_frames and frame_count >= max_frames:
-                break
+    gate = MotionGate(max_skip_frames=args.gate_max_skip) if args.motion_gate else None
+    tracker = KeyframeTracker(detector, policy=KeyframePolicy(
+        max_interval=args.max_keyframe_interval)) if args.track else None
+    governor = LatencyGovernor(detector, args.target_fps, args.cpu_budget,
+                               name=in_path.name) if args.target_fps else None
+    process = FrameProcessor(detector, gate, tracker, governor)
 
-            if frame_count % 50 == 0:
-                logger.info(f"Processed {frame_count} frames")
+    def write(processed):
+        nonlocal writer
+        # initialize writer using processed frame dimensions
+        if writer is None:
+            h, w = processed.shape[:2]
+            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+            writer = cv2.VideoWriter(str(tmp_out), fourcc, fps, (w, h))
+            if not writer.isOpened():
+                raise IOError(f"Failed to open video writer for {tmp_out}")
+        writer.write(processed)
 
+    try:
+        report = FramePipeline(process, write, queue_size=args.queue_size).run(cap, max_frames)
+        frame_count = report.frames
+        report.log(logger)
+        if gate is not None:
+            logger.info(f"Motion gate skipped {gate.stats.skipped}/{gate.stats.frames} frames "
+                        f"(hit rate {gate.stats.hit_rate:.1%}, {gate.stats.forced} forced)")
+        if tracker is not None:
+            logger.info(f"Tracker ran the model on {tracker.keyframes}/{tracker.frames} frames")
+        if frame_cache is not None:
+            logger.info(f"Frame cache answered {frame_cache.stats.hits}/"
+                        f"{frame_cache.stats.hits + frame_cache.stats.misses} frames "
+                        f"({frame_cache.stats.expired} expired, {frame_cache.stats.evicted} evicted)")
+        if governor is not None:
+            logger.info(f"Governor made {governor.changes} changes; final settings: "
+                        f"{governor.settings.describe()}")
+    except IOError as e:
+        logger.error(str(e))
+        raise SystemExit(1)
     finally:
         cap.release()
         if writer:
             writer.release()
 
-    # If ffmpeg is available, re-encode tmp_out to H.264 into the requested out_path
-    import shutil
+    finish_output(tmp_out, out_path, logger)
+    logger.info(f"Done. Processed {frame_count} frames. Output saved to: {out_path}")
+
+
+def finish_output(tmp_out: Path, out_path: Path, logger: logging.Logger) -> None:
+    """Re-encode the mp4v temporary file to H.264 at out_path, or move it there."""
+    # We write to a temporary container first, then re-encode to H.264 for
+    # maximum compatibility using ffmpeg (if available).
     from subprocess import run
 
     if tmp_out.exists():
@@ -115,8 +289,6 @@ def main():
             except Exception:
                 logger.error('Failed to rename temporary output file')
 
-    logger.info(f"Done. Processed {frame_count} frames. Output saved to: {out_path}")
-
 
 if __name__ == '__main__':
     main()
@@ -6,20 +6,28 @@ from pathlib import Path
 
 from src.config import Config, setup_logging
 from src.fire_detector import Detector
+from src.frame_grabber import FrameGrabber
+from src.metrics import metrics
 from src.notification_service import NotificationService
+from src.tracing import tracer
 
 
 def run_webcam(max_frames: int = None, conf: float = 0.5):
     setup_logging()
     logger = logging.getLogger(__name__)
     logger.info("Starting webcam demo")
+    if Config.METRICS_PORT:
+        metrics.serve(Config.METRICS_PORT, Config.METRICS_HOST)
+    tracer.export_path = Path(Config.TRACE_FILE) if Config.TRACE_FILE else None
 
     notification_service = NotificationService(Config)
-    detector = Detector(Config.MODEL_PATH, iou_threshold=0.20, min_confidence=conf)
+    detector = Detector(Config.MODEL_PATH, iou_threshold=0.20, min_confidence=conf,
+                        backend=Config.INFERENCE_BACKEND)
 
     # Try to open default webcam
     cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
+    live = cap.isOpened()
+    if not live:
         logger.warning("Webcam /dev/video0 not available, falling back to sample video")
         cap = cv2.VideoCapture(str(Config.VIDEO_SOURCE))
         if not cap.isOpened():
@@ -30,34 +38,48 @@ def run_webcam(max_frames: int = None, conf: float = 0.5):
     else:
         logger.info("Opened webcam /dev/video0")
 
+    detector.warmup((int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))))
+    # Decode in the background and always process the newest frame, so a slow
+    # model skips frames instead of falling behind the camera. The fallback
+    # video is paced at its FPS to behave the same way
+    grabber = FrameGrabber(cap, realtime=not live, name="webcam").start()
+
     last_alert_time = 0
     alert_cooldown = Config.ALERT_COOLDOWN
 
     frame_count = 0
     try:
         while True:
-            ret, frame = cap.read()
+            ret, frame = grabber.read()
             if not ret:
                 logger.info("Video input ended")
                 break
+            trace = tracer.start("webcam", grabber.last_capture_time)
 
-            processed_frame, detection = detector.process_frame(frame)
+            processed_frame, detection = detector.process_frame(frame, trace=trace)
+            metrics.inc("frames_processed_total")
+            metrics.set("frames_dropped_total", grabber.stats.frames_dropped, kind="counter")
+            metrics.set("frame_age_seconds", grabber.stats.last_age)
 
             # Alert logic (non-blocking)
             if detection:
                 current_time = time.time()
                 if (current_time - last_alert_time) > alert_cooldown:
                     logger.warning(f"{detection} detected — sending alert")
+                    trace.alert(current_time)
                     # send alert asynchronously if desired
                     try:
-                        notification_service.send_alert(processed_frame, detection)
+                        with metrics.timer("alert_dispatch"):
+                            notification_service.send_alert(processed_frame, detection, trace)
                     except Exception as e:
                         logger.error(f"Failed to send alert: {e}")
                     last_alert_time = current_time
 
             # Show frame
-            cv2.imshow("Fire Detection (Press q to quit)", processed_frame)
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            with metrics.timer("display"):
+                cv2.imshow("Fire Detection (Press q to quit)", processed_frame)
+                key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
                 logger.info("User requested exit")
                 break
 
@@ -69,8 +91,16 @@ def run_webcam(max_frames: int = None, conf: float = 0.5):
     except Exception as e:
         logger.critical(f"Runtime error in webcam demo: {e}")
     finally:
-        cap.release()
+        grabber.stop()
+        logger.info(f"Processed {grabber.stats.frames_taken} of {grabber.stats.frames_read} "
+                    f"frames read, dropped {grabber.stats.frames_dropped} stale ones "
+                    f"(frame age last {grabber.stats.last_age * 1000:.0f} ms, "
+                    f"max {grabber.stats.max_age * 1000:.0f} ms)")
         cv2.destroyAllWindows()
+        notification_service.executor.shutdown(wait=True)  # Let queued alerts finish
+        tracer.log_summary()
+        if tracer.export_path is not None:
+            tracer.write_summary(tracer.export_path.with_suffix('.summary.json'))
         logger.info("Webcam demo stopped")
 
 
@@ -7,13 +7,35 @@ __version__ = '2.0.0'
 __author__ = 'Sayed Gamal'
 __email__ = 'sayyedgamall@gmail.com'
 
-from .config import Config, setup_logging
-from .fire_detector import Detector
-from .notification_service import NotificationService
+import importlib
+
+# Exports are imported on first access, so `import src.config` or the bot
+# scripts do not pay for OpenCV, the model backends or the notification stack
+_LAZY_EXPORTS = {
+    'Config': '.config',
+    'setup_logging': '.config',
+    'Detector': '.fire_detector',
+    'Detections': '.detections',
+    'NotificationService': '.notification_service',
+}
 
 __all__ = [
     'Config',
     'setup_logging',
     'Detector',
+    'Detections',
     'NotificationService',
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
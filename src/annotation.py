@@ -0,0 +1,229 @@
+import cv2
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Sequence, Tuple
+
+Color = Tuple[int, int, int]
+
+
+class AnnotationRenderer:
+    def __init__(
+        self,
+        colors: Dict[str, Color],
+        default_color: Color = (0, 255, 0),
+        fill_alpha: float = 0.2,
+        corner_length: int = 20,
+        thickness: int = 2,
+        max_cached_labels: int = 512
+    ):
+        """
+        Draw detection boxes, labels and the status footer with cached rendering.
+
+        The output matches Detector.draw_detection and _add_frame_info (up to
+        rounding on anti-aliased footer text), but the translucent fill only
+        touches each box's region instead of blending a full-frame copy per box,
+        and label and footer text is rasterized once and pasted from a cache.
+
+        Args:
+            colors (Dict[str, Color]): BGR color per lower-case class name
+            default_color (Color): Color for classes missing from colors
+            fill_alpha (float): Opacity of the box fill
+            corner_length (int): Length of the corner accents in pixels
+            thickness (int): Box outline and corner thickness
+            max_cached_labels (int): Maximum number of label sprites kept
+        """
+        self.colors = colors
+        self.default_color = default_color
+        self.fill_alpha = fill_alpha
+        self.corner_length = corner_length
+        self.thickness = thickness
+        self.max_cached_labels = max_cached_labels
+
+        # Label style, same as the cvzone.putTextRect call in Detector.draw_detection
+        self.label_font = cv2.FONT_HERSHEY_SIMPLEX
+        self.label_scale = 1.5
+        self.label_thickness = 2
+        self.label_offset = 5
+        self.label_border = 2
+        self.label_text_color = (255, 255, 255)
+        self.label_border_color = (0, 0, 0)
+        self.label_height = 30  # Labels go below the box when closer than this to the top
+
+        # Footer style, same as Detector._add_frame_info
+        self.footer_height = 40
+        self.footer_font = cv2.FONT_HERSHEY_SIMPLEX
+        self.footer_scale = 0.6
+        self.footer_thickness = 2
+
+        self._labels: OrderedDict = OrderedDict()
+        self._footers: OrderedDict = OrderedDict()
+        self._solids: Dict[Color, np.ndarray] = {}
+
+    def draw_boxes(
+        self,
+        frame: np.ndarray,
+        boxes: np.ndarray,
+        class_names: Sequence[str],
+        confidences: Sequence[float]
+    ) -> None:
+        """
+        Draw all detections on the frame in place, in the given order.
+
+        Args:
+            frame (np.ndarray): Frame to draw on
+            boxes (np.ndarray): (N, 4) integer boxes [x1, y1, x2, y2] in frame coordinates
+            class_names (Sequence[str]): Class name per box
+            confidences (Sequence[float]): Confidence per box
+        """
+        height, width = frame.shape[:2]
+        for (x1, y1, x2, y2), class_name, confidence in zip(boxes, class_names, confidences):
+            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+            color = self.colors.get(class_name.lower(), self.default_color)
+
+            # Translucent fill, blended only over the (clipped) box region
+            rx1, rx2 = np.clip([x1, x2 + 1], 0, width)
+            ry1, ry2 = np.clip([y1, y2 + 1], 0, height)
+            roi = frame[ry1:ry2, rx1:rx2]
+            if roi.size:
+                cv2.addWeighted(self._solid(color, roi.shape), self.fill_alpha,
+                                roi, 1 - self.fill_alpha, 0, dst=roi)
+
+            self._draw_outline(frame, x1, y1, x2, y2, color)
+
+            # Place label below the box if too close to the top edge
+            text_y = y2 + self.label_height if y1 < self.label_height else y1 - 5
+            self._paste_label(frame, class_name, f"{class_name}: {confidence:.2f}",
+                              color, x1, text_y)
+
+    def draw_footer(self, frame: np.ndarray, status_text: str, info_text: str) -> None:
+        """
+        Darken the bottom band of the frame and draw the status and info text.
+
+        Args:
+            frame (np.ndarray): Frame to draw on
+            status_text (str): Left-aligned text
+            info_text (str): Right-aligned text
+        """
+        height, width = frame.shape[:2]
+        band = frame[max(height - self.footer_height, 0):height, 0:width]
+        rows, cols, alpha = self._footer_mask(width, band.shape[0], status_text, info_text)
+
+        # Same result as blending a black rectangle at 80% opacity
+        cv2.addWeighted(band, 0.2, band, 0, 0, dst=band)
+        # White text composited with the cached coverage
+        text = band[rows, cols].astype(np.float32)
+        band[rows, cols] = (text + (255 - text) * alpha + 0.5).astype(np.uint8)
+
+    def _draw_outline(self, frame: np.ndarray, x1: int, y1: int, x2: int, y2: int,
+                      color: Color) -> None:
+        cv2.rectangle(frame, (x1, y1), (x2, y2), color, self.thickness)
+        length, thickness = self.corner_length, self.thickness
+        for x, y, dx, dy in ((x1, y1, 1, 1), (x2, y1, -1, 1), (x1, y2, 1, -1), (x2, y2, -1, -1)):
+            cv2.line(frame, (x, y), (x + dx * length, y), color, thickness)
+            cv2.line(frame, (x, y), (x, y + dy * length), color, thickness)
+
+    def _paste_label(self, frame: np.ndarray, class_name: str, text: str, color: Color,
+                     x: int, y: int) -> None:
+        """Paste the cached label sprite whose text origin is at (x, y)."""
+        sprite, mask, (origin_x, origin_y) = self._label_sprite(class_name, text, color)
+        height, width = frame.shape[:2]
+        left, top = x - origin_x, y - origin_y
+
+        # Clip the sprite against the frame
+        fx1, fy1 = max(left, 0), max(top, 0)
+        fx2, fy2 = min(left + sprite.shape[1], width), min(top + sprite.shape[0], height)
+        if fx1 >= fx2 or fy1 >= fy2:
+            return
+        sx1, sy1 = fx1 - left, fy1 - top
+        sx2, sy2 = sx1 + fx2 - fx1, sy1 + fy2 - fy1
+
+        if mask is None:
+            frame[fy1:fy2, fx1:fx2] = sprite[sy1:sy2, sx1:sx2]
+        else:
+            np.copyto(frame[fy1:fy2, fx1:fx2], sprite[sy1:sy2, sx1:sx2],
+                      where=mask[sy1:sy2, sx1:sx2, None])
+
+    def _solid(self, color: Color, shape: Tuple[int, ...]) -> np.ndarray:
+        """A view of a cached solid-color image with the given shape."""
+        solid = self._solids.get(color)
+        if solid is None or solid.shape[0] < shape[0] or solid.shape[1] < shape[1]:
+            height = max(shape[0], 0 if solid is None else solid.shape[0])
+            width = max(shape[1], 0 if solid is None else solid.shape[1])
+            solid = np.empty((height, width, 3), dtype=np.uint8)
+            solid[:] = color
+            self._solids[color] = solid
+        return solid[:shape[0], :shape[1]]
+
+    def _label_sprite(self, class_name: str, text: str, color: Color):
+        """
+        Return (sprite, mask, text origin) for a label, rendering it on first use.
+
+        Labels are keyed by class and the confidence rounded to the two
+        decimals shown, so there are at most ~100 sprites per class.
+        """
+        key = (class_name, text, color)
+        if key in self._labels:
+            self._labels.move_to_end(key)
+            return self._labels[key]
+
+        (w, h), baseline = cv2.getTextSize(text, self.label_font, self.label_scale,
+                                           self.label_thickness)
+        offset = self.label_offset
+        # Room for the border drawn around the rectangle and glyphs below the baseline
+        margin = self.label_border + baseline + self.label_thickness
+        origin = (margin + offset, margin + offset + h)
+        shape = (h + 2 * (offset + margin) + 1, w + 2 * (offset + margin) + 1)
+
+        sprite = np.zeros(shape + (3,), dtype=np.uint8)
+        mask = np.zeros(shape, dtype=np.uint8)
+        x1, y1 = origin[0] - offset, origin[1] + offset
+        x2, y2 = origin[0] + w + offset, origin[1] - h - offset
+        for canvas, fill, border, text_color in ((sprite, color, self.label_border_color,
+                                                  self.label_text_color),
+                                                 (mask, 255, 255, 255)):
+            cv2.rectangle(canvas, (x1, y1), (x2, y2), fill, cv2.FILLED)
+            cv2.rectangle(canvas, (x1, y1), (x2, y2), border, self.label_border)
+            cv2.putText(canvas, text, origin, self.label_font, self.label_scale,
+                        text_color, self.label_thickness)
+
+        # Crop to the drawn pixels; the label is usually an opaque rectangle,
+        # which can then be pasted with a plain slice assignment
+        rows, cols = np.nonzero(mask)
+        top, left = rows.min(), cols.min()
+        sprite = sprite[top:rows.max() + 1, left:cols.max() + 1]
+        mask = mask[top:rows.max() + 1, left:cols.max() + 1].astype(bool)
+        entry = (sprite, None if mask.all() else mask, (origin[0] - left, origin[1] - top))
+        self._labels[key] = entry
+        if len(self._labels) > self.max_cached_labels:
+            self._labels.popitem(last=False)
+        return entry
+
+    def _footer_mask(self, width: int, band_height: int, status_text: str,
+                     info_text: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Text coverage of the footer band as (rows, cols, alpha), rendered once
+        per distinct footer. Coverage rather than a binary mask keeps the
+        anti-aliased glyph edges cv2.putText produces.
+        """
+        key = (width, band_height, status_text, info_text)
+        entry = self._footers.get(key)
+        if entry is not None:
+            self._footers.move_to_end(key)
+            return entry
+
+        canvas = np.zeros((band_height, width), dtype=np.uint8)
+        baseline_y = band_height - 15
+        cv2.putText(canvas, status_text, (10, baseline_y), self.footer_font,
+                    self.footer_scale, 255, self.footer_thickness)
+        text_size = cv2.getTextSize(info_text, self.footer_font, self.footer_scale,
+                                    self.footer_thickness)[0]
+        cv2.putText(canvas, info_text, (width - text_size[0] - 10, baseline_y),
+                    self.footer_font, self.footer_scale, 255, self.footer_thickness)
+
+        rows, cols = np.nonzero(canvas)
+        alpha = (canvas[rows, cols].astype(np.float32) / 255)[:, None]
+        entry = (rows, cols, alpha)
+        self._footers[key] = entry
+        if len(self._footers) > 16:
+            self._footers.popitem(last=False)
+        return entry
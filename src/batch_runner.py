@@ -0,0 +1,322 @@
+import cv2
+import glob
+import json
+import logging
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+VIDEO_SUFFIXES = ('.mp4', '.avi', '.mov', '.mkv', '.m4v', '.webm')
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.bmp', '.webp')
+
+_detector = None  # One per worker process, built by _init_worker
+
+
+def discover_inputs(patterns: Iterable[str]) -> List[Path]:
+    """
+    Video and image files named by paths, directories (searched recursively) or globs.
+
+    Returns:
+        List[Path]: Sorted files without duplicates
+    """
+    files = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = path.rglob('*')
+        elif path.exists():
+            candidates = [path]
+        else:
+            candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+        files.update(candidate.resolve() for candidate in candidates
+                     if candidate.is_file()
+                     and candidate.suffix.lower() in VIDEO_SUFFIXES + IMAGE_SUFFIXES)
+    return sorted(files)
+
+
+@dataclass
+class Job:
+    path: Path
+    kind: str    # "video" or "image"
+    frames: int  # Frames expected to be inferred, for the ETA
+    size: int
+    mtime: float
+
+    @classmethod
+    def from_path(cls, path: Path, stride: int = 1) -> 'Job':
+        stat = path.stat()
+        if path.suffix.lower() in IMAGE_SUFFIXES:
+            return cls(path, 'image', 1, stat.st_size, stat.st_mtime)
+        cap = cv2.VideoCapture(str(path))
+        count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+        return cls(path, 'video', max(1, -(-count // stride)), stat.st_size, stat.st_mtime)
+
+    @property
+    def key(self) -> str:
+        return str(self.path)
+
+
+class JobManifest:
+    def __init__(self, path: Path, settings: dict):
+        """
+        Record of finished files, so an interrupted run restarts where it stopped.
+
+        A file counts as done while its size and modification time are
+        unchanged; failed files are retried. Done entries keep the file's
+        summary, so the results file can always be rebuilt from the manifest
+        (see write_summaries). The manifest is rewritten atomically after
+        every file. A manifest written with other settings (model, backend,
+        stride) is ignored, since its results differ.
+
+        Args:
+            path (Path): JSON file of the manifest
+            settings (dict): Settings the results depend on
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.settings = settings
+        self.entries: Dict[str, dict] = {}
+        if path.exists():
+            data = json.loads(path.read_text())
+            if data.get('settings') == settings:
+                self.entries = data.get('files', {})
+            else:
+                self.logger.warning(f"Manifest {path} was written with other settings "
+                                    f"({data.get('settings')}); starting over")
+
+    def is_done(self, job: Job) -> bool:
+        entry = self.entries.get(job.key)
+        return entry is not None and entry['status'] == 'done' \
+            and entry['size'] == job.size and entry['mtime'] == job.mtime
+
+    def mark(self, job: Job, status: str, error: Optional[str] = None,
+             summary: Optional[dict] = None) -> None:
+        self.entries[job.key] = {'status': status, 'size': job.size, 'mtime': job.mtime,
+                                 **({'error': error} if error else {}),
+                                 **({'summary': summary} if summary else {})}
+        self._write(self.path, json.dumps({'settings': self.settings, 'files': self.entries},
+                                          indent=1))
+
+    def write_summaries(self, out_path: Path, exclude: Iterable[str] = ()) -> None:
+        """
+        Rewrite out_path with one JSON line per done file, from the manifest.
+
+        Args:
+            out_path (Path): JSON Lines file
+            exclude (Iterable[str]): Keys of files about to be processed again
+        """
+        exclude = set(exclude)
+        self._write(out_path, ''.join(json.dumps(entry['summary']) + '\n'
+                                      for key, entry in self.entries.items()
+                                      if key not in exclude and entry['status'] == 'done'
+                                      and 'summary' in entry))
+
+    @staticmethod
+    def _write(path: Path, text: str) -> None:
+        """Replace path atomically."""
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        tmp.write_text(text)
+        tmp.replace(path)
+
+
+def _init_worker(model_path: Path, backend: str, threads: Optional[int]) -> None:
+    """Pool initializer: one warmed-up Detector per worker process."""
+    global _detector
+    if threads:
+        # Before torch / onnxruntime start their thread pools
+        os.environ['OMP_NUM_THREADS'] = str(threads)
+    from .fire_detector import Detector
+    _detector = Detector(model_path, backend=backend)
+    _detector.warmup()
+
+
+def process_file(job: Job, stride: int = 1) -> dict:
+    """
+    Detection summary of one file, using the worker's Detector.
+
+    Videos are inferred on every stride-th frame; the frames in between are
+    only grabbed.
+
+    Returns:
+        dict: Summary with per-label frame counts, the first detection time
+        and the highest confidence
+    """
+    start = time.perf_counter()
+    counts: Dict[str, int] = {}
+    first_detection, max_confidence, inferred, frames, fps = None, 0.0, 0, 0, None
+
+    def infer(frame, index: int) -> None:
+        nonlocal first_detection, max_confidence, inferred
+        detections = _detector.detect(frame)
+        inferred += 1
+        if detections.detection:
+            counts[detections.detection] = counts.get(detections.detection, 0) + 1
+            if first_detection is None:
+                first_detection = index / fps if fps else 0.0
+            max_confidence = max(max_confidence, float(detections.confidences.max(initial=0)))
+
+    if job.kind == 'image':
+        image = cv2.imread(str(job.path))
+        if image is None:
+            raise IOError(f"Failed to read image: {job.path}")
+        frames = 1
+        infer(image, 0)
+    else:
+        cap = cv2.VideoCapture(str(job.path))
+        if not cap.isOpened():
+            raise IOError(f"Failed to open video: {job.path}")
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        try:
+            while True:
+                if frames % stride:
+                    if not cap.grab():
+                        break
+                else:
+                    ok, frame = cap.read()
+                    if not ok:
+                        break
+                    infer(frame, frames)
+                frames += 1
+        finally:
+            cap.release()
+
+    return {'path': job.key, 'kind': job.kind, 'frames': frames, 'inferred': inferred,
+            'detections': counts, 'first_detection': first_detection,
+            'max_confidence': max_confidence, 'seconds': time.perf_counter() - start,
+            'worker': os.getpid()}
+
+
+@dataclass
+class BatchStats:
+    files: int = 0
+    done: int = 0
+    failed: int = 0
+    skipped: int = 0  # Already done in the manifest
+    frames_inferred: int = 0
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        model_path: Path,
+        out_path: Path,
+        manifest_path: Optional[Path] = None,
+        workers: int = 1,
+        backend: str = "auto",
+        stride: int = 1,
+        threads_per_worker: Optional[int] = 1
+    ):
+        """
+        Fan files out over a process pool of detectors.
+
+        Each worker loads and warms up its own Detector once and then takes
+        whole files; the parent only collects summaries, records them in the
+        manifest and then appends them to out_path as JSON lines. Progress is
+        logged after each file, with the ETA from the frames still to infer.
+
+        out_path is rebuilt from the manifest when a run starts, so it holds
+        exactly one line per done file: a reprocessed file replaces its old
+        line, and a line lost to an interruption after the manifest was
+        updated comes back.
+
+        Args:
+            model_path (Path): Model file
+            out_path (Path): JSON Lines file of the summaries
+            manifest_path (Optional[Path]): Resumable manifest; defaults to
+                out_path with a .manifest.json suffix
+            workers (int): Worker processes; 0 runs in this process
+            backend (str): Inference backend
+            stride (int): Infer every stride-th video frame
+            threads_per_worker (Optional[int]): Inference threads per worker
+                (None keeps the library default)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model_path = model_path
+        self.out_path = out_path
+        self.manifest_path = manifest_path or out_path.with_suffix('.manifest.json')
+        self.workers = workers
+        self.backend = backend
+        self.stride = max(1, stride)
+        self.threads_per_worker = threads_per_worker
+
+    def run(self, files: List[Path]) -> BatchStats:
+        start = time.perf_counter()
+        manifest = JobManifest(self.manifest_path, {
+            'model': str(self.model_path), 'backend': self.backend, 'stride': self.stride})
+        stats = BatchStats(files=len(files))
+        jobs = []
+        for path in files:
+            job = Job.from_path(path, self.stride)
+            if manifest.is_done(job):
+                stats.skipped += 1
+            else:
+                jobs.append(job)
+        if stats.skipped:
+            self.logger.info(f"Skipping {stats.skipped} files already done in {self.manifest_path}")
+        self.out_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest.write_summaries(self.out_path, exclude=(job.key for job in jobs))
+        if not jobs:
+            return stats
+
+        total_frames = sum(job.frames for job in jobs)
+        done_frames = 0
+        init_args = (self.model_path, self.backend, self.threads_per_worker)
+
+        def finish(job: Job, summary: Optional[dict], error: Optional[Exception]) -> None:
+            nonlocal done_frames
+            if error is None:
+                # Manifest first: it is what out_path is rebuilt from
+                manifest.mark(job, 'done', summary=summary)
+                with open(self.out_path, 'a') as f:
+                    f.write(json.dumps(summary) + '\n')
+                stats.done += 1
+                stats.frames_inferred += summary['inferred']
+            else:
+                manifest.mark(job, 'failed', str(error))
+                stats.failed += 1
+                stats.errors.append(f"{job.path}: {error}")
+                self.logger.error(f"Failed {job.path}: {error}")
+            done_frames += job.frames
+            elapsed = time.perf_counter() - start
+            rate = done_frames / elapsed if elapsed > 0 else 0.0
+            eta = (total_frames - done_frames) / rate if rate > 0 else 0.0
+            self.logger.info(
+                f"[{stats.done + stats.failed}/{len(jobs)}] {job.path.name} | "
+                f"{rate:.1f} frames/s, {(stats.done + stats.failed) / elapsed * 60:.1f} files/min, "
+                f"ETA {time.strftime('%H:%M:%S', time.gmtime(eta))}")
+
+        if self.workers == 0:
+            _init_worker(self.model_path, self.backend, None)  # Leave this process's threads
+            for job in jobs:
+                try:
+                    finish(job, process_file(job, self.stride), None)
+                except Exception as e:
+                    finish(job, None, e)
+        else:
+            # Spawn: fork is unsafe once threads or torch exist
+            with ProcessPoolExecutor(self.workers, mp_context=mp.get_context('spawn'),
+                                     initializer=_init_worker, initargs=init_args) as pool:
+                # Largest files first, so one long video does not run alone at the end
+                pending = {pool.submit(process_file, job, self.stride): job
+                           for job in sorted(jobs, key=lambda job: -job.frames)}
+                try:
+                    while pending:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            job = pending.pop(future)
+                            error = future.exception()
+                            finish(job, None if error else future.result(), error)
+                except KeyboardInterrupt:
+                    self.logger.warning("Interrupted; finished files are kept in the manifest")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        stats.seconds = time.perf_counter() - start
+        return stats
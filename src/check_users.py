@@ -1,6 +1,11 @@
 import os
 import asyncio
-from notification_service import FlareGuardBot  # Import your bot class
+import sys
+from pathlib import Path
+
+# Allow running as `python src/check_users.py` while importing the modules as a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.notification_service import FlareGuardBot  # Import your bot class
 from dotenv import load_dotenv
 
 load_dotenv()
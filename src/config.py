@@ -35,11 +35,60 @@ class Config:
     IMGUR_CLIENT_ID = os.getenv('IMGUR_CLIENT_ID')
 
     PROJECT_ROOT = Path(__file__).parent.parent
-    MODEL_PATH = PROJECT_ROOT / 'models' / 'best_nano_111.pt'
+    # Relative paths are resolved against the project root; point this at an
+    # exported or quantized .onnx (see scripts/quantize_int8.py) to run it
+    MODEL_PATH = PROJECT_ROOT / os.getenv('MODEL_PATH', 'models/best_nano_111.pt')
+    # "ultralytics" (PyTorch), "onnxruntime" (the exported .onnx next to
+    # MODEL_PATH, no PyTorch needed) or "auto" (by model file suffix)
+    INFERENCE_BACKEND = os.getenv('INFERENCE_BACKEND', 'auto')
+    # Reload the model in the background when its weights file is replaced
+    MODEL_HOT_RELOAD = os.getenv('MODEL_HOT_RELOAD', '0') == '1'
+    MODEL_RELOAD_INTERVAL = 5.0  # Seconds between checks of the weights file
     VIDEO_SOURCE = PROJECT_ROOT / 'data' / 'police_car_fire_ccvt.mp4'
     DETECTED_FIRES_DIR = PROJECT_ROOT / 'detected_fires'
 
+    # Comma-separated camera sources (file paths, device indices or stream
+    # URLs) for the multi-camera runner. Defaults to VIDEO_SOURCE.
+    VIDEO_SOURCES = [
+        source.strip() for source in os.getenv('VIDEO_SOURCES', '').split(',')
+        if source.strip()
+    ] or [str(VIDEO_SOURCE)]
+    MAX_BATCH_SIZE = int(os.getenv('MAX_BATCH_SIZE', 4))  # Frames per forward pass
+
+    # Skip inference on frames that barely changed since the last inferred one
+    MOTION_GATE = os.getenv('MOTION_GATE', '0') == '1'
+    MOTION_GATE_MAX_SKIP_SECONDS = 2.0  # Force an inference at least this often
+
+    # Answer frozen or duplicated frames with the result of the matching
+    # frame seen within FRAME_CACHE_TTL seconds instead of re-running the model
+    FRAME_CACHE = os.getenv('FRAME_CACHE', '0') == '1'
+    FRAME_CACHE_TTL = 2.0
+    FRAME_CACHE_MAX_DISTANCE = 2  # Differing hash bits still counted as the same frame
+
+    # Run the model on keyframes only and track boxes in between; alerts are
+    # then sent once per tracked object instead of once per ALERT_COOLDOWN
+    TRACKING = os.getenv('TRACKING', '0') == '1'
+    KEYFRAME_IDLE_INTERVAL = 4  # Frames between model runs while nothing is tracked
+    KEYFRAME_MAX_INTERVAL = 8   # Upper bound while tracks are stable
+
+    # JSON file mapping camera names (cam0, cam1, ...) to polygon zones in
+    # normalized coordinates; cameras without zones watch the whole frame.
+    # Relative paths are resolved against the project root, like MODEL_PATH
+    DETECTION_ZONES_FILE = PROJECT_ROOT / os.getenv('DETECTION_ZONES_FILE', 'zones.json')
+    DETECTION_ZONE_MIN_OVERLAP = 0.5  # Share of a box that must lie inside the zones
+
+    # Serve per-stage timings and per-camera counters at
+    # http://127.0.0.1:<port>/metrics (Prometheus format); 0 disables collection
+    METRICS_PORT = int(os.getenv('METRICS_PORT', 0))
+    METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+
+    # Append one JSON line per alert delivery (stage spans and capture-to-delivery
+    # latency) to this file; the percentile summary goes next to it on shutdown.
+    # Empty disables the export
+    TRACE_FILE = os.getenv('TRACE_FILE', '')
+
     ALERT_COOLDOWN = 45  # Seconds between alerts
+    TRACK_ALERT_COOLDOWN = 10  # With TRACKING, minimum seconds between alerts of a camera
 
     @classmethod
     def validate(cls):
@@ -0,0 +1,103 @@
+import cv2
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Polygon = Sequence[Tuple[float, float]]
+
+
+class DetectionZones:
+    def __init__(self, polygons: Sequence[Polygon], min_overlap: float = 0.5):
+        """
+        Polygon zones a camera watches; everything outside them is ignored.
+
+        Polygons use normalized (x, y) coordinates in 0-1, so one zone
+        definition works at any camera resolution. They are rasterized once per
+        frame size into a mask and a summed-area table.
+
+        Args:
+            polygons (Sequence[Polygon]): Zones as lists of normalized (x, y) points
+            min_overlap (float): Share of a box's area that must fall inside the
+                zones for the detection to be kept
+        """
+        if not polygons:
+            raise ValueError("At least one zone polygon is required")
+        self.polygons = [np.asarray(polygon, dtype=np.float32).reshape(-1, 2)
+                         for polygon in polygons]
+        self.min_overlap = min_overlap
+        # Stable identity of the definition (unlike id(), which is reused
+        # after garbage collection): equal zones share results
+        self.key = (min_overlap, tuple(polygon.tobytes() for polygon in self.polygons))
+        self._cache: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray,
+                                                 Optional[Tuple[int, int, int, int]]]] = {}
+
+    def _rasterize(self, frame_shape: Tuple[int, ...]):
+        """(mask, integral image, bounding rect) for a frame size, cached."""
+        height, width = frame_shape[:2]
+        entry = self._cache.get((height, width))
+        if entry is None:
+            mask = np.zeros((height, width), dtype=np.uint8)
+            points = [np.round(polygon * [width, height]).astype(np.int32)
+                      for polygon in self.polygons]
+            cv2.fillPoly(mask, points, 1)
+            integral = cv2.integral(mask)
+            rect = cv2.boundingRect(mask)  # (x, y, w, h), all zero for an empty mask
+            bounds = None if rect[2] == 0 or rect[3] == 0 else \
+                (rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3])
+            entry = self._cache[(height, width)] = (mask, integral, bounds)
+        return entry
+
+    def mask(self, frame_shape: Tuple[int, ...]) -> np.ndarray:
+        """Binary (0/1) zone mask for a frame of the given shape."""
+        return self._rasterize(frame_shape)[0]
+
+    def bounding_rect(self, frame_shape: Tuple[int, ...]) -> Optional[Tuple[int, int, int, int]]:
+        """[x1, y1, x2, y2) rectangle enclosing all zones, or None if they cover no pixel."""
+        return self._rasterize(frame_shape)[2]
+
+    def coverage(self, boxes: np.ndarray, frame_shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Share of each box's area that lies inside the zones.
+
+        Uses four summed-area-table lookups per box, so the cost does not
+        depend on box size.
+
+        Args:
+            boxes (np.ndarray): (N, 4) [x1, y1, x2, y2] boxes in frame coordinates
+            frame_shape (Tuple[int, ...]): Shape of the frame the boxes belong to
+
+        Returns:
+            np.ndarray: (N,) fractions in 0-1
+        """
+        height, width = frame_shape[:2]
+        _, integral, _ = self._rasterize(frame_shape)
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        x1, x2 = (np.clip(np.round(boxes[:, [0, 2]]), 0, width).astype(int).T)
+        y1, y2 = (np.clip(np.round(boxes[:, [1, 3]]), 0, height).astype(int).T)
+        inside = integral[y2, x2] - integral[y1, x2] - integral[y2, x1] + integral[y1, x1]
+        area = (x2 - x1) * (y2 - y1)
+        return np.where(area > 0, inside / np.maximum(area, 1), 0.0)
+
+    def contains(self, boxes: np.ndarray, frame_shape: Tuple[int, ...]) -> np.ndarray:
+        """Boolean mask of boxes that overlap the zones by at least min_overlap."""
+        return self.coverage(boxes, frame_shape) >= self.min_overlap
+
+
+def load_camera_zones(path: Path, min_overlap: float = 0.5) -> Dict[str, DetectionZones]:
+    """
+    Load per-camera zones from a JSON file.
+
+    The file maps camera names (cam0, cam1, ...) to lists of polygons in
+    normalized coordinates, e.g. {"cam0": [[[0.1, 0.5], [0.6, 0.5], [0.6, 1.0], [0.1, 1.0]]]}.
+
+    Args:
+        path (Path): JSON file
+        min_overlap (float): Passed to each DetectionZones
+
+    Returns:
+        Dict[str, DetectionZones]: Zones per camera name
+    """
+    with open(path) as f:
+        data: Dict[str, List[Polygon]] = json.load(f)
+    return {camera: DetectionZones(polygons, min_overlap) for camera, polygons in data.items()}
@@ -0,0 +1,151 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass
+class Detections:
+    """
+    Render-free detection results for one frame, stored as parallel arrays.
+
+    Boxes are in the coordinates of the original frame, sorted by descending
+    confidence. input_shape is the (height, width) of the image the model saw;
+    a frame point (x, y) maps to (x * scale[0] + pad[0], y * scale[1] + pad[1])
+    in that image.
+    """
+    boxes: np.ndarray        # (N, 4) float32 [x1, y1, x2, y2]
+    class_ids: np.ndarray    # (N,) int32
+    confidences: np.ndarray  # (N,) float32
+    frame_shape: Tuple[int, int]
+    input_shape: Tuple[int, int]
+    scale: Tuple[float, float]      # (x, y) frame-to-input scale factors
+    pad: Tuple[float, float] = (0.0, 0.0)  # (x, y) letterbox padding in the input image
+    detection: Optional[str] = None  # "Fire", "Smoke" or None
+    track_ids: Optional[np.ndarray] = None  # (N,) int64, set when a tracker is used
+
+    def __len__(self) -> int:
+        return len(self.confidences)
+
+    @classmethod
+    def empty(
+        cls,
+        frame_shape: Tuple[int, ...],
+        input_shape: Tuple[int, ...],
+        scale: Optional[Tuple[float, float]] = None,
+        pad: Tuple[float, float] = (0.0, 0.0)
+    ) -> 'Detections':
+        """
+        Result without boxes. scale defaults to a plain (non-letterboxed)
+        resize from frame_shape to input_shape.
+        """
+        if scale is None:
+            scale = (input_shape[1] / frame_shape[1], input_shape[0] / frame_shape[0])
+        return cls(
+            boxes=np.zeros((0, 4), dtype=np.float32),
+            class_ids=np.zeros(0, dtype=np.int32),
+            confidences=np.zeros(0, dtype=np.float32),
+            frame_shape=tuple(frame_shape[:2]),
+            input_shape=tuple(input_shape[:2]),
+            scale=tuple(scale),
+            pad=tuple(pad),
+        )
+
+    def scaled_boxes(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Integer boxes for a frame of the given shape (e.g. a resized display frame).
+
+        Args:
+            shape (Tuple[int, ...]): Target (height, width[, channels])
+
+        Returns:
+            np.ndarray: (N, 4) int boxes in the target frame's coordinates
+        """
+        factors = np.array([
+            shape[1] / self.frame_shape[1], shape[0] / self.frame_shape[0],
+        ] * 2, dtype=np.float32)
+        return (self.boxes * factors).astype(int)
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise IoU between two sets of [x1, y1, x2, y2] boxes.
+
+    Returns:
+        np.ndarray: (len(boxes_a), len(boxes_b)) IoU matrix
+    """
+    boxes_a = np.asarray(boxes_a, dtype=np.float32).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=np.float32).reshape(-1, 4)
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.where(union > 0, intersection / np.maximum(union, 1e-9), 0.0)
+
+
+def merge_boxes(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    class_ids: np.ndarray,
+    threshold: float,
+    metric: str = "iou",
+    fuse: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Class-aware greedy suppression of overlapping boxes.
+
+    The pairwise overlap matrix is computed once; each kept box then
+    suppresses all remaining same-class boxes overlapping it by at least
+    threshold in a single vectorized step. With metric="ios" overlap is
+    intersection over the smaller box, which matches the partial boxes an
+    object cut by a tile border produces. With fuse=True each kept box is
+    grown to the union of the boxes it suppressed.
+
+    Args:
+        boxes (np.ndarray): (N, 4) [x1, y1, x2, y2] boxes
+        scores (np.ndarray): (N,) confidences
+        class_ids (np.ndarray): (N,) class ids
+        threshold (float): Overlap at which boxes are merged
+        metric (str): "iou" or "ios"
+        fuse (bool): Replace kept boxes by the union of their group
+
+    Returns:
+        tuple: (indices of kept boxes in descending score order, (K, 4) boxes)
+    """
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    if len(boxes) == 0:
+        return np.zeros(0, dtype=int), boxes
+
+    if metric == "iou":
+        overlap = box_iou(boxes, boxes)
+    elif metric == "ios":
+        top_left = np.maximum(boxes[:, None, :2], boxes[None, :, :2])
+        bottom_right = np.minimum(boxes[:, None, 2:], boxes[None, :, 2:])
+        intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+        area = np.prod(boxes[:, 2:] - boxes[:, :2], axis=1)
+        overlap = intersection / np.maximum(np.minimum(area[:, None], area[None, :]), 1e-9)
+    else:
+        raise ValueError(f"Unknown overlap metric: {metric}")
+    overlap = (overlap >= threshold) & (class_ids[:, None] == class_ids[None, :])
+
+    order = np.argsort(-np.asarray(scores))
+    groups = np.full(len(boxes), -1)
+    keep = []
+    for index in order:
+        if groups[index] >= 0:
+            continue
+        members = overlap[index] & (groups < 0)
+        members[index] = True
+        groups[members] = index
+        keep.append(index)
+    keep = np.array(keep, dtype=int)
+
+    merged = boxes[keep].copy()
+    if fuse:
+        position = np.empty(len(boxes), dtype=int)
+        position[keep] = np.arange(len(keep))
+        slot = position[groups]
+        np.minimum.at(merged[:, :2], slot, boxes[:, :2])
+        np.maximum.at(merged[:, 2:], slot, boxes[:, 2:])
+    return keep, merged
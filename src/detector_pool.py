@@ -0,0 +1,319 @@
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import queue
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .detections import Detections
+
+Key = Tuple[str, int]  # (source, sequence number)
+
+
+@dataclass
+class PoolResult:
+    """Detections for one submitted frame."""
+    source: str
+    index: int  # Position of the frame in its source's submissions
+    detections: Detections
+    worker: int
+
+
+@dataclass
+class _Task:
+    slot: int
+    shape: Tuple[int, ...]
+    worker: int
+    attempts: int = 1  # Workers that crashed while running this frame, plus one
+    queued: int = 0    # Order the frame was put on its worker's queue
+
+
+def _worker(index: int, model_path: Path, detector_kwargs: dict, threads: Optional[int],
+            shm_name: str, slot_bytes: int, tasks, results) -> None:
+    """Worker process: run a Detector on frames read in place from the shared ring."""
+    if threads:
+        # Before torch / onnxruntime start their thread pools
+        os.environ['OMP_NUM_THREADS'] = str(threads)
+    from .fire_detector import Detector
+
+    logger = logging.getLogger(__name__)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        detector = Detector(model_path, **detector_kwargs)
+        detector.warmup()
+        results.put(('ready', index, os.getpid()))
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, key, shape = task
+            # A view on the shared buffer, not a copy
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+            detections = detector.detect(frame)
+            del frame
+            results.put(('done', index, key, detections))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logger.error(f"Detector worker {index} failed: {e}")
+        raise
+    finally:
+        shm.close()
+
+
+class DetectorPool:
+    def __init__(
+        self,
+        model_path: Path,
+        workers: Optional[int] = None,
+        slots: Optional[int] = None,
+        max_frame_shape: Tuple[int, int, int] = (1080, 1920, 3),
+        threads_per_worker: Optional[int] = 1,
+        max_attempts: int = 2,
+        start_timeout: float = 300.0,
+        **detector_kwargs
+    ):
+        """
+        Run Detectors in several processes, so inference and NumPy
+        post-processing use more than one core despite the GIL.
+
+        Frames are copied once into a ring of slots in a single
+        multiprocessing.shared_memory block; workers run the model on a view
+        of the slot and send back the Detections (a few small arrays). Only
+        the slot number and frame shape go through the task queue, so the
+        frame itself is never pickled.
+
+        Results are released per source in submission order, whichever
+        worker finishes first. A worker that dies is restarted and its
+        unfinished frames are handed to the new process. Only the frame it
+        was running counts as an attempt; a frame that has already crashed
+        max_attempts workers gets an empty result instead.
+
+        Args:
+            model_path (Path): Model file each worker loads
+            workers (Optional[int]): Number of processes; one per core if None
+            slots (Optional[int]): Frames in flight at once; 2 per worker if None
+            max_frame_shape (Tuple[int, int, int]): Largest frame to be submitted
+            threads_per_worker (Optional[int]): Inference threads per process,
+                so workers do not oversubscribe the cores; library default if None
+            max_attempts (int): Workers a frame may crash before it is given up
+            start_timeout (float): Seconds to wait for the workers to load the model
+            **detector_kwargs: Passed to each worker's Detector
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model_path = Path(model_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.slots = slots or 2 * self.workers
+        self.slot_bytes = int(np.prod(max_frame_shape))
+        self.threads_per_worker = threads_per_worker
+        self.max_attempts = max_attempts
+        self.start_timeout = start_timeout
+        self.detector_kwargs = detector_kwargs
+        self.restarts = 0
+
+        self._context = mp.get_context('spawn')  # Fork is unsafe once threads or torch exist
+        self._results = self._context.Queue()
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._processes: List[Optional[mp.Process]] = [None] * self.workers
+        self._task_queues: List[Optional[mp.Queue]] = [None] * self.workers
+        self._free_slots: List[int] = list(range(self.slots))
+        self._pending: Dict[Key, _Task] = {}
+        self._queued = itertools.count()
+        self._done: Dict[str, Dict[int, Tuple[Detections, int]]] = defaultdict(dict)
+        self._submitted: Dict[str, int] = defaultdict(int)
+        self._released: Dict[str, int] = defaultdict(int)
+
+    def __enter__(self) -> 'DetectorPool':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> 'DetectorPool':
+        """Create the shared ring and start the workers; returns once all loaded the model."""
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self.slot_bytes)
+        for index in range(self.workers):
+            self._spawn(index)
+
+        ready = set()
+        deadline = time.monotonic() + self.start_timeout
+        while len(ready) < self.workers:
+            try:
+                message = self._results.get(timeout=0.5)
+            except queue.Empty:
+                dead = [i for i, p in enumerate(self._processes) if not p.is_alive()]
+                if dead or time.monotonic() > deadline:
+                    self.close()
+                    reason = f"worker {dead[0]} exited" if dead else "timed out"
+                    raise RuntimeError(f"Detector pool failed to start: {reason}")
+                continue
+            if message[0] == 'ready':
+                ready.add(message[1])
+        self.logger.info(f"Detector pool started: {self.workers} workers, {self.slots} slots "
+                         f"of {self.slot_bytes / 1e6:.1f} MB")
+        return self
+
+    def _spawn(self, index: int) -> None:
+        tasks = self._context.Queue()
+        process = self._context.Process(
+            target=_worker, name=f"detector-{index}", daemon=True,
+            args=(index, self.model_path, self.detector_kwargs, self.threads_per_worker,
+                  self._shm.name, self.slot_bytes, tasks, self._results))
+        process.start()
+        self._processes[index] = process
+        self._task_queues[index] = tasks
+
+    def _slot_view(self, slot: int, shape: Tuple[int, ...]) -> np.ndarray:
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf,
+                          offset=slot * self.slot_bytes)
+
+    def submit(self, source: str, frame: np.ndarray) -> int:
+        """
+        Queue a frame for detection, waiting for a free slot if all are in use.
+
+        Args:
+            source (str): Stream the frame belongs to; results are ordered per source
+            frame (np.ndarray): BGR uint8 frame no larger than max_frame_shape
+
+        Returns:
+            int: The frame's index within its source
+        """
+        if frame.dtype != np.uint8 or frame.nbytes > self.slot_bytes:
+            raise ValueError(f"Frame {frame.shape} {frame.dtype} does not fit a pool slot "
+                             f"of {self.slot_bytes} bytes")
+        while not self._free_slots:
+            self._collect(timeout=0.1)
+        slot = self._free_slots.pop()
+        self._slot_view(slot, frame.shape)[:] = frame
+
+        index = self._submitted[source]
+        self._submitted[source] += 1
+        worker = self._least_loaded()
+        self._pending[(source, index)] = _Task(slot, frame.shape, worker,
+                                               queued=next(self._queued))
+        self._task_queues[worker].put((slot, (source, index), frame.shape))
+        return index
+
+    def _least_loaded(self) -> int:
+        load = [0] * self.workers
+        for task in self._pending.values():
+            load[task.worker] += 1
+        return load.index(min(load))
+
+    def _collect(self, timeout: float) -> None:
+        """Receive finished frames (waiting up to timeout for the first) and check workers."""
+        try:
+            message = self._results.get(timeout=timeout)
+            while True:
+                if message[0] == 'done':
+                    _, worker, key, detections = message
+                    self._finish(key, detections, worker)
+                message = self._results.get_nowait()
+        except queue.Empty:
+            pass
+        self._check_workers()
+
+    def _finish(self, key: Key, detections: Detections, worker: int) -> None:
+        task = self._pending.pop(key, None)
+        if task is None:
+            return  # Late answer for a frame that was already re-assigned and answered
+        self._free_slots.append(task.slot)
+        source, index = key
+        self._done[source][index] = (detections, worker)
+
+    def _check_workers(self) -> None:
+        for index, process in enumerate(self._processes):
+            if process is None or process.is_alive():
+                continue
+            self.logger.error(f"Detector worker {index} exited with code {process.exitcode}; "
+                              f"restarting")
+            self.restarts += 1
+            self._spawn(index)
+            # Workers take frames in queue order and the finished ones were just
+            # collected, so the oldest unfinished frame is the one that was running
+            unfinished = sorted((task.queued, key) for key, task in self._pending.items()
+                                if task.worker == index)
+            for position, (_, key) in enumerate(unfinished):
+                task = self._pending[key]
+                if position == 0:
+                    if task.attempts >= self.max_attempts:
+                        self.logger.error(f"Giving up on frame {key[1]} of {key[0]} after "
+                                          f"{task.attempts} worker failures")
+                        self._finish(key, Detections.empty(task.shape, task.shape), index)
+                        continue
+                    task.attempts += 1
+                task.queued = next(self._queued)
+                self._task_queues[index].put((task.slot, key, task.shape))
+
+    def results(self, wait: bool = False, timeout: float = 0.0,
+                source: Optional[str] = None) -> List[PoolResult]:
+        """
+        Results ready to be released, in submission order per source.
+
+        Args:
+            wait (bool): Block until every submitted frame (of source) has a result
+            timeout (float): Otherwise, seconds to wait for new results
+            source (Optional[str]): Only release this source's results
+
+        Returns:
+            List[PoolResult]: Released results, grouped by source
+        """
+        if wait:
+            while any(source in (None, key[0]) for key in self._pending):
+                self._collect(timeout=0.1)
+        else:
+            self._collect(timeout=max(timeout, 0.001))
+
+        released = []
+        for name, done in self._done.items():
+            if source not in (None, name):
+                continue
+            index = self._released[name]
+            while index in done:
+                detections, worker = done.pop(index)
+                released.append(PoolResult(name, index, detections, worker))
+                index += 1
+            self._released[name] = index
+        return released
+
+    def map(self, frames: Iterable[np.ndarray], source: str = 'default') -> Iterator[Detections]:
+        """Detections for each frame, in order, keeping every slot busy."""
+        for frame in frames:
+            self.submit(source, frame)
+            for result in self.results(source=source):
+                yield result.detections
+        for result in self.results(wait=True, source=source):
+            yield result.detections
+
+    def detect_batch(self, frames: List[np.ndarray]) -> List[Detections]:
+        """Detect a batch of frames in parallel, spread over the workers (Detector.detect_batch)."""
+        source = f'batch-{id(frames)}'
+        for frame in frames:
+            self.submit(source, frame)
+        detections = [result.detections for result in self.results(wait=True, source=source)]
+        for counters in (self._done, self._submitted, self._released):
+            counters.pop(source, None)
+        return detections
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        for tasks, process in zip(self._task_queues, self._processes):
+            if process is not None and process.is_alive():
+                tasks.put(None)
+        for process in self._processes:
+            if process is not None:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        self._processes = [None] * self.workers
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
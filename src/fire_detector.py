@@ -1,10 +1,19 @@
 import cv2
 import numpy as np
-from ultralytics import YOLO
-import cvzone
 import logging
+import time
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+from .annotation import AnnotationRenderer
+from .detection_zones import DetectionZones
+from .detections import Detections, merge_boxes
+from .frame_cache import FrameCache
+from .metrics import metrics
+from .inference_backends import InferenceBackend
+from .model_registry import ModelHandle, registry
+from .tiling import TilingConfig, make_tiles
+from .tracing import Trace, span
 
 
 class Detector:
@@ -14,7 +23,12 @@ class Detector:
         target_height: int = 640,
         iou_threshold: float = 0.2,
         min_confidence: float = 0.5,
-        smoke_confidence: float = 0.75
+        smoke_confidence: float = 0.75,
+        preprocess: str = "resize",
+        output_height: Optional[int] = None,
+        tiling: Optional[TilingConfig] = None,
+        backend: str = "auto",
+        frame_cache: Optional[FrameCache] = None
         ):
         """
         Initialize the FireDetector with a YOLO model.
@@ -24,42 +38,147 @@ class Detector:
             target_height (int): Target height for frame resizing
             iou_threshold (float): IOU threshold for non-maximum suppression
             min_confidence (float): Minimum confidence threshold for detections
+            preprocess (str): "resize" resizes frames to target_height and lets
+                the model letterbox them to a longer side of target_height;
+                "letterbox" letterboxes frames once into a reusable input
+                buffer whose longer side is target_height
+            output_height (Optional[int]): Height of annotated output frames.
+                None uses target_height, 0 keeps the original resolution
+            tiling (Optional[TilingConfig]): Run inference on overlapping
+                full-resolution tiles instead of the downscaled frame
+            backend (str): Inference backend: "ultralytics", "onnxruntime"
+                (runs the exported .onnx next to model_path without PyTorch),
+                or "auto" to pick by the model file suffix. The loaded model
+                is shared with other Detectors using the same file and
+                backend (see model_registry)
+            frame_cache (Optional[FrameCache]): Answer frozen or duplicated
+                frames with the result of the near-identical frame seen before
         """
         self.logger = logging.getLogger(__name__)
 
         try:
-            self.model = YOLO(str(model_path))
+            self.model_handle: ModelHandle = registry.get(model_path, backend)
             self.target_height = target_height
             self.iou_threshold = iou_threshold
             self.min_confidence = min_confidence
             self.smoke_confidence = smoke_confidence
-            self.names = self.model.model.names
+            self.output_height = output_height
+            self.tiling = tiling
+            self.frame_cache = frame_cache
+            if preprocess not in ("resize", "letterbox"):
+                raise ValueError(f"Unknown preprocess mode: {preprocess}")
+            self.preprocess = preprocess
+            self._letterbox_buffers: List[np.ndarray] = []
+            self._letterbox_layouts: List[Optional[Tuple[int, int, int, int]]] = []
+            self.names = self.model_handle.names
+
+            # Per-class lookup tables used to decide Fire/Smoke without a Python loop
+            self._is_fire = self._class_mask("fire")
+            self._is_smoke = self._class_mask("smoke")
 
             # Define colors for different classes
             self.colors = {
                 "fire": (0, 0, 255),    # Red for fire
                 "smoke": (128, 128, 128)  # Gray for smoke
             }
+            self.renderer = AnnotationRenderer(self.colors)
 
-            self.logger.info("Fire detector initialized successfully")
+            self.logger.info(f"Fire detector initialized successfully "
+                             f"({type(self.backend).__name__})")
         except Exception as e:
             self.logger.error(f"Failed to initialize fire detector: {e}")
             raise
 
-    def resize_frame(self, frame: np.ndarray) -> np.ndarray:
+    @property
+    def backend(self) -> InferenceBackend:
+        """The inference backend currently serving this detector's model."""
+        return self.model_handle.backend
+
+    @property
+    def model(self) -> InferenceBackend:
+        """The inference backend (kept under its old name)."""
+        return self.backend
+
+    def _class_mask(self, class_name: str) -> np.ndarray:
+        """Boolean array indexed by class id, True where the class is class_name."""
+        mask = np.zeros(max(self.names) + 1, dtype=bool)
+        for class_id, name in self.names.items():
+            mask[class_id] = name.lower() == class_name
+        return mask
+
+    def resize_frame(self, frame: np.ndarray, target_height: Optional[int] = None) -> np.ndarray:
         """
         Resize frame maintaining aspect ratio.
 
         Args:
             frame (np.ndarray): Input frame
+            target_height (Optional[int]): Output height, defaults to self.target_height
 
         Returns:
             np.ndarray: Resized frame
         """
+        target_height = target_height or self.target_height
         height, width = frame.shape[:2]
         aspect_ratio = width / height
-        new_width = int(self.target_height * aspect_ratio)
-        return cv2.resize(frame, (new_width, self.target_height))
+        new_width = int(target_height * aspect_ratio)
+        return cv2.resize(frame, (new_width, target_height))
+
+    def letterbox_frame(
+        self,
+        frame: np.ndarray,
+        slot: int = 0,
+        square: bool = False
+    ) -> Tuple[np.ndarray, Tuple[float, float], Tuple[int, int]]:
+        """
+        Letterbox a frame straight into a reusable model-input buffer.
+
+        The frame is interpolated once so its longer side is target_height, and
+        written into the centre of a buffer padded with gray (114, as
+        ultralytics uses). Unless square is set, padding is only added up to the
+        next multiple of the model stride, the same minimal rectangle
+        ultralytics infers on. The buffer is owned by the detector and
+        overwritten by the next call with the same slot.
+
+        Args:
+            frame (np.ndarray): Input frame
+            slot (int): Buffer index, one per frame of a batch
+            square (bool): Pad to target_height x target_height, needed when
+                frames of different shapes share a batch
+
+        Returns:
+            tuple: (buffer, (scale_x, scale_y), (pad_x, pad_y))
+        """
+        size = self.target_height
+        height, width = frame.shape[:2]
+        ratio = size / max(height, width)
+        new_width = min(size, max(1, round(width * ratio)))
+        new_height = min(size, max(1, round(height * ratio)))
+        if square:
+            buffer_shape = (size, size, 3)
+        else:
+            stride = 32  # Largest YOLO11 output stride
+            buffer_shape = (-(-new_height // stride) * stride, -(-new_width // stride) * stride, 3)
+        left = (buffer_shape[1] - new_width) // 2
+        top = (buffer_shape[0] - new_height) // 2
+
+        while len(self._letterbox_buffers) <= slot:
+            self._letterbox_buffers.append(np.full(buffer_shape, 114, dtype=np.uint8))
+            self._letterbox_layouts.append(None)
+        buffer = self._letterbox_buffers[slot]
+        if buffer.shape != buffer_shape:
+            buffer = self._letterbox_buffers[slot] = np.full(buffer_shape, 114, dtype=np.uint8)
+            self._letterbox_layouts[slot] = None
+
+        # Only repaint the padding when the layout changes (e.g. a new camera size)
+        layout = (left, top, new_width, new_height)
+        if self._letterbox_layouts[slot] != layout:
+            buffer[:] = 114
+            self._letterbox_layouts[slot] = layout
+
+        cv2.resize(frame, (new_width, new_height),
+                   dst=buffer[top:top + new_height, left:left + new_width],
+                   interpolation=cv2.INTER_LINEAR)
+        return buffer, (new_width / width, new_height / height), (left, top)
 
     def draw_detection(
         self,
@@ -71,12 +190,18 @@ class Detector:
         """
         Draw a single detection on the frame with enhanced visualization.
 
+        annotate() draws through self.renderer, which produces the same output
+        without blending a full-frame copy per box; this method remains the
+        reference implementation.
+
         Args:
             frame (np.ndarray): Input frame
             box (np.ndarray): Detection box coordinates [x1, y1, x2, y2]
             class_name (str): Detected class name
             confidence (float): Detection confidence
         """
+        import cvzone  # Only this reference drawing path needs it
+
         x1, y1, x2, y2 = box
         # Default to green if class not found
         color = self.colors.get(class_name.lower(), (0, 255, 0))
@@ -134,53 +259,446 @@ class Detector:
             colorB=(0, 0, 0),  # Black border
         )
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[str]]:
+    def warmup(
+        self,
+        frame_shape: Optional[Tuple[int, ...]] = None,
+        batch_size: int = 1,
+        runs: int = 2
+    ) -> float:
         """
-        Process a video frame to detect fire and smoke with enhanced visualization.
+        Run dummy inferences so the first real frame does not pay for lazy
+        model setup (predictor creation, layer fusion, memory allocation).
+
+        Args:
+            frame_shape (Optional[Tuple[int, ...]]): Shape of the frames that
+                will be processed; a 16:9 frame of target_height rows if None
+            batch_size (int): Batch size to warm up, e.g. the scheduler's max batch
+            runs (int): Number of warm-up passes
+
+        Returns:
+            float: Seconds spent warming up
+        """
+        if frame_shape is None or not all(frame_shape[:2]):  # Captures report 0x0 when unknown
+            frame_shape = (self.target_height, round(self.target_height * 16 / 9), 3)
+        frame = np.zeros(tuple(frame_shape[:2]) + (3,), dtype=np.uint8)
+        start = time.perf_counter()
+        for _ in range(runs):
+            self.detect_batch([frame] * batch_size)
+        elapsed = time.perf_counter() - start
+        self.logger.info(f"Warm-up: {runs} x {batch_size} frame(s) of "
+                         f"{frame.shape[1]}x{frame.shape[0]} in {elapsed:.2f}s")
+        return elapsed
+
+    def detect(
+        self,
+        frame: np.ndarray,
+        zones: Optional[DetectionZones] = None,
+        source: Optional[str] = None
+    ) -> Detections:
+        """
+        Detect fire and smoke without drawing anything.
 
         Args:
             frame (np.ndarray): Input frame
+            zones (Optional[DetectionZones]): Only look inside these zones
+            source (Optional[str]): Camera the frame comes from; frame_cache
+                only answers it with results of the same camera
 
         Returns:
-            tuple: (processed_frame, detection: str)
+            Detections: Boxes in frame coordinates, class ids, confidences and
+            the overall Fire/Smoke decision
+        """
+        return self.detect_batch([frame], None if zones is None else [zones],
+                                 None if source is None else [source])[0]
+
+    def detect_batch(
+        self,
+        frames: List[np.ndarray],
+        zones: Optional[List[Optional[DetectionZones]]] = None,
+        sources: Optional[List[Optional[str]]] = None
+    ) -> List[Detections]:
+        """
+        Detect fire and smoke on several frames with a single batched forward pass.
+
+        Frames may have different sizes: each one is resized (or letterboxed,
+        depending on the preprocess mode) into the model input, so the per-call
+        overhead of the YOLO wrapper is paid once per batch instead of once per
+        frame.
+
+        Args:
+            frames (List[np.ndarray]): Input frames
+            zones (Optional[List[Optional[DetectionZones]]]): Per-frame zones
+                (None entries watch the whole frame)
+            sources (Optional[List[Optional[str]]]): Per-frame camera names,
+                keeping a shared frame_cache from answering one camera with
+                another's results
+
+        Returns:
+            List[Detections]: One result per input frame, in input order
+        """
+        if self.frame_cache is not None:
+            return self._detect_cached(frames, zones, sources)
+        return self._detect_uncached(frames, zones)
+
+    def _detect_cached(
+        self,
+        frames: List[np.ndarray],
+        zones: Optional[List[Optional[DetectionZones]]],
+        sources: Optional[List[Optional[str]]] = None
+    ) -> List[Detections]:
+        """Answer near-duplicate frames from frame_cache and infer the rest as one batch."""
+        results: List[Optional[Detections]] = [None] * len(frames)
+        misses, keys = [], []
+        for index, frame in enumerate(frames):
+            zone = None if zones is None else zones[index]
+            source = None if sources is None else sources[index]
+            # Results also depend on the camera, the frame size, the zones and
+            # the weights
+            context = (source, frame.shape, None if zone is None else zone.key,
+                       self.model_handle.version)
+            results[index], key = self.frame_cache.lookup(frame, context)
+            if results[index] is None:
+                misses.append(index)
+                keys.append(key)
+
+        if misses:
+            inferred = self._detect_uncached(
+                [frames[i] for i in misses], None if zones is None else [zones[i] for i in misses])
+            for index, key, detections in zip(misses, keys, inferred):
+                self.frame_cache.store(key, detections)
+                results[index] = detections
+        return results
+
+    def _detect_uncached(
+        self,
+        frames: List[np.ndarray],
+        zones: Optional[List[Optional[DetectionZones]]] = None
+    ) -> List[Detections]:
+        if zones is not None:
+            return self._detect_zoned(frames, zones)
+        if self.tiling is not None:
+            return self._detect_tiled(frames)
+        with metrics.timer("preprocess"):
+            images, transforms = self._prepare(frames)
+        return self._detect_prepared(frames, images, transforms)
+
+    def _detect_zoned(
+        self,
+        frames: List[np.ndarray],
+        zones: List[Optional[DetectionZones]]
+    ) -> List[Detections]:
+        """
+        Zone-restricted detection: each frame is cropped to the bounding
+        rectangle of its zones and the crop is scaled by the factor the whole
+        frame gets on its way into the model (target_height over its longer
+        side), so the model input shrinks with the zone area instead of being
+        blown back up to target_height. Boxes that do not overlap the zone
+        masks enough are dropped afterwards.
+        """
+        results: List[Optional[Detections]] = [None] * len(frames)
+        crops, offsets, indices = [], [], []
+        for index, (frame, zone) in enumerate(zip(frames, zones)):
+            rect = (0, 0, frame.shape[1], frame.shape[0]) if zone is None \
+                else zone.bounding_rect(frame.shape)
+            if rect is None:
+                # Zones cover no pixel of this frame: nothing to infer
+                results[index] = Detections.empty(frame.shape, (0, 0), (1.0, 1.0))
+                continue
+            x1, y1, x2, y2 = rect
+            crops.append(frame[y1:y2, x1:x2])
+            offsets.append((x1, y1))
+            indices.append(index)
+
+        if self.tiling is not None:
+            # Tiles already run at full resolution; the crop just means fewer tiles
+            for index, (x1, y1), detections in zip(indices, offsets, self._detect_tiled(crops)):
+                detections.boxes = detections.boxes + np.array([x1, y1, x1, y1], dtype=np.float32)
+                detections.pad = (detections.pad[0] - x1, detections.pad[1] - y1)
+                detections.frame_shape = tuple(frames[index].shape[:2])
+                results[index] = detections
+        elif crops:
+            images, transforms = [], []
+            for index, (x1, y1), crop in zip(indices, offsets, crops):
+                factor = self.target_height / max(frames[index].shape[:2])
+                size = (max(1, round(crop.shape[1] * factor)), max(1, round(crop.shape[0] * factor)))
+                image = cv2.resize(crop, size, interpolation=cv2.INTER_AREA)
+                scale = (size[0] / crop.shape[1], size[1] / crop.shape[0])
+                images.append(image)
+                transforms.append((scale, (-x1 * scale[0], -y1 * scale[1])))
+
+            # Smallest stride-aligned input that holds every crop without upscaling it,
+            # never larger than the input of the whole frame
+            imgsz = min(self.target_height,
+                        max(32, -(-max(max(image.shape[:2]) for image in images) // 32) * 32))
+            try:
+                predictions = self._predict(images, imgsz=imgsz)
+            except Exception as e:
+                self.logger.error(f"Error detecting on {len(images)} zone crops: {e}")
+                predictions = [np.zeros((0, 6), dtype=np.float32)] * len(images)
+            for index, prediction, image, (scale, pad) in zip(indices, predictions, images,
+                                                              transforms):
+                results[index] = self._to_detections(prediction, frames[index].shape,
+                                                     image.shape, scale, pad)
+
+        for index in indices:
+            detections, zone = results[index], zones[index]
+            if zone is not None and len(detections):
+                keep = zone.contains(detections.boxes, frames[index].shape)
+                if not keep.all():
+                    detections.boxes = detections.boxes[keep]
+                    detections.class_ids = detections.class_ids[keep]
+                    detections.confidences = detections.confidences[keep]
+                    detections.detection = self._decide(detections.class_ids,
+                                                        detections.confidences)
+        return results
+
+    def _detect_tiled(self, frames: List[np.ndarray]) -> List[Detections]:
+        """
+        Tiled inference: every tile of every frame (plus each resized frame in
+        hybrid mode) goes through the model in one batch, then per-frame boxes
+        are merged across tiles.
         """
+        if not frames:
+            return []
+
+        tiling = self.tiling
+        images, owners, transforms = [], [], []
+        for index, frame in enumerate(frames):
+            for x1, y1, x2, y2 in make_tiles(frame.shape, tiling.tile_size, tiling.overlap):
+                images.append(frame[y1:y2, x1:x2])
+                owners.append(index)
+                transforms.append(((1.0, 1.0), (-x1, -y1)))  # Predictions come back in tile pixels
+            if tiling.include_full_frame:
+                full, full_transforms = self._prepare([frame])
+                images.append(full[0] if self.preprocess == "resize" else full[0].copy())
+                owners.append(index)
+                transforms.append(full_transforms[0])
+
+        input_shape = (tiling.tile_size, tiling.tile_size)
         try:
-            frame = self.resize_frame(frame)
-            results = self.model(
-                frame, iou=self.iou_threshold, conf=self.min_confidence)
-            detection = None
+            predictions = self._predict(
+                images, imgsz=max(tiling.input_size or tiling.tile_size, self.target_height))
+        except Exception as e:
+            self.logger.error(f"Error detecting on {len(images)} tiles: {e}")
+            return [Detections.empty(frame.shape, input_shape, (1.0, 1.0)) for frame in frames]
+
+        per_frame = [[] for _ in frames]
+        for owner, prediction, (scale, pad) in zip(owners, predictions, transforms):
+            if len(prediction):
+                mapped = prediction.copy()
+                mapped[:, :4] = (prediction[:, :4] - np.array(pad * 2)) / np.array(scale * 2)
+                per_frame[owner].append(mapped)
+
+        results = []
+        for frame, parts in zip(frames, per_frame):
+            prediction = np.concatenate(parts) if parts else np.zeros((0, 6), dtype=np.float32)
+            if len(prediction):
+                keep, boxes = merge_boxes(prediction[:, :4], prediction[:, 4],
+                                          prediction[:, 5].astype(int),
+                                          tiling.merge_threshold, metric="ios", fuse=tiling.fuse)
+                prediction = prediction[keep]
+                prediction[:, :4] = boxes
+            results.append(self._to_detections(prediction, frame.shape, input_shape,
+                                               (1.0, 1.0), (0, 0)))
+        return results
+
+    def _prepare(self, frames: List[np.ndarray]):
+        """Turn frames into model inputs plus the (scale, pad) used for each."""
+        if self.preprocess == "letterbox":
+            square = len({frame.shape for frame in frames}) > 1
+            prepared = [self.letterbox_frame(frame, slot, square)
+                        for slot, frame in enumerate(frames)]
+            return ([image for image, _, _ in prepared],
+                    [(scale, pad) for _, scale, pad in prepared])
+
+        images = [self.resize_frame(frame) for frame in frames]
+        transforms = [
+            ((image.shape[1] / frame.shape[1], image.shape[0] / frame.shape[0]), (0, 0))
+            for frame, image in zip(frames, images)
+        ]
+        return images, transforms
+
+    def _detect_prepared(
+        self,
+        frames: List[np.ndarray],
+        images: List[np.ndarray],
+        transforms: List[Tuple[Tuple[float, float], Tuple[int, int]]]
+    ) -> List[Detections]:
+        """Run the model on prepared inputs and map boxes back to the original frames."""
+        if not frames:
+            return []
+
+        try:
+            predictions = self._predict(images)
+        except Exception as e:
+            self.logger.error(f"Error detecting on {len(frames)} frames: {e}")
+            return [Detections.empty(frame.shape, image.shape, scale, pad)
+                    for frame, image, (scale, pad) in zip(frames, images, transforms)]
+
+        with metrics.timer("postprocess"):
+            return [
+                self._to_detections(prediction, frame.shape, image.shape, scale, pad)
+                for prediction, frame, image, (scale, pad)
+                in zip(predictions, frames, images, transforms)
+            ]
+
+    def _predict(self, images: List[np.ndarray], imgsz: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Run the model on a batch of images.
 
-            if results and len(results[0].boxes) > 0:
-                boxes = results[0].boxes.xyxy.cpu().numpy().astype(int)
-                class_ids = results[0].boxes.cls.cpu().numpy().astype(int)
-                confidences = results[0].boxes.conf.cpu().numpy()
+        Args:
+            images (List[np.ndarray]): Model inputs
+            imgsz (Optional[int]): Model input size; defaults to target_height,
+                so lowering target_height shrinks the input in both modes
 
-                # Sort detections by confidence
-                sort_idx = np.argsort(-confidences)  # Descending order
-                boxes = boxes[sort_idx]
-                class_ids = class_ids[sort_idx]
-                confidences = confidences[sort_idx]
+        Returns:
+            List[np.ndarray]: One (N, 6) [x1, y1, x2, y2, confidence, class_id]
+            array per image, in image coordinates
+        """
+        if imgsz is None:
+            imgsz = self.target_height
+        with metrics.timer("inference"):
+            return self.model_handle.predict(images, self.iou_threshold, self.min_confidence, imgsz)
 
-                for box, class_id, confidence in zip(boxes, class_ids, confidences):
-                    class_name = self.names[class_id]
+    def _to_detections(
+        self,
+        prediction: np.ndarray,
+        frame_shape: Tuple[int, ...],
+        input_shape: Tuple[int, ...],
+        scale: Tuple[float, float],
+        pad: Tuple[int, int]
+    ) -> Detections:
+        """Convert a raw prediction array into sorted Detections in frame coordinates."""
+        detections = Detections.empty(frame_shape, input_shape, scale, pad)
+        if len(prediction) == 0:
+            return detections
+
+        # Sort detections by confidence
+        prediction = prediction[np.argsort(-prediction[:, 4])]  # Descending order
+        boxes = (prediction[:, :4] - np.array(pad * 2)) / np.array(scale * 2)
+        height, width = frame_shape[:2]
+        detections.boxes = np.clip(boxes, 0, [width, height, width, height]).astype(np.float32)
+        detections.confidences = prediction[:, 4].astype(np.float32)
+        detections.class_ids = prediction[:, 5].astype(np.int32)
+        detections.detection = self._decide(detections.class_ids, detections.confidences)
+        return detections
+
+    def _decide(self, class_ids: np.ndarray, confidences: np.ndarray) -> Optional[str]:
+        """
+        Overall status: the class of the most confident box that clears its
+        class threshold. Expects confidences sorted in descending order.
+        """
+        fire = self._is_fire[class_ids] & (confidences >= self.min_confidence)
+        smoke = self._is_smoke[class_ids] & (confidences >= self.smoke_confidence)
+        qualifying = np.flatnonzero(fire | smoke)
+        if qualifying.size == 0:
+            return None
+        return "Fire" if fire[qualifying[0]] else "Smoke"
+
+    def annotate(self, frame: np.ndarray, detections: Detections) -> np.ndarray:
+        """
+        Draw detections and the status footer on a frame, in place.
 
-                    # Update overall detection status
-                    if detection is None:  # Only update if not already set
-                        if "fire" == class_name.lower() and confidence >= self.min_confidence:
-                            detection = "Fire"
-                        elif "smoke" == class_name.lower() and confidence >= self.smoke_confidence:
-                            detection = "Smoke"
+        The frame may have any resolution; boxes are rescaled from the
+        detection frame's coordinates to it.
 
-                    self.draw_detection(frame, box, class_name, confidence)
+        Args:
+            frame (np.ndarray): Frame to draw on (display, recording or alert image)
+            detections (Detections): Result of detect() for the same source frame
 
-            # Add frame metadata
-            self._add_frame_info(frame, detection)
+        Returns:
+            np.ndarray: The annotated frame
+        """
+        self.renderer.draw_boxes(
+            frame,
+            detections.scaled_boxes(frame.shape),
+            [self.names[class_id] for class_id in detections.class_ids],
+            detections.confidences,
+        )
 
-            return frame, detection
+        # Add frame metadata
+        self._add_frame_info(frame, detections.detection)
+        return frame
 
-        except Exception as e:
-            self.logger.error(f"Error processing frame: {e}")
-            return frame, None
+    def process_frame(
+        self,
+        frame: np.ndarray,
+        zones: Optional[DetectionZones] = None,
+        trace: Optional[Trace] = None,
+        source: Optional[str] = None
+    ) -> Tuple[np.ndarray, Optional[str]]:
+        """
+        Process a video frame to detect fire and smoke with enhanced visualization.
+
+        Args:
+            frame (np.ndarray): Input frame
+            zones (Optional[DetectionZones]): Only look inside these zones
+            trace (Optional[Trace]): Alert trace of the frame, gets a
+                process_frame span
+            source (Optional[str]): Camera the frame comes from (see detect())
+
+        Returns:
+            tuple: (processed_frame, detection: str)
+        """
+        with span(trace, "process_frame"):
+            processed, detection = self.process_batch(
+                [frame], None if zones is None else [zones],
+                None if source is None else [source])[0]
+        return processed, detection
+
+    def process_batch(
+        self,
+        frames: List[np.ndarray],
+        zones: Optional[List[Optional[DetectionZones]]] = None,
+        sources: Optional[List[Optional[str]]] = None
+    ) -> List[Tuple[np.ndarray, Optional[str]]]:
+        """
+        Detect and annotate several frames with a single batched forward pass.
+
+        Args:
+            frames (List[np.ndarray]): Input frames
+            zones (Optional[List[Optional[DetectionZones]]]): Per-frame zones
+            sources (Optional[List[Optional[str]]]): Per-frame camera names
+
+        Returns:
+            list: One (processed_frame, detection: str) tuple per input frame,
+            in input order
+        """
+        if zones is not None or self.tiling is not None or self.frame_cache is not None:
+            # The model inputs are crops or tiles (or were never made, on a
+            # cache hit), not re-usable as output frames
+            images, results = [None] * len(frames), self.detect_batch(frames, zones, sources)
+        else:
+            with metrics.timer("preprocess"):
+                images, transforms = self._prepare(frames)
+            results = self._detect_prepared(frames, images, transforms)
+        outputs = []
+        for frame, image, detections in zip(frames, images, results):
+            with metrics.timer("output_frame"):
+                output = self.output_frame(frame, image)
+            try:
+                with metrics.timer("draw"):
+                    self.annotate(output, detections)
+            except Exception as e:
+                self.logger.error(f"Error annotating frame: {e}")
+            outputs.append((output, detections.detection))
+        return outputs
+
+    def output_frame(self, frame: np.ndarray, model_input: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copy of the frame at the output resolution (see output_height), ready to annotate.
+
+        Args:
+            frame (np.ndarray): Original frame
+            model_input (Optional[np.ndarray]): The frame's model input, re-used
+                when it already has the output size
+        """
+        if self.output_height == 0:
+            return frame.copy()
+        if model_input is not None and self.preprocess == "resize" \
+                and self.output_height in (None, self.target_height):
+            return model_input  # Already resized to the output size; no second resize
+        return self.resize_frame(frame, self.output_height)
 
     def _add_frame_info(self, frame: np.ndarray, detection: Optional[str]) -> None:
         """
@@ -190,24 +708,6 @@ class Detector:
             frame (np.ndarray): Input frame
             detection (Optional[str]): Current detection status
         """
-        height, width = frame.shape[:2]
-
-        # Add semi-transparent overlay at the bottom
-        overlay_height = 40
-        overlay = frame[height-overlay_height:height, 0:width].copy()
-        cv2.rectangle(frame, (0, height-overlay_height),
-                      (width, height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.2, frame[height-overlay_height:height, 0:width], 0.8, 0,
-                        frame[height-overlay_height:height, 0:width])
-
-        # Add status text
         status_text = f"Status: {detection if detection else 'No Detection'}"
-        cv2.putText(frame, status_text, (10, height-15),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-
-        # Add confidence threshold info
         conf_text = f"Conf: {self.min_confidence:.2f} | IOU: {self.iou_threshold:.2f}"
-        text_size = cv2.getTextSize(
-            conf_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-        cv2.putText(frame, conf_text, (width - text_size[0] - 10, height-15),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        self.renderer.draw_footer(frame, status_text, conf_text)
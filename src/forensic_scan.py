@@ -0,0 +1,229 @@
+import cv2
+import numpy as np
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .detections import Detections
+
+Hit = Tuple[str, float]  # (detection, top confidence)
+
+
+def format_timestamp(seconds: float) -> str:
+    """hh:mm:ss.mmm of a position in a video."""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+
+
+@dataclass
+class ScanEvent:
+    """One stretch of a recording with detections, refined to the exact frames."""
+    detection: str     # "Fire" or "Smoke" on the first frame
+    first_frame: int
+    last_frame: int
+    start: float       # Seconds into the video of first_frame
+    end: float         # Seconds into the video of last_frame
+    max_confidence: float
+    detections: List[str] = field(default_factory=list)  # Every label seen
+
+    @classmethod
+    def from_hits(cls, hits: Dict[int, Hit], fps: float) -> 'ScanEvent':
+        """Event spanning the frames of hits (frame index -> hit)."""
+        indices = sorted(hits)
+        return cls(detection=hits[indices[0]][0],
+                   first_frame=indices[0], last_frame=indices[-1],
+                   start=indices[0] / fps, end=indices[-1] / fps,
+                   max_confidence=max(conf for _, conf in hits.values()),
+                   detections=sorted({label for label, _ in hits.values()}))
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), 'start_timestamp': format_timestamp(self.start),
+                'end_timestamp': format_timestamp(self.end)}
+
+
+@dataclass
+class ScanReport:
+    events: List[ScanEvent]
+    frames: int             # Frames in the scanned range
+    fps: float
+    stride: int             # Frames between coarse samples
+    coarse_inferred: int = 0
+    refine_inferred: int = 0
+    decoded: int = 0        # Frames retrieved as images; the rest were only grabbed
+    seeks: int = 0
+    seconds: float = 0.0    # Wall time of both passes
+
+    @property
+    def video_seconds(self) -> float:
+        return self.frames / self.fps
+
+    @property
+    def speed(self) -> float:
+        """Video seconds scanned per wall second."""
+        return self.video_seconds / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {'frames': self.frames, 'fps': self.fps, 'stride': self.stride,
+                'coarse_inferred': self.coarse_inferred, 'refine_inferred': self.refine_inferred,
+                'decoded': self.decoded, 'seeks': self.seeks, 'seconds': self.seconds,
+                'speed': self.speed, 'events': [event.to_dict() for event in self.events]}
+
+    def log(self, logger: logging.Logger) -> None:
+        logger.info(f"Scanned {self.video_seconds:.1f}s of video in {self.seconds:.1f}s "
+                    f"({self.speed:.1f}x real time): {self.coarse_inferred} coarse and "
+                    f"{self.refine_inferred} refining inferences over {self.frames} frames, "
+                    f"{self.decoded} decoded, {self.seeks} seeks")
+        for event in self.events:
+            logger.info(f"{event.detection} from {format_timestamp(event.start)} "
+                        f"to {format_timestamp(event.end)} (frames {event.first_frame}-"
+                        f"{event.last_frame}, max confidence {event.max_confidence:.2f})")
+
+
+class ForensicScanner:
+    def __init__(
+        self,
+        detector,
+        interval: float = 1.0,
+        merge_gap: float = 2.0,
+        batch_size: int = 4,
+        seek_distance: int = 250
+    ):
+        """
+        Coarse-to-fine search of a recording for detections.
+
+        The first pass infers one frame every interval seconds; the frames in
+        between are only grab()bed, which advances the demuxer and decoder but
+        skips the conversion to a BGR image. The second pass infers every
+        frame just before the first hit and just after the last hit of each
+        event, so event boundaries are exact to the frame while most of the
+        recording is never inferred. Nothing is annotated or encoded.
+
+        Events shorter than interval may be missed by the first pass; lower
+        interval for those.
+
+        Args:
+            detector: Detector (or anything with a detect_batch method)
+            interval (float): Seconds between coarse samples
+            merge_gap (float): Hits closer than this many seconds belong to
+                the same event (so a flickering detection stays one event)
+            batch_size (int): Frames per forward pass
+            seek_distance (int): Refine windows further ahead than this many
+                frames are reached by seeking instead of grabbing
+        """
+        self.logger = logging.getLogger(__name__)
+        self.detector = detector
+        self.interval = interval
+        self.merge_gap = merge_gap
+        self.batch_size = max(1, batch_size)
+        self.seek_distance = seek_distance
+
+    def scan(self, cap: cv2.VideoCapture, max_frames: int = 0) -> ScanReport:
+        """
+        Scan an opened capture from its current position.
+
+        Args:
+            cap (cv2.VideoCapture): Seekable capture of a recording
+            max_frames (int): Only scan this many frames (0 = all)
+
+        Returns:
+            ScanReport: Events in time order and the work done
+        """
+        start = time.perf_counter()
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        stride = max(1, round(self.interval * fps))
+        report = ScanReport([], 0, fps, stride)
+        self._cap, self._pos, self._report = cap, int(cap.get(cv2.CAP_PROP_POS_FRAMES)), report
+        first = self._pos
+        limit = first + max_frames if max_frames else None
+
+        # Coarse pass: every stride-th frame is inferred
+        hits: Dict[int, Hit] = {}
+        batch: List[Tuple[int, np.ndarray]] = []
+        while limit is None or self._pos < limit:
+            index = self._pos
+            if (index - first) % stride:
+                if not cap.grab():
+                    break
+                self._pos += 1
+                continue
+            ok, frame = cap.read()
+            if not ok:
+                break
+            self._pos += 1
+            report.decoded += 1
+            batch.append((index, frame))
+            if len(batch) == self.batch_size:
+                hits.update(self._infer(batch))
+                report.coarse_inferred += len(batch)
+                batch = []
+        hits.update(self._infer(batch))
+        report.coarse_inferred += len(batch)
+        end = self._pos  # One past the last frame scanned
+        report.frames = end - first
+
+        # Fine pass: every frame up to one stride before the first and after the last hit
+        for first_hit, last_hit in self._group(sorted(hits), round(self.merge_gap * fps)):
+            event_hits = {i: hits[i] for i in hits if first_hit <= i <= last_hit}
+            for lo, hi in ((max(first, first_hit - stride + 1), first_hit),
+                           (last_hit + 1, min(end, last_hit + stride))):
+                event_hits.update(self._infer_range(lo, hi))
+            report.events.append(ScanEvent.from_hits(event_hits, fps))
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    @classmethod
+    def events(cls, hits: Dict[int, Hit], fps: float, gap: int) -> List[ScanEvent]:
+        """Events of per-frame hits, joining hits no more than gap frames apart."""
+        return [ScanEvent.from_hits({i: hit for i, hit in hits.items() if first <= i <= last}, fps)
+                for first, last in cls._group(sorted(hits), gap)]
+
+    @staticmethod
+    def _group(indices: List[int], gap: int) -> Iterator[Tuple[int, int]]:
+        """(first, last) of each run of indices no more than gap apart."""
+        run: Optional[List[int]] = None
+        for index in indices:
+            if run is not None and index - run[1] <= gap:
+                run[1] = index
+                continue
+            if run is not None:
+                yield run[0], run[1]
+            run = [index, index]
+        if run is not None:
+            yield run[0], run[1]
+
+    def _infer(self, batch: List[Tuple[int, np.ndarray]]) -> Dict[int, Hit]:
+        if not batch:
+            return {}
+        results: List[Detections] = self.detector.detect_batch([frame for _, frame in batch])
+        return {index: (result.detection, float(result.confidences.max(initial=0)))
+                for (index, _), result in zip(batch, results) if result.detection}
+
+    def _infer_range(self, lo: int, hi: int) -> Dict[int, Hit]:
+        """Hits among frames lo..hi-1, decoding each of them."""
+        if lo >= hi:
+            return {}
+        if lo < self._pos or lo - self._pos > self.seek_distance:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, lo)
+            self._pos = lo
+            self._report.seeks += 1
+        while self._pos < lo and self._cap.grab():
+            self._pos += 1
+
+        hits: Dict[int, Hit] = {}
+        batch = []
+        while self._pos < hi:
+            ok, frame = self._cap.read()
+            if not ok:
+                break
+            batch.append((self._pos, frame))
+            self._pos += 1
+            self._report.decoded += 1
+            self._report.refine_inferred += 1
+            if len(batch) == self.batch_size:
+                hits.update(self._infer(batch))
+                batch = []
+        hits.update(self._infer(batch))
+        return hits
@@ -0,0 +1,160 @@
+import gc
+import logging
+import multiprocessing as mp
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class ProcessMemory:
+    """Memory of one process from /proc/<pid>/smaps_rollup, in MB."""
+    pid: int
+    rss: float  # Resident pages, shared ones counted in full
+    pss: float  # Shared pages split between the processes sharing them
+    uss: float  # Pages only this process has (private clean + private dirty)
+
+
+def process_memory(pid: Optional[int] = None) -> Optional[ProcessMemory]:
+    """
+    Read a process's RSS, PSS and USS (Linux only).
+
+    Args:
+        pid (Optional[int]): Process id; the current process if None
+
+    Returns:
+        Optional[ProcessMemory]: None when smaps_rollup is unavailable
+    """
+    pid = pid or os.getpid()
+    fields: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+    except OSError:
+        return None
+    uss = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return ProcessMemory(pid, fields.get("Rss", 0) / 1024, fields.get("Pss", 0) / 1024,
+                         uss / 1024)
+
+
+def _child_main(target: Callable, detector, args: Tuple) -> None:
+    # Objects inherited from the parent are frozen, so collections here do
+    # not write to their GC headers (which would copy their pages)
+    target(detector, *args)
+
+
+class ForkLauncher:
+    def __init__(self, model_path: Path, frame_shape: Optional[Tuple[int, ...]] = None,
+                 **detector_kwargs):
+        """
+        Load and warm up one Detector, then fork worker processes that share it.
+
+        Forked workers see the parent's memory copy-on-write, so the model
+        weights and the inference runtime are resident once however many
+        workers run. Two things would otherwise copy those pages into every
+        worker: lazy model setup on the first inference (layer fusion,
+        buffer allocation), which the warm-up does before forking, and the
+        cyclic GC writing to the header of every tracked object it scans,
+        which is avoided by disabling GC while loading and gc.freeze()
+        before forking. Tensor data lives outside Python objects, so
+        reference count updates only touch the small wrapper objects.
+
+        Forking is only safe while the parent has a single thread: a thread
+        pool or a lock held by another thread would be copied half-way into
+        the workers. The inference runtime is therefore pinned to one thread
+        (OMP_NUM_THREADS and torch.set_num_threads) before the model loads,
+        and start() refuses to fork while other Python threads run, so it
+        must be called before any reader, watcher or metrics thread starts.
+
+        Linux only (fork and /proc).
+
+        Args:
+            model_path (Path): Model file
+            frame_shape (Optional[Tuple[int, ...]]): Shape of the frames the
+                workers will process, used for the warm-up
+            **detector_kwargs: Passed to Detector
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model_path = Path(model_path)
+        self.frame_shape = frame_shape
+        self.detector_kwargs = detector_kwargs
+        self.detector = None
+        self.processes: List[mp.Process] = []
+        self._context = mp.get_context("fork")
+
+    def prepare(self):
+        """Load and warm up the shared Detector (done by start() if needed)."""
+        # One inference thread, so no thread pool exists at the fork; set before
+        # torch / onnxruntime are imported, and again in case torch already was
+        os.environ['OMP_NUM_THREADS'] = '1'
+        from .fire_detector import Detector
+
+        gc.disable()  # No collections (and freed holes in pages) while the model loads
+        try:
+            if 'torch' in sys.modules:
+                sys.modules['torch'].set_num_threads(1)
+            self.detector = Detector(self.model_path, **self.detector_kwargs)
+            if 'torch' in sys.modules:  # Imported by the ultralytics backend
+                sys.modules['torch'].set_num_threads(1)
+            self.detector.warmup(self.frame_shape)
+            gc.collect()
+            gc.freeze()  # Frozen objects stay out of later collections, here and in the workers
+        finally:
+            gc.enable()
+        return self.detector
+
+    def start(self, target: Callable, args_per_worker: Sequence[Tuple]) -> List[mp.Process]:
+        """
+        Fork one worker per argument tuple, each running target(detector, *args).
+
+        Args:
+            target (Callable): Worker function; receives the shared Detector first
+            args_per_worker (Sequence[Tuple]): Remaining arguments for each worker
+
+        Returns:
+            List[mp.Process]: The started workers
+        """
+        if self.detector is None:
+            self.prepare()
+        others = [thread.name for thread in threading.enumerate()
+                  if thread is not threading.current_thread()]
+        if others:
+            raise RuntimeError(f"Not forking with other threads running ({', '.join(others)}); "
+                               f"start the workers before any thread is started")
+        for index, args in enumerate(args_per_worker):
+            process = self._context.Process(
+                target=_child_main, args=(target, self.detector, tuple(args)),
+                name=f"worker-{index}", daemon=True)
+            process.start()
+            self.processes.append(process)
+        self.logger.info(f"Forked {len(self.processes)} workers sharing "
+                         f"{self.model_path.name}")
+        return self.processes
+
+    def memory_report(self) -> List[ProcessMemory]:
+        """Memory of the parent followed by each live worker."""
+        pids = [os.getpid()] + [p.pid for p in self.processes if p.is_alive()]
+        return [usage for usage in map(process_memory, pids) if usage is not None]
+
+    def log_memory(self) -> None:
+        for usage in self.memory_report():
+            role = "parent" if usage.pid == os.getpid() else "worker"
+            self.logger.info(f"{role} {usage.pid}: USS {usage.uss:.0f} MB, "
+                             f"PSS {usage.pss:.0f} MB, RSS {usage.rss:.0f} MB")
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        for process in self.processes:
+            process.join(timeout)
+
+    def stop(self) -> None:
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        self.join(timeout=5)
+        self.processes = []
@@ -0,0 +1,122 @@
+import cv2
+import numpy as np
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Hashable, Optional, Tuple
+
+from .detections import Detections
+
+CacheKey = Tuple[Hashable, int]  # (context, frame hash)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0  # Entries dropped because they outlived the TTL
+    evicted: int = 0  # Entries dropped to stay within max_entries
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class FrameCache:
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_distance: int = 2,
+        ttl: float = 2.0,
+        hash_size: int = 16
+    ):
+        """
+        LRU cache of detection results keyed by a perceptual hash of the frame.
+
+        Frozen cameras and relays that duplicate frames send the same image
+        over and over; their results are answered from the cache instead of
+        running the model again. Frames are hashed with a difference hash
+        (dHash): the frame is shrunk to hash_size x (hash_size + 1) gray
+        pixels and each bit says whether a pixel is brighter than its right
+        neighbour. That ignores encoder noise but also small changes, so
+        entries expire after ttl seconds from the inference that produced
+        them, however often they are hit: a frozen camera is still re-checked
+        regularly.
+
+        Args:
+            max_entries (int): Results kept; the least recently used goes first
+            max_distance (int): Largest Hamming distance between hashes that
+                counts as the same frame (0 = identical hashes only)
+            ttl (float): Seconds a result may be served from the cache
+            hash_size (int): Side of the hash grid; the hash has hash_size**2 bits
+        """
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self.ttl = ttl
+        self.hash_size = hash_size
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[CacheKey, Tuple[float, Detections]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def frame_hash(self, frame: np.ndarray) -> int:
+        """dHash of a frame as a hash_size**2-bit integer."""
+        small = cv2.resize(frame, (self.hash_size + 1, self.hash_size),
+                           interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        bits = small[:, 1:] > small[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+    def lookup(self, frame: np.ndarray,
+               context: Hashable = None) -> Tuple[Optional[Detections], CacheKey]:
+        """
+        Find the result of a near-identical frame.
+
+        Args:
+            frame (np.ndarray): Frame about to be inferred
+            context (Hashable): Anything else the result depends on (frame
+                shape, zones, model version); only entries with an equal
+                context match
+
+        Returns:
+            tuple: (a copy of the cached Detections or None, key to store()
+            the new result under on a miss)
+        """
+        key = (context, self.frame_hash(frame))
+        self._expire()
+        match = key if key in self._entries else None
+        if match is None and self.max_distance > 0:
+            best = self.max_distance + 1
+            for candidate in self._entries:
+                if candidate[0] == context:
+                    distance = (candidate[1] ^ key[1]).bit_count()
+                    if distance < best:
+                        match, best = candidate, distance
+
+        if match is None:
+            self.stats.misses += 1
+            return None, key
+        self.stats.hits += 1
+        self._entries.move_to_end(match)
+        # A shallow copy, so callers setting fields (e.g. track ids) do not change the entry
+        return replace(self._entries[match][1]), key
+
+    def store(self, key: CacheKey, detections: Detections) -> None:
+        """Remember the result inferred for the frame that produced key."""
+        self._entries[key] = (time.monotonic(), replace(detections))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evicted += 1
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self.ttl
+        for key in [key for key, (stored, _) in self._entries.items() if stored < deadline]:
+            del self._entries[key]
+            self.stats.expired += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,171 @@
+import cv2
+import numpy as np
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Tuple
+
+from .metrics import metrics
+
+
+@dataclass
+class GrabberStats:
+    frames_read: int = 0
+    frames_taken: int = 0
+    frames_dropped: int = 0  # Decoded but replaced by newer frames before anyone took them
+    last_age: float = 0.0    # Seconds between capture and hand-out of the last taken frame
+    max_age: float = 0.0
+
+
+class FrameGrabber:
+    def __init__(
+        self,
+        cap: cv2.VideoCapture,
+        buffer_size: int = 1,
+        realtime: bool = False,
+        name: str = "camera"
+    ):
+        """
+        Decode a capture on a background thread, keeping only the newest frames.
+
+        cv2.VideoCapture.read() returns buffered frames in order, so a consumer
+        slower than the camera falls further and further behind. The grabber
+        reads as fast as the source delivers and keeps at most buffer_size
+        frames; older ones are dropped (and counted), so a frame is never
+        older than buffer_size camera intervals plus one consumer iteration
+        when it is handed out.
+
+        Args:
+            cap (cv2.VideoCapture): Opened capture; released by the reader
+                thread when the source ends or after stop()
+            buffer_size (int): Newest frames kept. take() and read() return the
+                newest and drop the rest unless asked for the oldest
+            realtime (bool): Pace reads at the capture FPS, so a local file
+                behaves like a live camera (devices and streams pace themselves)
+            name (str): Camera label of the decode timings
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cap = cap
+        self.name = name
+        self.realtime = realtime
+        self.frame_interval = 1.0 / (cap.get(cv2.CAP_PROP_FPS) or 25.0)
+        self.stats = GrabberStats()
+        self.last_capture_time: Optional[float] = None  # Of the last frame handed out
+
+        self._frames: Deque[Tuple[np.ndarray, float]] = deque(maxlen=max(1, buffer_size))
+        self._ready = threading.Condition()
+        self._stopped = threading.Event()
+        self._ended = False
+        self._thread = threading.Thread(target=self._reader, name=f"grabber-{name}",
+                                        daemon=True)
+
+    def start(self) -> 'FrameGrabber':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop reading. The capture is released by the reader thread once its
+        current read() returns, never underneath it; on a stalled stream that
+        can be after stop() has given up waiting.
+        """
+        self._stopped.set()
+        if self._thread.ident is None:
+            self.cap.release()  # Never started, so no reader owns the capture
+            return
+        self._thread.join(timeout=2)
+        if self._thread.is_alive():
+            self.logger.warning(f"Source {self.name} is still blocked in a read; "
+                                f"it is released when the read returns")
+
+    def __len__(self) -> int:
+        """Frames waiting to be taken."""
+        return len(self._frames)
+
+    @property
+    def finished(self) -> bool:
+        """True once the source has ended and its last frame was taken."""
+        with self._ready:
+            return self._ended and not self._frames
+
+    @property
+    def frame_age(self) -> float:
+        """Seconds since the last frame handed out was captured."""
+        return 0.0 if self.last_capture_time is None else time.time() - self.last_capture_time
+
+    def take(self, oldest: bool = False) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Hand out a buffered (frame, capture_time) without waiting.
+
+        Args:
+            oldest (bool): Return the oldest buffered frame and keep the rest
+                for the next calls, instead of the newest (dropping the rest)
+
+        Returns:
+            Optional[tuple]: (frame, capture_time), or None if nothing new arrived
+        """
+        with self._ready:
+            if not self._frames:
+                return None
+            if oldest:
+                item = self._frames.popleft()
+            else:
+                item = self._frames.pop()
+                self.stats.frames_dropped += len(self._frames)
+                self._frames.clear()
+        self.last_capture_time = item[1]
+        self.stats.frames_taken += 1
+        self.stats.last_age = time.time() - item[1]
+        self.stats.max_age = max(self.stats.max_age, self.stats.last_age)
+        return item
+
+    def read(self, timeout: Optional[float] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Drop-in for cv2.VideoCapture.read(): wait for a frame and return the newest.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait; None waits until a frame
+                arrives or the source ends
+
+        Returns:
+            tuple: (True, frame), or (False, None) once the source has ended
+            (or on timeout)
+        """
+        with self._ready:
+            self._ready.wait_for(lambda: self._frames or self._ended, timeout)
+        item = self.take()
+        return (False, None) if item is None else (True, item[0])
+
+    def _reader(self) -> None:
+        try:
+            self._read_frames()
+        finally:
+            # Here rather than in stop(), which may give up while a read is still running
+            self.cap.release()
+            with self._ready:
+                self._ended = True
+                self._ready.notify_all()
+
+    def _read_frames(self) -> None:
+        next_read = time.perf_counter()
+        while not self._stopped.is_set():
+            if self.realtime:
+                delay = next_read - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_read += self.frame_interval
+
+            with metrics.timer("decode", camera=self.name):
+                ret, frame = self.cap.read()
+            if not ret:
+                self.logger.info(f"Source {self.name} ended")
+                break
+
+            with self._ready:
+                if len(self._frames) == self._frames.maxlen:
+                    self.stats.frames_dropped += 1
+                self._frames.append((frame, time.time()))
+                self.stats.frames_read += 1
+                self._ready.notify()
@@ -0,0 +1,249 @@
+import abc
+import ast
+import cv2
+import os
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .detections import merge_boxes
+
+BACKENDS = ("auto", "ultralytics", "onnxruntime")
+
+
+class InferenceBackend(abc.ABC):
+    """
+    Runs a detection model on BGR images.
+
+    Subclasses set names (class id -> class name) and implement predict().
+    """
+    names: Dict[int, str]
+
+    @abc.abstractmethod
+    def predict(
+        self,
+        images: List[np.ndarray],
+        iou: float,
+        conf: float,
+        imgsz: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Run the model on a batch of images.
+
+        Args:
+            images (List[np.ndarray]): BGR images, any size
+            iou (float): IoU threshold for non-maximum suppression
+            conf (float): Minimum confidence
+            imgsz (Optional[int]): Longer side of the model input; backend default if None
+
+        Returns:
+            List[np.ndarray]: One (N, 6) [x1, y1, x2, y2, confidence, class_id]
+            array per image, in image coordinates
+        """
+
+
+class UltralyticsBackend(InferenceBackend):
+    def __init__(self, model_path: Path):
+        """
+        Backend using the ultralytics YOLO wrapper (PyTorch, or whatever
+        format ultralytics loads from model_path).
+
+        Args:
+            model_path (Path): Path to the model file
+        """
+        from ultralytics import YOLO  # Imports PyTorch, so only when this backend is used
+        self.model = YOLO(str(model_path))
+        self.names = self.model.model.names
+
+    def predict(self, images: List[np.ndarray], iou: float, conf: float,
+                imgsz: Optional[int] = None) -> List[np.ndarray]:
+        kwargs = {'imgsz': imgsz} if imgsz else {}
+        results = self.model(images, iou=iou, conf=conf, **kwargs)
+        # A single device-to-host transfer per image instead of one per field
+        return [result.boxes.data.cpu().numpy() for result in results]
+
+
+class OnnxRuntimeBackend(InferenceBackend):
+    def __init__(
+        self,
+        model_path: Path,
+        threads: Optional[int] = None,
+        max_detections: int = 300,
+        max_candidates: int = 3000
+    ):
+        """
+        Backend running an exported YOLO .onnx model with ONNX Runtime on CPU.
+
+        Pre-processing (letterbox, BGR to RGB, scaling to 0-1) and
+        post-processing (confidence filter, class-aware NMS, mapping back to
+        image coordinates) are done in NumPy and follow the ultralytics
+        predictor, so results match the ultralytics backend. Models exported
+        with dynamic=True get a stride-aligned rectangular input like the
+        ultralytics predictor; static models use their fixed input size.
+
+        Args:
+            model_path (Path): Path to the .onnx file
+            threads (Optional[int]): Intra-op threads; OMP_NUM_THREADS if set,
+                otherwise the ONNX Runtime default, if None
+            max_detections (int): Maximum boxes kept per image
+            max_candidates (int): Maximum boxes entering NMS per image
+        """
+        import onnxruntime as ort  # Optional dependency, only needed for this backend
+
+        options = ort.SessionOptions()
+        threads = threads or int(os.getenv('OMP_NUM_THREADS', '0') or 0)
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"])
+        self.max_detections = max_detections
+        self.max_candidates = max_candidates
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_dtype = np.float16 if model_input.type == 'tensor(float16)' else np.float32
+        height, width = model_input.shape[2:]
+        self.fixed_shape = (height, width) \
+            if isinstance(height, int) and isinstance(width, int) else None
+
+        # Exported by ultralytics along with the weights
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        if 'names' not in metadata:
+            raise ValueError(f"{model_path} has no class names; export it with ultralytics")
+        self.names = ast.literal_eval(metadata['names'])
+        self.stride = int(metadata.get('stride', 32))
+        self.imgsz = max(ast.literal_eval(metadata.get('imgsz', '[640, 640]')))
+        self._batch: Optional[np.ndarray] = None
+
+    def predict(self, images: List[np.ndarray], iou: float, conf: float,
+                imgsz: Optional[int] = None) -> List[np.ndarray]:
+        if not images:
+            return []
+        blob, transforms = self.preprocess(images, imgsz)
+        output = self.session.run(None, {self.input_name: blob})[0]
+        return [self.postprocess(prediction, iou, conf, gain, pad, image.shape)
+                for prediction, (gain, pad), image in zip(output, transforms, images)]
+
+    def input_shape(self, images: List[np.ndarray], imgsz: Optional[int] = None) -> Tuple[int, int]:
+        """(height, width) of the model input for a batch."""
+        if self.fixed_shape is not None:
+            return self.fixed_shape
+        size = imgsz or self.imgsz
+        shapes = {image.shape[:2] for image in images}
+        if len(shapes) > 1:
+            return size, size  # Mixed sizes share a square input
+        height, width = shapes.pop()
+        ratio = min(size / height, size / width)
+        stride = self.stride
+        return (-(-round(height * ratio) // stride) * stride,
+                -(-round(width * ratio) // stride) * stride)
+
+    def preprocess(self, images: List[np.ndarray], imgsz: Optional[int] = None):
+        """
+        Letterbox images into one NCHW float batch.
+
+        Returns:
+            tuple: (blob, [(gain, (pad_x, pad_y)) per image])
+        """
+        height, width = self.input_shape(images, imgsz)
+        shape = (len(images), height, width, 3)
+        if self._batch is None or self._batch.shape != shape:
+            self._batch = np.empty(shape, dtype=np.uint8)
+        batch = self._batch
+        batch.fill(114)
+
+        transforms = []
+        for image, canvas in zip(images, batch):
+            h, w = image.shape[:2]
+            gain = min(height / h, width / w)
+            new_w, new_h = round(w * gain), round(h * gain)
+            left = round((width - new_w) / 2 - 0.1)
+            top = round((height - new_h) / 2 - 0.1)
+            view = canvas[top:top + new_h, left:left + new_w]
+            if (new_h, new_w) == (h, w):
+                view[:] = image
+            else:
+                cv2.resize(image, (new_w, new_h), dst=view, interpolation=cv2.INTER_LINEAR)
+            transforms.append((gain, (left, top)))
+
+        # BGR HWC uint8 -> RGB CHW float in 0-1
+        blob = np.ascontiguousarray(batch[..., ::-1].transpose(0, 3, 1, 2), dtype=self.input_dtype)
+        blob *= self.input_dtype(1 / 255)
+        return blob, transforms
+
+    def postprocess(
+        self,
+        prediction: np.ndarray,
+        iou: float,
+        conf: float,
+        gain: float,
+        pad: Tuple[int, int],
+        image_shape: Tuple[int, ...]
+    ) -> np.ndarray:
+        """
+        Decode one raw (4 + classes, anchors) output into (N, 6) boxes.
+
+        Args:
+            prediction (np.ndarray): Raw output of one image, [cx, cy, w, h, class scores...]
+            iou (float): NMS IoU threshold
+            conf (float): Minimum confidence
+            gain (float): Letterbox scale factor
+            pad (Tuple[int, int]): Letterbox (x, y) padding
+            image_shape (Tuple[int, ...]): Shape of the original image
+
+        Returns:
+            np.ndarray: (N, 6) [x1, y1, x2, y2, confidence, class_id] in image coordinates
+        """
+        scores = prediction[4:]
+        class_ids = scores.argmax(axis=0)
+        confidences = scores[class_ids, np.arange(scores.shape[1])]
+        candidates = np.flatnonzero(confidences > conf)
+        if candidates.size > self.max_candidates:
+            candidates = candidates[np.argsort(-confidences[candidates])[:self.max_candidates]]
+        if candidates.size == 0:
+            return np.zeros((0, 6), dtype=np.float32)
+
+        cx, cy, w, h = prediction[:4, candidates]
+        boxes = np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], axis=1)
+        keep, _ = merge_boxes(boxes, confidences[candidates], class_ids[candidates], iou)
+        keep = keep[:self.max_detections]
+
+        height, width = image_shape[:2]
+        boxes = (boxes[keep] - np.array(pad * 2)) / gain
+        boxes = np.clip(boxes, 0, [width, height, width, height])
+        return np.column_stack([boxes, confidences[candidates][keep],
+                                class_ids[candidates][keep]]).astype(np.float32)
+
+
+def resolve_backend(model_path: Path, backend: str = "auto") -> str:
+    """Backend name that create_backend would use, with "auto" decided by the file suffix."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend} (expected one of {BACKENDS})")
+    if backend == "auto":
+        return "onnxruntime" if Path(model_path).suffix == ".onnx" else "ultralytics"
+    return backend
+
+
+def create_backend(model_path: Path, backend: str = "auto") -> InferenceBackend:
+    """
+    Create the inference backend for a model.
+
+    Args:
+        model_path (Path): Model file. With backend="onnxruntime" a .pt path is
+            replaced by the .onnx file next to it
+        backend (str): "ultralytics", "onnxruntime", or "auto" to pick by file suffix
+
+    Returns:
+        InferenceBackend: The loaded backend
+    """
+    model_path = Path(model_path)
+    backend = resolve_backend(model_path, backend)
+
+    if backend == "onnxruntime":
+        onnx_path = model_path.with_suffix(".onnx")
+        if not onnx_path.exists():
+            raise FileNotFoundError(
+                f"ONNX model not found: {onnx_path}. "
+                f"Export it with: python -m scripts.export_onnx {model_path.with_suffix('.pt')}")
+        return OnnxRuntimeBackend(onnx_path)
+    return UltralyticsBackend(model_path)
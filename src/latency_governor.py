@@ -0,0 +1,167 @@
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Deque, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class GovernorLevel:
+    """One point on the quality/cost ladder."""
+    target_height: int
+    stride: int = 1                  # Run the model on every stride-th frame
+    tile_size: Optional[int] = None  # Only when the detector tiles
+
+    def describe(self) -> str:
+        text = f"target_height {self.target_height}, stride {self.stride}"
+        return text if self.tile_size is None else f"{text}, tile_size {self.tile_size}"
+
+
+class LatencyGovernor:
+    def __init__(
+        self,
+        detector,
+        target_fps: float,
+        cpu_budget: Optional[float] = None,
+        min_height: int = 320,
+        height_step: int = 64,
+        max_stride: int = 4,
+        tile_growth: Sequence[float] = (1.25, 1.5, 2.0),
+        window: int = 30,
+        low_watermark: float = 0.7,
+        name: str = "governor"
+    ):
+        """
+        Adjust a Detector at runtime to keep per-frame cost within a budget.
+
+        The knobs form a ladder from the configured settings down to the
+        cheapest ones: larger (hence fewer) tiles first when tiling, then a
+        lower target_height, then a larger inference stride. Every frame's
+        wall and CPU time is recorded; after each window of frames the
+        governor steps down when the mean cost exceeds the budget and steps up
+        only when it is below low_watermark times the budget. A step up that
+        has to be undone right away doubles the wait before the next try, so
+        the settings do not oscillate between two levels.
+
+        Args:
+            detector (Detector): Detector whose target_height and tiling are adjusted
+            target_fps (float): Frames per second to keep up with; the wall
+                time budget per frame is 1 / target_fps
+            cpu_budget (Optional[float]): CPU cores the stream may use; the CPU
+                time budget per frame is cpu_budget / target_fps
+            min_height (int): Lowest target_height
+            height_step (int): target_height decrement per level
+            max_stride (int): Largest inference stride
+            tile_growth (Sequence[float]): Tile size factors tried when tiling
+            window (int): Frames measured before each decision
+            low_watermark (float): Share of the budget below which quality is raised
+            name (str): Name used in log messages (e.g. the camera)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.detector = detector
+        self.name = name
+        self.frame_budget = 1.0 / target_fps
+        self.cpu_frame_budget = None if cpu_budget is None else cpu_budget / target_fps
+        self.window = window
+        self.low_watermark = low_watermark
+
+        # Output frames keep their size while target_height changes
+        if detector.output_height is None:
+            detector.output_height = detector.target_height
+        self._base_tiling = detector.tiling
+        self.levels = self._build_levels(min_height, height_step, max_stride, tile_growth)
+        self.level = 0
+
+        self._wall: Deque[float] = deque(maxlen=window)
+        self._cpu: Deque[float] = deque(maxlen=window)
+        self._frame = 0
+        self._backoff = 1       # Windows to wait after a change before stepping up
+        self._waited = 0        # Windows since the last change
+        self._last_step_up: Optional[int] = None  # Level reached by the last step up
+        self.changes = 0
+
+    def _build_levels(self, min_height: int, height_step: int, max_stride: int,
+                      tile_growth: Sequence[float]) -> List[GovernorLevel]:
+        height = self.detector.target_height
+        heights = list(range(height, min(min_height, height) - 1, -height_step))
+        tiling = self._base_tiling
+        tile_sizes = [None]
+        if tiling is not None:
+            tile_sizes = [tiling.tile_size] + [
+                -(-int(tiling.tile_size * factor) // 32) * 32 for factor in tile_growth]
+
+        levels = [GovernorLevel(height, 1, tile_size) for tile_size in tile_sizes]
+        levels += [GovernorLevel(h, 1, tile_sizes[-1]) for h in heights[1:]]
+        levels += [GovernorLevel(heights[-1], stride, tile_sizes[-1])
+                   for stride in range(2, max_stride + 1)]
+        return levels
+
+    @property
+    def settings(self) -> GovernorLevel:
+        return self.levels[self.level]
+
+    def should_infer(self) -> bool:
+        """Call once per frame; False on frames the current stride skips."""
+        self._frame += 1
+        return (self._frame - 1) % self.settings.stride == 0
+
+    @contextmanager
+    def measure(self):
+        """Time one frame's processing (inferred or not) and record it."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - wall, time.process_time() - cpu)
+
+    def record(self, wall_seconds: float, cpu_seconds: Optional[float] = None) -> None:
+        """Record the cost of one frame and adjust the settings after each window."""
+        self._wall.append(wall_seconds)
+        if cpu_seconds is not None:
+            self._cpu.append(cpu_seconds)
+        if len(self._wall) < self.window:
+            return
+
+        wall = sum(self._wall) / len(self._wall)
+        load = wall / self.frame_budget
+        reason = f"{wall * 1000:.0f} ms/frame vs {self.frame_budget * 1000:.0f} ms budget"
+        if self.cpu_frame_budget is not None and self._cpu:
+            cpu = sum(self._cpu) / len(self._cpu)
+            if cpu / self.cpu_frame_budget > load:
+                load = cpu / self.cpu_frame_budget
+                reason = (f"{cpu * 1000:.0f} ms CPU/frame vs "
+                          f"{self.cpu_frame_budget * 1000:.0f} ms CPU budget")
+
+        if load > 1.0 and self.level < len(self.levels) - 1:
+            if self._last_step_up == self.level:
+                # The last step up did not hold: wait twice as long before the next
+                self._backoff = min(self._backoff * 2, 16)
+            self._apply(self.level + 1, f"over budget: {reason}")
+        elif load < self.low_watermark and self.level > 0 and self._waited >= self._backoff:
+            self._apply(self.level - 1, f"headroom: {reason}")
+            self._last_step_up = self.level
+        else:
+            self._waited += 1
+            if load <= 1.0:
+                self._last_step_up = None
+            if self._waited >= 4 * self._backoff:
+                self._backoff = max(1, self._backoff // 2)  # Long stable stretch
+            self._wall.clear()
+            self._cpu.clear()
+
+    def _apply(self, level: int, reason: str) -> None:
+        before, after = self.settings, self.levels[level]
+        self.level = level
+        self.changes += 1
+        self._waited = 0
+        self._last_step_up = None
+        self.detector.target_height = after.target_height
+        if self._base_tiling is not None and after.tile_size is not None:
+            # Larger tiles at the original model input size: fewer, cheaper-per-pixel tiles
+            self.detector.tiling = replace(self._base_tiling, tile_size=after.tile_size,
+                                           input_size=self._base_tiling.input_size
+                                           or self._base_tiling.tile_size)
+        self._wall.clear()
+        self._cpu.clear()
+        self.logger.info(f"{self.name}: {before.describe()} -> {after.describe()} ({reason})")
@@ -2,10 +2,53 @@ import cv2
 import logging
 import sys
 from pathlib import Path
-from config import Config, setup_logging
-from fire_detector import Detector
-from notification_service import NotificationService
 import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Iterable
+
+# Allow running as `python src/main.py` while importing the modules as a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.config import Config, setup_logging
+from src.fire_detector import Detector
+from src.frame_cache import FrameCache
+from src.metrics import metrics
+from src.notification_service import NotificationService
+from src.stream_scheduler import StreamScheduler
+from src.tracing import tracer
+
+
+@dataclass
+class CameraAlertState:
+    """Alert cooldown state kept separately for each camera."""
+    last_alert_time: float = 0
+    next_detection_to_report: str = "any"  # "Fire" or "Smoke"
+    alerted_tracks: Deque[int] = field(default_factory=lambda: deque(maxlen=256))
+
+    def should_alert(self, detection: str, current_time: float, cooldown: float) -> bool:
+        """Return True and update state if this detection should raise an alert."""
+        if (self.next_detection_to_report == "any" or detection == self.next_detection_to_report) \
+                and (current_time - self.last_alert_time) > cooldown:
+            self.last_alert_time = current_time
+            self.next_detection_to_report = "Smoke" if detection == "Fire" else "Fire"
+            return True
+        return False
+
+    def should_alert_tracks(self, track_ids: Iterable[int], current_time: float,
+                            cooldown: float) -> bool:
+        """
+        Return True and remember the ids if any tracked object was not alerted
+        yet and the last alert of this camera is more than cooldown seconds ago.
+
+        New ids seen during the cooldown are not remembered, so they still
+        raise an alert once it is over.
+        """
+        new = [track_id for track_id in track_ids if track_id not in self.alerted_tracks]
+        if not new or (current_time - self.last_alert_time) <= cooldown:
+            return False
+        self.alerted_tracks.extend(new)
+        self.last_alert_time = current_time
+        return True
 
 
 def main():
@@ -19,6 +62,10 @@ def main():
         # Config.validate()
         logger.debug("Configuration validation successful")
 
+        if Config.METRICS_PORT:
+            metrics.serve(Config.METRICS_PORT, Config.METRICS_HOST)
+        tracer.export_path = Path(Config.TRACE_FILE) if Config.TRACE_FILE else None
+
         # Initialize services
         notification_service = NotificationService(Config)
         logger.info("Initialized notification services")
@@ -30,56 +77,90 @@ def main():
         # logger.info("System self-test passed")
 
         # Initialize detection components
-        detector = Detector(Config.MODEL_PATH, iou_threshold=0.20)
+        frame_cache = FrameCache(max_entries=8 * len(Config.VIDEO_SOURCES),
+                                 max_distance=Config.FRAME_CACHE_MAX_DISTANCE,
+                                 ttl=Config.FRAME_CACHE_TTL) if Config.FRAME_CACHE else None
+        detector = Detector(Config.MODEL_PATH, iou_threshold=0.20,
+                            backend=Config.INFERENCE_BACKEND, frame_cache=frame_cache)
         logger.info(f"Loaded detection model: {Config.MODEL_PATH.name}")
+        detector.warmup(batch_size=min(Config.MAX_BATCH_SIZE, len(Config.VIDEO_SOURCES)))
+        if Config.MODEL_HOT_RELOAD:
+            # New weights are loaded in the background and swapped in between frames
+            detector.model_handle.watch(Config.MODEL_RELOAD_INTERVAL)
 
-        # Video processing setup
-        cap = cv2.VideoCapture(str(Config.VIDEO_SOURCE))
-        # cap = cv2.VideoCapture(0) # for webcam
-        if not cap.isOpened():
-            logger.error(f"Failed to open video source: {Config.VIDEO_SOURCE}")
-            sys.exit(1)
-        logger.info(f"Processing video source: {Config.VIDEO_SOURCE}")
+        # Video processing setup: one reader thread per camera, one shared model
+        scheduler = StreamScheduler.from_config(detector, Config).start()
+        logger.info(f"Processing video sources: {', '.join(Config.VIDEO_SOURCES)}")
 
         # State management
         alert_cooldown = Config.ALERT_COOLDOWN  # Seconds between alerts
-        last_alert_time = 0
+        alert_states = {name: CameraAlertState() for name in scheduler.sources}
+        last_stats_time = time.time()
 
-        next_detection_to_report = "any"  # "Fire" or "Smoke"
         # Main processing loop
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                logger.info("✅ Video processing completed")
-                break
+        for result in scheduler:
+            camera, detection = result.source, result.detection
+            # Decode, queueing and inference since the frame was read
+            trace = tracer.start(camera, result.capture_time)
+            trace.record("detect", result.capture_time)
+
+            # Drawing only happens here, for the display and alert image
+            with metrics.timer("annotate", camera=camera), trace.span("annotate"):
+                processed_frame = detector.annotate(
+                    detector.resize_frame(result.frame), result.detections)
 
-            # Detection pipeline
-            processed_frame, detection = detector.process_frame(frame)
+            # Alert logic: once per tracked object when tracking (still at most
+            # one alert per TRACK_ALERT_COOLDOWN, as flicker keeps producing new
+            # ids), otherwise with a per-camera cooldown
+            decided = time.time()
+            if result.detections.track_ids is not None:
+                should_alert = detection is not None and alert_states[camera].should_alert_tracks(
+                    (track_id for track_id, class_id
+                     in zip(result.detections.track_ids, result.detections.class_ids)
+                     if detector.names[class_id].lower() == detection.lower()),
+                    time.time(), Config.TRACK_ALERT_COOLDOWN)
+            else:
+                should_alert = detection is not None and alert_states[camera].should_alert(
+                    detection, time.time(), alert_cooldown)
+            if should_alert:
+                trace.alert(decided)
+                logger.warning(f"🐦‍🔥 {detection} Detected on {camera}! Queueing alert")
+                with metrics.timer("alert_dispatch", camera=camera):
+                    notification_service.send_alert(processed_frame, detection, trace)
+                metrics.inc("alerts_total", camera=camera, detection=detection)
 
-            # Alert logic with cooldown
-            if detection:
-                current_time = time.time()
-                if (next_detection_to_report == "any" or detection == next_detection_to_report) \
-                        and (current_time - last_alert_time) > alert_cooldown:
-                    logger.warning(f"🐦‍🔥 {detection} Detected! Queueing alert")
-                    notification_service.send_alert(processed_frame, detection)
-                    last_alert_time = current_time
-                    next_detection_to_report = "Smoke" if detection == "Fire" else "Fire"
+            if time.time() - last_stats_time > 10:
+                scheduler.log_stats()
+                if frame_cache is not None:
+                    logger.info(f"Frame cache: {frame_cache.stats.hits} hits, "
+                                f"{frame_cache.stats.misses} misses "
+                                f"(hit rate {frame_cache.stats.hit_rate:.1%})")
+                last_stats_time = time.time()
 
             # Display output
-            cv2.imshow("Fire Detection System", processed_frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
+            with metrics.timer("display", camera=camera):
+                cv2.imshow(f"Fire Detection System - {camera}", processed_frame)
+                key = cv2.waitKey(1) & 0xFF
+            if key == ord("q"):
                 logger.info("🛑 User initiated shutdown")
                 break
+        else:
+            logger.info("✅ Video processing completed")
 
     except Exception as e:
         logger.critical(f"🚨 Critical system failure: {str(e)}")
         sys.exit(1)
     finally:
         # Cleanup resources
-        if 'cap' in locals():
-            cap.release()
+        if 'scheduler' in locals():
+            scheduler.stop()
         cv2.destroyAllWindows()
+        if 'notification_service' in locals():
+            notification_service.executor.shutdown(wait=True)  # Let queued alerts finish
+        tracer.log_summary()
+        if tracer.export_path is not None:
+            tracer.write_summary(tracer.export_path.with_suffix('.summary.json'))
+        metrics.stop()
         logger.info("🛑 System shutdown complete")
 
 
@@ -0,0 +1,221 @@
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+# Seconds; covers a fast resize up to a slow CPU inference
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+QUANTILES = (0.5, 0.95, 0.99)
+
+Labels = Tuple[Tuple[str, str], ...]
+_NULL_TIMER = nullcontext()
+
+
+class RollingHistogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = 512):
+        """
+        Latency histogram with cumulative buckets and a window of recent values.
+
+        The buckets, sum and count only grow, as Prometheus expects of a
+        histogram. The last window observations give rolling quantiles that
+        describe the current state without a Prometheus server.
+
+        Args:
+            buckets (Sequence[float]): Upper bounds in seconds, ascending
+            window (int): Recent observations kept for quantiles
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.recent.append(value)
+
+    def quantiles(self, quantiles: Sequence[float] = QUANTILES) -> Dict[float, float]:
+        """Quantiles of the recent window (nearest rank)."""
+        values = sorted(self.recent)
+        if not values:
+            return {q: 0.0 for q in quantiles}
+        return {q: values[min(len(values) - 1, int(q * len(values)))] for q in quantiles}
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in pairs)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + '}'
+
+
+class Metrics:
+    def __init__(self, prefix: str = "flareguard", enabled: bool = False):
+        """
+        Process-wide stage timings, counters and gauges.
+
+        Disabled by default: timer() then returns a shared no-op context
+        manager and the other methods return immediately, so instrumented
+        code pays one attribute check per call. serve() enables collection
+        and exposes everything at /metrics in the Prometheus text format.
+
+        Stage timings go to one histogram, <prefix>_stage_seconds, labelled
+        with the stage name and any labels given (e.g. camera).
+
+        Args:
+            prefix (str): Prefix of every metric name
+            enabled (bool): Collect from the start
+        """
+        self.logger = logging.getLogger(__name__)
+        self.prefix = prefix
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: Dict[Labels, RollingHistogram] = {}
+        self._values: Dict[Tuple[str, str, Labels], float] = {}  # (name, kind, labels)
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def timer(self, stage: str, **labels):
+        """Context manager recording the duration of a stage."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(stage, labels)
+
+    @contextmanager
+    def _timer(self, stage: str, labels: Dict[str, object]):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def observe(self, stage: str, seconds: float, **labels) -> None:
+        """Record a duration measured elsewhere."""
+        if not self.enabled:
+            return
+        key = _labels({'stage': stage, **labels})
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = RollingHistogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Add to a counter (name should end in _total)."""
+        if not self.enabled:
+            return
+        key = (name, 'counter', _labels(labels))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name: str, value: float, kind: str = "gauge", **labels) -> None:
+        """Set a gauge, or a counter kept elsewhere (kind="counter")."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._values[(name, kind, _labels(labels))] = value
+
+    def quantiles(self, stage: str, **labels) -> Dict[float, float]:
+        """Rolling quantiles of a stage, e.g. for log lines."""
+        histogram = self._histograms.get(_labels({'stage': stage, **labels}))
+        return histogram.quantiles() if histogram else {q: 0.0 for q in QUANTILES}
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        stage = f'{self.prefix}_stage_seconds'
+        recent = f'{self.prefix}_stage_recent_seconds'
+        lines: List[str] = []
+        with self._lock:
+            if self._histograms:
+                lines += [f'# HELP {stage} Time spent in each processing stage',
+                          f'# TYPE {stage} histogram']
+                for labels, histogram in sorted(self._histograms.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),),
+                                            histogram.counts):
+                        cumulative += count
+                        le = '+Inf' if bound == float('inf') else repr(bound)
+                        lines.append(f'{stage}_bucket{_format_labels(labels, ("le", le))} '
+                                     f'{cumulative}')
+                    lines.append(f'{stage}_sum{_format_labels(labels)} {histogram.sum}')
+                    lines.append(f'{stage}_count{_format_labels(labels)} {histogram.count}')
+
+                lines += [f'# HELP {recent} Stage time over the last '
+                          f'{next(iter(self._histograms.values())).recent.maxlen} observations',
+                          f'# TYPE {recent} summary']
+                for labels, histogram in sorted(self._histograms.items()):
+                    for q, value in histogram.quantiles().items():
+                        lines.append(f'{recent}{_format_labels(labels, ("quantile", str(q)))} '
+                                     f'{value}')
+                    lines.append(f'{recent}_sum{_format_labels(labels)} {sum(histogram.recent)}')
+                    lines.append(f'{recent}_count{_format_labels(labels)} '
+                                 f'{len(histogram.recent)}')
+
+            typed = set()
+            for (name, kind, labels), value in sorted(self._values.items()):
+                full_name = f'{self.prefix}_{name}'
+                if full_name not in typed:
+                    lines.append(f'# TYPE {full_name} {kind}')
+                    typed.add(full_name)
+                lines.append(f'{full_name}{_format_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Enable collection and serve /metrics on a background thread.
+
+        Args:
+            port (int): TCP port (0 picks a free one; see server.server_port)
+            host (str): Interface to bind; local only by default
+
+        Returns:
+            ThreadingHTTPServer: The running server
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # One line per scrape would flood the logs
+
+        self.enabled = True
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name='metrics-http',
+                         daemon=True).start()
+        self.logger.info(f"Serving metrics at http://{host}:{self._server.server_port}/metrics")
+        return self._server
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._values.clear()
+
+
+metrics = Metrics()
@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .inference_backends import InferenceBackend, create_backend, resolve_backend
+
+
+class ModelHandle:
+    def __init__(self, model_path: Path, backend: str = "auto"):
+        """
+        A loaded model shared by every Detector using the same weights and backend.
+
+        Calls are serialized with a lock, since neither backend is safe to
+        call from several threads at once. reload() loads and warms up new
+        weights on a background thread and swaps them in between two calls,
+        so callers never wait for a load and no frame is dropped.
+
+        Args:
+            model_path (Path): Model file
+            backend (str): Backend name passed to create_backend
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model_path = Path(model_path)
+        self.backend_name = backend
+        self.version = 1
+        self._lock = threading.Lock()
+        self._reloading = threading.Lock()
+        self._backend = create_backend(self.model_path, backend)
+        self._mtime = self._file_mtime()
+        self._last_inputs: Optional[Tuple[List[Tuple[int, ...]], Optional[int]]] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+
+    @property
+    def backend(self) -> InferenceBackend:
+        """The backend currently serving calls."""
+        return self._backend
+
+    @property
+    def names(self) -> Dict[int, str]:
+        return self._backend.names
+
+    @property
+    def weights_path(self) -> Path:
+        """File the backend actually loads (the .onnx for onnxruntime)."""
+        if self.backend_name == "onnxruntime" or self.model_path.suffix == ".onnx":
+            return self.model_path.with_suffix(".onnx")
+        return self.model_path
+
+    def _file_mtime(self) -> float:
+        try:
+            return self.weights_path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def predict(self, images: List[np.ndarray], iou: float, conf: float,
+                imgsz: Optional[int] = None) -> List[np.ndarray]:
+        """Run the current backend; see InferenceBackend.predict."""
+        with self._lock:
+            self._last_inputs = ([image.shape for image in images], imgsz)
+            return self._backend.predict(images, iou, conf, imgsz)
+
+    def reload(self, wait: bool = False) -> threading.Thread:
+        """
+        Load the weights again in the background and swap them in when ready.
+
+        The new model is warmed up with the shapes of the last call before the
+        swap. A reload that fails, or whose class names differ from the
+        current model, is logged and the current model is kept; the file is
+        then not tried again by watch() until it changes once more.
+
+        Args:
+            wait (bool): Block until the reload finished
+
+        Returns:
+            threading.Thread: The loader thread
+        """
+        thread = threading.Thread(target=self._reload, name=f"reload-{self.model_path.name}",
+                                  daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+        return thread
+
+    def _reload(self) -> None:
+        if not self._reloading.acquire(blocking=False):
+            return  # A reload is already in progress
+        mtime = self._file_mtime()
+        try:
+            start = time.perf_counter()
+            backend = create_backend(self.model_path, self.backend_name)
+            if backend.names != self._backend.names:
+                self.logger.error(f"Not swapping {self.weights_path}: classes changed "
+                                  f"from {self._backend.names} to {backend.names}")
+                self._mtime = mtime
+                return
+
+            # Warm up outside the lock, so the current model keeps serving meanwhile
+            if self._last_inputs is not None:
+                shapes, imgsz = self._last_inputs
+                dummies = [np.zeros(shape, dtype=np.uint8) for shape in shapes]
+                for _ in range(2):
+                    backend.predict(dummies, 0.5, 0.5, imgsz)
+
+            with self._lock:  # Between two calls
+                self._backend = backend
+                self._mtime = mtime
+                self.version += 1
+            self.logger.info(f"Swapped in {self.weights_path.name} (version {self.version}) "
+                             f"after {time.perf_counter() - start:.2f}s load and warm-up")
+        except Exception as e:
+            self.logger.error(f"Failed to reload {self.weights_path}: {e}")
+            self._mtime = mtime  # Do not retry the same broken file on every poll
+        finally:
+            self._reloading.release()
+
+    def watch(self, interval: float = 5.0) -> None:
+        """
+        Poll the weights file and reload() when it changes.
+
+        A change is acted on once the modification time has been stable for
+        one interval, so a file that is still being copied is not loaded.
+
+        Args:
+            interval (float): Seconds between checks
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,),
+                                         name=f"watch-{self.model_path.name}", daemon=True)
+        self._watcher.start()
+        self.logger.info(f"Watching {self.weights_path} for new weights every {interval}s")
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=2)
+
+    def _watch(self, interval: float) -> None:
+        seen = self._mtime
+        while not self._stop_watching.wait(interval):
+            mtime = self._file_mtime()
+            if mtime and mtime != self._mtime and mtime == seen:
+                self.reload(wait=True)
+            seen = mtime
+
+
+class ModelRegistry:
+    def __init__(self):
+        """
+        Process-wide cache of ModelHandles keyed by (resolved path, resolved backend).
+
+        Each model is loaded under its own lock, so loading one model does not
+        block getting another.
+        """
+        self._lock = threading.Lock()
+        self._handles: Dict[Tuple[Path, str], ModelHandle] = {}
+        self._loading: Dict[Tuple[Path, str], threading.Lock] = {}
+
+    def get(self, model_path: Path, backend: str = "auto") -> ModelHandle:
+        """Return the shared handle for a model, loading it on first use."""
+        key = (Path(model_path).resolve(), resolve_backend(model_path, backend))
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:
+                return handle
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:  # Only callers of the same model wait for its load
+            with self._lock:
+                handle = self._handles.get(key)
+            if handle is None:
+                handle = ModelHandle(*key)
+                with self._lock:
+                    self._handles[key] = handle
+            return handle
+
+    def clear(self) -> None:
+        """Forget all handles (models stay alive while Detectors use them)."""
+        with self._lock:
+            for handle in self._handles.values():
+                handle.stop_watching()
+            self._handles.clear()
+            self._loading.clear()
+
+
+registry = ModelRegistry()
@@ -0,0 +1,105 @@
+import cv2
+import numpy as np
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class GateStats:
+    frames: int = 0
+    skipped: int = 0  # Frames where inference was skipped
+    forced: int = 0   # Inferences forced by the minimum interval
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of frames that skipped inference."""
+        return self.skipped / self.frames if self.frames else 0.0
+
+
+class MotionGate:
+    def __init__(
+        self,
+        width: int = 160,
+        pixel_threshold: int = 25,
+        min_changed_fraction: float = 0.002,
+        max_skip_frames: int = 30,
+        max_skip_seconds: Optional[float] = None
+    ):
+        """
+        Cheap change detector that decides whether a frame needs inference.
+
+        Each frame is shrunk to a small, blurred grayscale copy and compared
+        with the copy taken at the last inference. Comparing against the last
+        inferred frame (rather than the previous frame) means slow changes such
+        as thin smoke building up still accumulate until they cross the
+        threshold.
+
+        Args:
+            width (int): Width of the downscaled comparison image
+            pixel_threshold (int): Gray-level difference for a pixel to count as changed
+            min_changed_fraction (float): Share of changed pixels that triggers inference
+            max_skip_frames (int): Force an inference after this many skipped frames
+            max_skip_seconds (Optional[float]): Also force one after this many seconds
+        """
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_fraction = min_changed_fraction
+        self.max_skip_frames = max_skip_frames
+        self.max_skip_seconds = max_skip_seconds
+        self.stats = GateStats()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the reference frame so the next frame is always inferred."""
+        self._reference: Optional[np.ndarray] = None
+        self._skipped_since_infer = 0
+        self._last_infer_time = 0.0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        height, width = frame.shape[:2]
+        size = (self.width, max(1, round(height * self.width / width)))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(small, (5, 5), 0)
+
+    def changed_fraction(self, thumbnail: np.ndarray) -> float:
+        """Share of pixels that differ from the reference by more than pixel_threshold."""
+        if self._reference is None or self._reference.shape != thumbnail.shape:
+            return 1.0
+        diff = cv2.absdiff(thumbnail, self._reference)
+        changed = cv2.countNonZero(cv2.threshold(
+            diff, self.pixel_threshold, 255, cv2.THRESH_BINARY)[1])
+        return changed / diff.size
+
+    def should_infer(self, frame: np.ndarray) -> bool:
+        """
+        Decide whether to run the model on this frame.
+
+        Args:
+            frame (np.ndarray): Input frame
+
+        Returns:
+            bool: True to run inference, False to re-use the last result
+        """
+        self.stats.frames += 1
+        thumbnail = self._thumbnail(frame)
+        now = time.monotonic()
+
+        moved = self.changed_fraction(thumbnail) >= self.min_changed_fraction
+        overdue = self._skipped_since_infer >= self.max_skip_frames or (
+            self.max_skip_seconds is not None
+            and now - self._last_infer_time >= self.max_skip_seconds)
+
+        if moved or overdue:
+            if not moved:
+                self.stats.forced += 1
+            self._reference = thumbnail
+            self._skipped_since_infer = 0
+            self._last_infer_time = now
+            return True
+
+        self._skipped_since_infer += 1
+        self.stats.skipped += 1
+        return False
@@ -15,6 +15,9 @@ from dotenv import load_dotenv
 from urllib.parse import quote_plus
 from filelock import FileLock
 from io import BytesIO
+from typing import Optional
+
+from .tracing import Trace, span
 
 
 # Setup environment and logging
@@ -72,8 +75,12 @@ class NotificationService:
         cv2.imwrite(str(filename), frame)
         return filename
 
-    def upload_image(self, image_path: Path) -> str:
+    def upload_image(self, image_path: Path, trace: Optional[Trace] = None) -> str:
         """Upload image to Imgur CDN"""
+        with span(trace, "upload_image", channel="whatsapp"):
+            return self._upload_image(image_path)
+
+    def _upload_image(self, image_path: Path) -> str:
         # If the IMGUR client ID is missing or set to a test placeholder,
         # return a deterministic local URL to avoid external network calls
         # during unit tests or local development.
@@ -96,15 +103,18 @@ class NotificationService:
             logger.error(f"Image upload failed: {str(e)}")
             return None
 
-    def send_alert(self, frame, detection: str = "Fire") -> bool:
-        """Non-blocking alert dispatch"""
-        image_path = self.save_frame(frame)
+    def send_alert(self, frame, detection: str = "Fire", trace: Optional[Trace] = None) -> bool:
+        """Non-blocking alert dispatch; trace, if given, follows the alert to delivery"""
+        with span(trace, "save_frame"):
+            image_path = self.save_frame(frame)
 
         # Submit to background thread
         future = self.executor.submit(
             self._send_alerts_async,
             image_path,
-            detection
+            detection,
+            trace,
+            time.time()
         )
 
         # Error logging callback
@@ -115,16 +125,25 @@ class NotificationService:
 
         return True  # Immediate success assumption
 
-    def _send_alerts_async(self, image_path, detection):
+    def _send_alerts_async(self, image_path, detection, trace=None, submitted=None):
         """Background alert processing"""
+        if trace is not None and submitted is not None:
+            trace.record("executor_queue", submitted)
         if self.whatsapp_enabled:
-            self._send_whatsapp_alert(image_path, detection)
+            sent = False
+            try:
+                sent = self._send_whatsapp_alert(image_path, detection, trace)
+            finally:
+                if trace is not None:
+                    trace.delivered("whatsapp", sent)
         if self.telegram_bot:
-            self._send_telegram_alert(image_path, detection)
+            sent = self._send_telegram_alert(image_path, detection, trace)
+            if trace is not None:
+                trace.delivered("telegram", bool(sent))
 
-    def _send_whatsapp_alert(self, image_path, detection):
+    def _send_whatsapp_alert(self, image_path, detection, trace=None):
         """Handle WhatsApp notification flow"""
-        image_url = self.upload_image(image_path)
+        image_url = self.upload_image(image_path, trace)
         if not image_url:
             logger.error("WhatsApp alert skipped: Image upload failed")
             return False
@@ -136,7 +155,8 @@ class NotificationService:
             f"text={encoded_msg}&" \
             f"apikey={os.getenv('CALLMEBOT_API_KEY')}"
 
-        response = requests.get(url, timeout=15)
+        with span(trace, "whatsapp_send", channel="whatsapp"):
+            response = requests.get(url, timeout=15)
         if response.status_code == 200:
             logger.info("WhatsApp alert delivered")
             return True
@@ -144,7 +164,7 @@ class NotificationService:
             f"WhatsApp Alert Attempt failed: HTTP {response.status_code}")
         return False
 
-    def _send_telegram_alert(self, image_path, detection):
+    def _send_telegram_alert(self, image_path, detection, trace=None):
         """Handle Telegram notification with proper loop management"""
         try:
             if not self.loop.is_running():
@@ -152,7 +172,8 @@ class NotificationService:
                 return self.loop.run_until_complete(
                     self.telegram_bot.send_alert(
                         image_path=image_path,
-                        caption=f"🚨 {detection} Detected!"
+                        caption=f"🚨 {detection} Detected!",
+                        trace=trace
                     )
                 )
         except Exception as e:
@@ -338,7 +359,8 @@ class FlareGuardBot:
                 id for id in self.chat_ids if id not in invalid_ids]
             self._save_chat_ids()
 
-    async def send_alert(self, image_path: Path, caption: str) -> bool:
+    async def send_alert(self, image_path: Path, caption: str,
+                         trace: Optional[Trace] = None) -> bool:
         """Send alert to all registered chats with retry logic and invalid chat cleanup"""
         if not image_path.exists():
             self.logger.error(f"Alert image missing: {image_path}")
@@ -360,14 +382,15 @@ class FlareGuardBot:
                         photo = BytesIO(image_data)
                         photo.name = 'image.jpg'  # Telegram requires a name
 
-                        async with self.bot:  # Create new session for each chat
-                            await self.bot.send_photo(
-                                chat_id=chat_id,
-                                photo=photo,
-                                caption=caption,
-                                parse_mode='Markdown',
-                                pool_timeout=20
-                            )
+                        with span(trace, "telegram_send", channel="telegram"):
+                            async with self.bot:  # Create new session for each chat
+                                await self.bot.send_photo(
+                                    chat_id=chat_id,
+                                    photo=photo,
+                                    caption=caption,
+                                    parse_mode='Markdown',
+                                    pool_timeout=20
+                                )
                         self.logger.info(
                             f"Alert sent to Telegram chat {chat_id}")
                         sent = True
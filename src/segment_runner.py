@@ -0,0 +1,326 @@
+import cv2
+import logging
+import multiprocessing as mp
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .forensic_scan import ForensicScanner, Hit, ScanEvent
+
+
+@dataclass
+class Segment:
+    index: int
+    start: int          # First frame written
+    end: int            # One past the last frame written
+    warmup_start: int   # First frame processed; frames before start only warm up state
+
+    @property
+    def frames(self) -> int:
+        return self.end - self.start
+
+
+def plan_segments(frame_count: int, segments: int, overlap: int) -> List[Segment]:
+    """
+    Split frames 0..frame_count-1 into contiguous, near-equal segments.
+
+    Args:
+        frame_count (int): Frames in the video
+        segments (int): Number of segments (fewer if there are fewer frames)
+        overlap (int): Frames before each segment processed but not written
+
+    Returns:
+        List[Segment]: Segments in order, together covering every frame once
+    """
+    segments = max(1, min(segments, frame_count))
+    bounds = [round(i * frame_count / segments) for i in range(segments + 1)]
+    return [Segment(i, start, end, max(0, start - overlap))
+            for i, (start, end) in enumerate(zip(bounds, bounds[1:]))]
+
+
+@dataclass
+class SegmentResult:
+    index: int
+    path: Path          # Annotated segment video
+    frames: int         # Frames written
+    warmup_frames: int  # Overlap frames processed before start
+    timeline: Dict[int, Hit]  # Frame index -> (detection, top confidence)
+    seconds: float      # Processing time in the worker, model load excluded
+    first_frame: int = 0  # First frame read; warmup_start unless the video ended before
+
+
+@dataclass
+class SegmentReport:
+    segments: List[SegmentResult]
+    events: List[ScanEvent]
+    fps: float
+    seconds: float  # Wall time of the whole run, model loads included
+    timeline: Dict[int, Hit] = field(default_factory=dict)
+
+    @property
+    def frames(self) -> int:
+        return sum(result.frames for result in self.segments)
+
+    @property
+    def work_seconds(self) -> float:
+        """Time the segments took in total: roughly the sequential run time."""
+        return sum(result.seconds for result in self.segments)
+
+    def log(self, logger: logging.Logger) -> None:
+        for result in self.segments:
+            logger.info(f"Segment {result.index}: {result.frames} frames "
+                        f"(+{result.warmup_frames} overlap) in {result.seconds:.1f}s")
+        logger.info(f"{len(self.segments)} segments, {self.frames} frames in "
+                    f"{self.seconds:.1f}s wall ({self.frames / self.seconds:.1f} FPS); "
+                    f"segment work {self.work_seconds:.1f}s")
+
+
+def _seek(cap: cv2.VideoCapture, target: int, step: int = 250) -> int:
+    """
+    Position cap exactly on frame target.
+
+    Seeking by CAP_PROP_POS_FRAMES can land past the requested frame (it
+    goes to a keyframe, and some containers index inaccurately), which
+    would silently skip frames. A landing past target is retried step
+    frames (about one GOP) earlier, down to frame 0, and the capture then
+    grab()s forward to target.
+
+    Returns:
+        int: Frame the next read() returns; below target only if the video
+        ends first
+
+    Raises:
+        IOError: If even a seek to frame 0 lands past target
+    """
+    position = target
+    while True:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, position)
+        landed = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if landed <= target:
+            break
+        if position == 0:
+            raise IOError(f"Cannot seek to frame {target}: landed on frame {landed}")
+        position = max(0, position - step)
+    while landed < target and cap.grab():
+        landed += 1
+    return landed
+
+
+def _process_segment(video: Path, segment: Segment, out_dir: Path, model_path: Path,
+                     detector_kwargs: dict, track: bool, max_keyframe_interval: int,
+                     threads: Optional[int]) -> SegmentResult:
+    """Worker: annotate one segment into its own file, warming state on the overlap."""
+    if threads:
+        # Before torch / onnxruntime start their thread pools
+        os.environ['OMP_NUM_THREADS'] = str(threads)
+    from .fire_detector import Detector
+    from .tracker import KeyframePolicy, KeyframeTracker
+
+    detector = Detector(model_path, **detector_kwargs)
+    tracker = KeyframeTracker(detector, policy=KeyframePolicy(
+        max_interval=max_keyframe_interval)) if track else None
+    cap = cv2.VideoCapture(str(video))
+    if not cap.isOpened():
+        raise IOError(f"Failed to open input: {video}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+    detector.warmup((int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                     int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))))
+
+    start = time.perf_counter()
+    index = _seek(cap, segment.warmup_start) if segment.warmup_start else 0
+    first_frame = index
+    path = out_dir / f"segment_{segment.index:03d}.mp4"
+    writer = None
+    timeline = {}
+    try:
+        while index < segment.end:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            detections = tracker.detect(frame) if tracker is not None else detector.detect(frame)
+            if index >= segment.start:
+                if detections.detection:
+                    timeline[index] = (detections.detection,
+                                       float(detections.confidences.max(initial=0)))
+                processed = detector.annotate(detector.output_frame(frame), detections)
+                if writer is None:
+                    h, w = processed.shape[:2]
+                    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'),
+                                             fps, (w, h))
+                    if not writer.isOpened():
+                        raise IOError(f"Failed to open video writer for {path}")
+                writer.write(processed)
+            index += 1
+    finally:
+        cap.release()
+        if writer is not None:
+            writer.release()
+    return SegmentResult(segment.index, path, max(0, index - max(segment.start, first_frame)),
+                         max(0, min(index, segment.start) - first_frame), timeline,
+                         time.perf_counter() - start, first_frame)
+
+
+class SegmentRunner:
+    def __init__(
+        self,
+        model_path: Path,
+        segments: int,
+        workers: Optional[int] = None,
+        overlap: int = 15,
+        threads_per_worker: Optional[int] = 1,
+        track: bool = False,
+        max_keyframe_interval: int = 8,
+        **detector_kwargs
+    ):
+        """
+        Annotate one long video as parallel time segments.
+
+        The video is split into segments of consecutive frames; each worker
+        process seeks to its segment, processes overlap frames before it
+        without writing them (so tracks and other per-stream state are warm
+        at the cut), and writes its frames to its own file. stitch() then
+        concatenates the files in order, without re-encoding them when ffmpeg
+        is available. Detections of all segments form one
+        timeline, grouped into events the way ForensicScanner groups hits.
+
+        Args:
+            model_path (Path): Model file
+            segments (int): Number of segments
+            workers (Optional[int]): Worker processes; defaults to segments
+            overlap (int): Frames processed before each segment's first frame
+            threads_per_worker (Optional[int]): Inference threads per worker
+            track (bool): Run the model on keyframes only and track in between
+            max_keyframe_interval (int): With track, longest gap between keyframes
+            **detector_kwargs: Passed to each worker's Detector (e.g. backend, tiling)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model_path = model_path
+        self.segments = max(1, segments)
+        self.workers = workers or self.segments
+        self.overlap = overlap
+        self.threads_per_worker = threads_per_worker
+        self.track = track
+        self.max_keyframe_interval = max_keyframe_interval
+        self.detector_kwargs = detector_kwargs
+
+    def run(self, video: Path, out_dir: Path, max_frames: int = 0,
+            merge_gap: float = 2.0) -> SegmentReport:
+        """
+        Process the segments in parallel.
+
+        Args:
+            video (Path): Seekable input video
+            out_dir (Path): Directory for the segment files
+            max_frames (int): Only process this many frames (0 = all)
+            merge_gap (float): Detections closer than this many seconds form one event
+
+        Returns:
+            SegmentReport: Segment results in order, timeline and events
+
+        Raises:
+            IOError: If the video cannot be opened or does not report its
+                frame count (some streams and containers), since the
+                segments cannot be planned without it
+        """
+        start = time.perf_counter()
+        cap = cv2.VideoCapture(str(video))
+        if not cap.isOpened():
+            raise IOError(f"Failed to open input: {video}")
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        cap.release()
+        if frame_count <= 0:
+            raise IOError(f"{video} does not report its frame count; process it "
+                          f"without segments")
+        if max_frames:
+            frame_count = min(frame_count, max_frames)
+        plan = plan_segments(frame_count, self.segments, self.overlap)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        args = (out_dir, self.model_path, self.detector_kwargs, self.track,
+                self.max_keyframe_interval, self.threads_per_worker)
+        # Spawn: fork is unsafe once threads or torch exist
+        with ProcessPoolExecutor(min(self.workers, len(plan)),
+                                 mp_context=mp.get_context('spawn')) as pool:
+            futures = [pool.submit(_process_segment, video, segment, *args) for segment in plan]
+            results = [future.result() for future in futures]
+
+        timeline = {index: hit for result in results for index, hit in result.timeline.items()}
+        events = ForensicScanner.events(timeline, fps, round(merge_gap * fps))
+        return SegmentReport(results, events, fps, time.perf_counter() - start, timeline)
+
+    def stitch(self, report: SegmentReport, out_path: Path, remove: bool = True) -> int:
+        """
+        Concatenate the segment files in order into one video.
+
+        With ffmpeg, the files are joined by its concat demuxer with stream
+        copy: no decoding, no quality loss and hardly any time. Without it (or
+        if it fails) the frames are decoded and encoded again with OpenCV.
+
+        Returns:
+            int: Frames written
+        """
+        paths = [result.path for result in report.segments if result.path.exists()]
+        if not paths:
+            return 0
+        if self._concat(paths, out_path):
+            written = sum(result.frames for result in report.segments if result.path.exists())
+        else:
+            written = self._reencode(paths, out_path, report.fps)
+        if remove:
+            for path in paths:
+                path.unlink()
+        return written
+
+    def _concat(self, paths: List[Path], out_path: Path) -> bool:
+        """Join files with ffmpeg's concat demuxer; False if ffmpeg is missing or fails."""
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            self.logger.info("ffmpeg not found; stitching segments by re-encoding them")
+            return False
+        listing = paths[0].parent / 'concat.txt'
+        with open(listing, 'w') as f:
+            for path in paths:
+                # A quote in the path closes the string, is escaped and reopens it
+                quoted = str(path.resolve()).replace("'", r"'\''")
+                f.write(f"file '{quoted}'\n")
+        try:
+            result = subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-f', 'concat',
+                                     '-safe', '0', '-i', str(listing), '-c', 'copy',
+                                     str(out_path)], capture_output=True, text=True)
+        finally:
+            listing.unlink()
+        if result.returncode != 0 or not out_path.exists():
+            self.logger.warning(f"ffmpeg concat failed ({result.stderr.strip()}); "
+                                f"stitching segments by re-encoding them")
+            return False
+        return True
+
+    @staticmethod
+    def _reencode(paths: List[Path], out_path: Path, fps: float) -> int:
+        """Decode the files in order and write their frames to one mp4v file."""
+        writer = None
+        written = 0
+        try:
+            for path in paths:
+                cap = cv2.VideoCapture(str(path))
+                while True:
+                    ok, frame = cap.read()
+                    if not ok:
+                        break
+                    if writer is None:
+                        h, w = frame.shape[:2]
+                        writer = cv2.VideoWriter(str(out_path), cv2.VideoWriter_fourcc(*'mp4v'),
+                                                 fps, (w, h))
+                    writer.write(frame)
+                    written += 1
+                cap.release()
+        finally:
+            if writer is not None:
+                writer.release()
+        return written
@@ -0,0 +1,303 @@
+import cv2
+import numpy as np
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from .detection_zones import DetectionZones, load_camera_zones
+from .detections import Detections
+from .frame_grabber import FrameGrabber
+from .metrics import metrics
+from .motion_gate import MotionGate
+from .tracker import KeyframePolicy, KeyframeTracker
+
+
+def open_capture(source: Union[str, int]) -> cv2.VideoCapture:
+    """
+    Open a capture for a file path, stream URL or device index.
+
+    Args:
+        source (Union[str, int]): Path, URL, or device index ("0" is accepted)
+
+    Returns:
+        cv2.VideoCapture: The opened (or failed) capture
+    """
+    if isinstance(source, str) and source.isdigit():
+        source = int(source)
+    return cv2.VideoCapture(source if isinstance(source, int) else str(source))
+
+
+@dataclass
+class SourceStats:
+    """Per-source counters maintained by the scheduler."""
+    frames_read: int = 0
+    frames_processed: int = 0
+    frames_dropped: int = 0
+    frames_gated: int = 0  # Frames answered with the previous result by the motion gate
+    frames_tracked: int = 0  # Frames answered from tracks between keyframes
+    lag: float = 0.0      # Seconds between capture and result of the last frame
+    avg_lag: float = 0.0  # Exponential moving average of lag
+    _processed_times: Deque[float] = field(default_factory=lambda: deque(maxlen=30), repr=False)
+
+    @property
+    def fps(self) -> float:
+        """Processed frames per second over the recent window."""
+        if len(self._processed_times) < 2:
+            return 0.0
+        span = self._processed_times[-1] - self._processed_times[0]
+        return (len(self._processed_times) - 1) / span if span > 0 else 0.0
+
+
+@dataclass
+class FrameResult:
+    """One processed frame handed back by the scheduler."""
+    source: str
+    frame: np.ndarray  # Original, unannotated frame
+    detections: Detections
+    capture_time: float
+    inferred: bool = True  # False when the motion gate or the tracker answered
+
+    @property
+    def detection(self) -> Optional[str]:
+        return self.detections.detection
+
+
+class StreamSource:
+    def __init__(
+        self,
+        name: str,
+        source: Union[str, int],
+        realtime: Optional[bool] = None,
+        gate: Optional[MotionGate] = None,
+        zones: Optional[DetectionZones] = None,
+        tracker: Optional[KeyframeTracker] = None
+    ):
+        """
+        Read frames from one capture on a background thread, keeping only the newest.
+
+        Args:
+            name (str): Camera name used in logs, stats and alert state
+            source (Union[str, int]): File path, stream URL or device index
+            realtime (Optional[bool]): Pace reads at the source FPS. Defaults to
+                True for local files, so they behave like a live camera
+            gate (Optional[MotionGate]): Per-camera motion gate; static frames
+                re-use the camera's previous result instead of being inferred
+            zones (Optional[DetectionZones]): Only look inside these zones
+            tracker (Optional[KeyframeTracker]): Per-camera tracker; frames
+                between keyframes are answered from its tracks
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.source = source
+        self.gate = gate
+        self.zones = zones
+        self.tracker = tracker
+        self.last_detections: Optional[Detections] = None
+        self.stats = SourceStats()
+
+        cap = open_capture(source)
+        if not cap.isOpened():
+            raise IOError(f"Failed to open video source: {source}")
+
+        is_device = isinstance(source, int) or str(source).isdigit()
+        is_url = '://' in str(source)
+        self.realtime = (not is_device and not is_url) if realtime is None else realtime
+        self.grabber = FrameGrabber(cap, buffer_size=1, realtime=self.realtime, name=name)
+
+    def start(self) -> 'StreamSource':
+        self.grabber.start()
+        return self
+
+    def stop(self) -> None:
+        self.grabber.stop()
+
+    @property
+    def finished(self) -> bool:
+        """True once the source has ended and its last frame was taken."""
+        return self.grabber.finished
+
+    def take(self) -> Optional[Tuple[np.ndarray, float]]:
+        """Return the newest unseen (frame, capture_time), or None if nothing new arrived."""
+        latest = self.grabber.take()
+        self.stats.frames_read = self.grabber.stats.frames_read
+        self.stats.frames_dropped = self.grabber.stats.frames_dropped
+        return latest
+
+
+class StreamScheduler:
+    def __init__(
+        self,
+        detector,
+        sources: List[StreamSource],
+        max_batch_size: int = 4,
+        idle_sleep: float = 0.005
+    ):
+        """
+        Group the newest frame of each source into batches for one shared Detector.
+
+        Sources are served least-recently-served first, so when there are more
+        sources with fresh frames than max_batch_size, the ones left out are at
+        the front of the next batch.
+
+        Args:
+            detector (Detector): Shared detector with a detect_batch method
+            sources (List[StreamSource]): Sources to schedule
+            max_batch_size (int): Maximum number of frames per forward pass
+            idle_sleep (float): Seconds to wait when no source has a new frame
+        """
+        self.logger = logging.getLogger(__name__)
+        self.detector = detector
+        self.sources = {source.name: source for source in sources}
+        self.max_batch_size = max(1, max_batch_size)
+        self.idle_sleep = idle_sleep
+        self._last_served: Dict[str, int] = {name: -1 for name in self.sources}
+        self._step = 0
+
+        if len(self.sources) != len(sources):
+            raise ValueError("Stream source names must be unique")
+
+    @classmethod
+    def from_config(cls, detector, config, **kwargs) -> 'StreamScheduler':
+        """
+        Build a scheduler from Config.VIDEO_SOURCES, naming cameras cam0, cam1, ...
+
+        Zones are read from Config.DETECTION_ZONES_FILE when it exists.
+        """
+        def gate():
+            if config.MOTION_GATE:
+                return MotionGate(max_skip_seconds=config.MOTION_GATE_MAX_SKIP_SECONDS)
+            return None
+
+        def tracker():
+            if config.TRACKING:
+                return KeyframeTracker(detector, policy=KeyframePolicy(
+                    idle_interval=config.KEYFRAME_IDLE_INTERVAL,
+                    max_interval=config.KEYFRAME_MAX_INTERVAL))
+            return None
+
+        zones = {}
+        if config.DETECTION_ZONES_FILE.exists():
+            zones = load_camera_zones(config.DETECTION_ZONES_FILE,
+                                      config.DETECTION_ZONE_MIN_OVERLAP)
+            logging.getLogger(__name__).info(
+                f"Loaded detection zones for: {', '.join(zones) or 'no cameras'}")
+
+        sources = [StreamSource(f"cam{i}", source, gate=gate(),
+                                zones=zones.get(f"cam{i}"), tracker=tracker())
+                   for i, source in enumerate(config.VIDEO_SOURCES)]
+        kwargs.setdefault('max_batch_size', config.MAX_BATCH_SIZE)
+        return cls(detector, sources, **kwargs)
+
+    @property
+    def stats(self) -> Dict[str, SourceStats]:
+        return {name: source.stats for name, source in self.sources.items()}
+
+    @property
+    def active(self) -> bool:
+        return not all(source.finished for source in self.sources.values())
+
+    def start(self) -> 'StreamScheduler':
+        for source in self.sources.values():
+            source.start()
+        return self
+
+    def stop(self) -> None:
+        for source in self.sources.values():
+            source.stop()
+
+    def step(self) -> List[FrameResult]:
+        """
+        Run one batch over the sources that have a new frame.
+
+        Returns:
+            List[FrameResult]: Results of this batch (empty if nothing was ready)
+        """
+        pending = []
+        results = []
+        order = sorted(self.sources, key=lambda name: self._last_served[name])
+        for name in order:
+            if len(pending) >= self.max_batch_size:
+                break
+            source = self.sources[name]
+            item = source.take()
+            if item is None:
+                continue
+
+            frame, capture_time = item
+            if source.tracker is not None and not source.tracker.next_frame():
+                # Between keyframes: boxes come from the tracks, no batch slot used
+                source.stats.frames_tracked += 1
+                results.append(FrameResult(name, frame, source.tracker.carry(),
+                                           capture_time, inferred=False))
+                continue
+            if source.gate is not None and not source.gate.should_infer(frame) \
+                    and source.last_detections is not None:
+                # Nothing moved: answer with the previous result, no batch slot used
+                source.stats.frames_gated += 1
+                results.append(FrameResult(name, frame, source.last_detections,
+                                           capture_time, inferred=False))
+                continue
+            pending.append((name, frame, capture_time))
+
+        if not pending and not results:
+            time.sleep(self.idle_sleep)
+            return []
+
+        if pending:
+            frames = [frame for _, frame, _ in pending]
+            zones = [self.sources[name].zones for name, _, _ in pending]
+            kwargs = {}
+            if any(zone is not None for zone in zones):
+                kwargs['zones'] = zones
+            if getattr(self.detector, 'frame_cache', None) is not None:
+                # One cache serves all cameras: keep their entries apart
+                kwargs['sources'] = [name for name, _, _ in pending]
+            outputs = self.detector.detect_batch(frames, **kwargs)
+            for (name, frame, capture_time), detections in zip(pending, outputs):
+                self._last_served[name] = self._step
+                if self.sources[name].tracker is not None:
+                    detections = self.sources[name].tracker.update(detections)
+                self.sources[name].last_detections = detections
+                results.append(FrameResult(name, frame, detections, capture_time))
+
+        now = time.time()
+        for result in results:
+            stats = self.sources[result.source].stats
+            stats.frames_processed += 1
+            stats.lag = now - result.capture_time
+            stats.avg_lag = stats.lag if stats.frames_processed == 1 \
+                else 0.9 * stats.avg_lag + 0.1 * stats.lag
+            stats._processed_times.append(now)
+
+        self._step += 1
+        if metrics.enabled:
+            self.publish_metrics()
+        return results
+
+    def publish_metrics(self) -> None:
+        """Export per-camera rates, counters and pending frames to the metrics endpoint."""
+        for name, source in self.sources.items():
+            stats = source.stats
+            metrics.set("camera_fps", stats.fps, camera=name)
+            metrics.set("camera_lag_seconds", stats.avg_lag, camera=name)
+            # Each source holds at most one frame, so the depth is 0 or 1
+            metrics.set("queue_depth", len(source.grabber), queue=name)
+            metrics.set("frame_age_seconds", source.grabber.stats.last_age, camera=name)
+            for counter in ("frames_read", "frames_processed", "frames_dropped",
+                            "frames_gated", "frames_tracked"):
+                metrics.set(f"{counter}_total", getattr(stats, counter), kind="counter",
+                            camera=name)
+
+    def __iter__(self):
+        """Yield results until every source has ended."""
+        while self.active:
+            yield from self.step()
+
+    def log_stats(self) -> None:
+        for name, stats in self.stats.items():
+            self.logger.info(
+                f"{name}: {stats.fps:.1f} FPS, lag {stats.avg_lag * 1000:.0f} ms, "
+                f"processed {stats.frames_processed}, dropped {stats.frames_dropped}, "
+                f"gated {stats.frames_gated}, tracked {stats.frames_tracked}")
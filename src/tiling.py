@@ -0,0 +1,50 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass
+class TilingConfig:
+    """
+    Settings for Detector's tiled (sliced) inference on high-resolution frames.
+
+    Tiles are cut from the full-resolution frame, so small, distant smoke keeps
+    its pixels instead of being squeezed into a single target_height input.
+    """
+    tile_size: int = 640           # Side of the square tiles, in frame pixels
+    overlap: float = 0.2           # Fraction of a tile shared with its neighbour
+    include_full_frame: bool = False  # Hybrid mode: also infer the whole, resized frame
+    merge_threshold: float = 0.5   # Intersection-over-smaller at which boxes are merged
+    fuse: bool = True              # Merge partial boxes into their union instead of dropping them
+    input_size: Optional[int] = None  # Model input side for tiles; None keeps full resolution
+
+
+def make_tiles(frame_shape: Tuple[int, ...], tile_size: int, overlap: float) -> np.ndarray:
+    """
+    Overlapping tile rectangles covering a frame.
+
+    Tiles are evenly spread so the last row and column end exactly at the
+    frame border; a frame smaller than a tile gives a single tile.
+
+    Args:
+        frame_shape (Tuple[int, ...]): (height, width[, channels])
+        tile_size (int): Side of the square tiles
+        overlap (float): Minimum overlap between neighbouring tiles, 0-1
+
+    Returns:
+        np.ndarray: (T, 4) int [x1, y1, x2, y2] tiles, row-major
+    """
+    height, width = frame_shape[:2]
+
+    def starts(length: int) -> np.ndarray:
+        if length <= tile_size:
+            return np.zeros(1, dtype=int)
+        step = max(1, int(tile_size * (1 - overlap)))
+        count = int(np.ceil((length - tile_size) / step)) + 1
+        return np.linspace(0, length - tile_size, count).round().astype(int)
+
+    xs, ys = starts(width), starts(height)
+    x1, y1 = np.meshgrid(xs, ys)
+    x1, y1 = x1.ravel(), y1.ravel()
+    return np.stack([x1, y1, np.minimum(x1 + tile_size, width),
+                     np.minimum(y1 + tile_size, height)], axis=1)
@@ -0,0 +1,200 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import QUANTILES, RollingHistogram, metrics
+
+_NULL_SPAN = nullcontext()
+
+
+@dataclass
+class Span:
+    name: str
+    start: float  # Wall clock (time.time()), comparable with capture times
+    end: float
+    channel: Optional[str] = None  # "whatsapp" or "telegram" for delivery stages
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class Trace:
+    """
+    Timeline of one frame from capture to the alert messages it caused.
+
+    Created per frame with Tracer.start() and handed along explicitly
+    (process_frame, send_alert, the executor, upload_image, the Telegram
+    bot), since the alert work moves to another thread and event loop.
+
+    Most frames raise no alert, so their spans only stay on the trace: they
+    reach the tracer's stage percentiles once alert() is called (or a
+    delivery is recorded), which keeps those percentiles about alerts.
+    Per-frame stage timings belong in metrics.
+    """
+    tracer: 'Tracer' = field(repr=False)
+    camera: str
+    capture_time: float
+    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    spans: List[Span] = field(default_factory=list)
+    alerted: bool = False
+
+    @contextmanager
+    def span(self, name: str, channel: Optional[str] = None):
+        """Context manager recording a stage."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.record(name, start, channel=channel)
+
+    def record(self, name: str, start: float, end: Optional[float] = None,
+               channel: Optional[str] = None) -> None:
+        """Record a stage measured elsewhere; end defaults to now."""
+        span = Span(name, start, time.time() if end is None else end, channel)
+        self.spans.append(span)
+        if self.alerted:
+            self.tracer._observe_span(span)
+
+    def alert(self, start: float, end: Optional[float] = None) -> None:
+        """
+        Record the alert decision (start to end, default now) and from then
+        on feed this trace's spans, including the earlier ones, to the tracer.
+        """
+        self.record("alert_decision", start, end)
+        self._flush()
+
+    def _flush(self) -> None:
+        if not self.alerted:
+            self.alerted = True
+            for span in self.spans:
+                self.tracer._observe_span(span)
+
+    def delivered(self, channel: str, success: bool = True) -> float:
+        """
+        Mark the alert as delivered (or given up) on a channel.
+
+        Returns:
+            float: Seconds from capture to now
+        """
+        self._flush()  # A delivery implies an alert, even if alert() was not called
+        return self.tracer._observe_delivery(self, channel, success, time.time())
+
+    def to_dict(self) -> dict:
+        return {'trace_id': self.trace_id, 'camera': self.camera,
+                'capture_time': self.capture_time,
+                'spans': [asdict(span) for span in self.spans]}
+
+
+def span(trace: Optional[Trace], name: str, channel: Optional[str] = None):
+    """trace.span(name), or a shared no-op context manager when trace is None."""
+    if trace is None:
+        return _NULL_SPAN
+    return trace.span(name, channel)
+
+
+class Tracer:
+    def __init__(self, export_path: Optional[Path] = None, window: int = 256):
+        """
+        Collects alert traces: span durations per stage and channel, and the
+        capture-to-delivery latency per channel.
+
+        Every delivery (or failed delivery) is appended to export_path as one
+        JSON line holding the whole trace, so slow alerts can be inspected
+        afterwards; write_summary() stores the rolling percentiles.
+
+        Args:
+            export_path (Optional[Path]): JSON Lines file for finished
+                deliveries; None keeps everything in memory only
+            window (int): Recent values kept per stage for percentiles
+        """
+        self.logger = logging.getLogger(__name__)
+        self.export_path = export_path
+        self.window = window
+        self._lock = threading.Lock()
+        self._stages: Dict[Tuple[str, Optional[str]], RollingHistogram] = {}
+        self._latency: Dict[str, RollingHistogram] = {}
+        self._failures: Dict[str, int] = {}
+
+    def start(self, camera: str, capture_time: Optional[float] = None) -> Trace:
+        """
+        Begin the trace of a frame.
+
+        Args:
+            camera (str): Camera name
+            capture_time (Optional[float]): time.time() when the frame was
+                read; now if not given
+        """
+        return Trace(self, camera, time.time() if capture_time is None else capture_time)
+
+    def _histogram(self, histograms: dict, key) -> RollingHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = RollingHistogram(window=self.window)
+        return histogram
+
+    def _observe_span(self, span: Span) -> None:
+        with self._lock:
+            self._histogram(self._stages, (span.name, span.channel)).observe(span.duration)
+
+    def _observe_delivery(self, trace: Trace, channel: str, success: bool, now: float) -> float:
+        latency = now - trace.capture_time
+        with self._lock:
+            if success:
+                self._histogram(self._latency, channel).observe(latency)
+            else:
+                self._failures[channel] = self._failures.get(channel, 0) + 1
+        if success:
+            metrics.observe("capture_to_delivery", latency, channel=channel)
+        if self.export_path is not None:
+            record = {**trace.to_dict(), 'channel': channel, 'success': success,
+                      'delivered_time': now, 'latency': latency}
+            try:
+                with self._lock, open(self.export_path, 'a') as f:
+                    f.write(json.dumps(record) + '\n')
+            except OSError as e:
+                self.logger.error(f"Failed to export trace {trace.trace_id}: {e}")
+        return latency
+
+    def summary(self) -> dict:
+        """Percentiles in seconds of each stage and of capture-to-delivery per channel."""
+        def describe(histogram: RollingHistogram) -> dict:
+            quantiles = histogram.quantiles()
+            return {'count': histogram.count, **{f'p{int(q * 100)}': quantiles[q]
+                                                 for q in QUANTILES}}
+
+        with self._lock:
+            stages = {name if channel is None else f'{name}[{channel}]': describe(histogram)
+                      for (name, channel), histogram in self._stages.items()}
+            return {
+                'stages': dict(sorted(stages.items())),
+                'capture_to_delivery': {channel: describe(h)
+                                        for channel, h in sorted(self._latency.items())},
+                'failed_deliveries': dict(self._failures),
+            }
+
+    def write_summary(self, path: Path) -> None:
+        """Write summary() to a JSON file."""
+        path.write_text(json.dumps(self.summary(), indent=2))
+
+    def log_summary(self) -> None:
+        for channel, stats in self.summary()['capture_to_delivery'].items():
+            self.logger.info(f"Alert latency via {channel}: p50 {stats['p50']:.2f}s, "
+                             f"p95 {stats['p95']:.2f}s, p99 {stats['p99']:.2f}s "
+                             f"({stats['count']} alerts)")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._latency.clear()
+            self._failures.clear()
+
+
+tracer = Tracer()
@@ -0,0 +1,259 @@
+import numpy as np
+from dataclasses import dataclass, replace
+from typing import List, Optional
+
+from .detections import Detections, box_iou
+
+# Constant-velocity model over [cx, cy, w, h, vx, vy, vw, vh], one step per frame
+_TRANSITION = np.eye(8)
+_TRANSITION[:4, 4:] = np.eye(4)
+_OBSERVATION = np.eye(4, 8)
+
+
+def _xyxy_to_cxcywh(boxes: np.ndarray) -> np.ndarray:
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return np.column_stack([(boxes[:, :2] + boxes[:, 2:]) / 2, boxes[:, 2:] - boxes[:, :2]])
+
+
+@dataclass
+class Track:
+    """One tracked fire or smoke region."""
+    track_id: int
+    class_id: int
+    confidence: float        # Confidence of the last matched detection
+    mean: np.ndarray         # (8,) Kalman state [cx, cy, w, h, vx, vy, vw, vh]
+    covariance: np.ndarray   # (8, 8)
+    hits: int = 1            # Keyframes the track was matched on
+    missed: int = 0          # Consecutive keyframes without a match
+
+    @property
+    def box(self) -> np.ndarray:
+        """Current [x1, y1, x2, y2] estimate."""
+        cx, cy, w, h = self.mean[:4]
+        return np.array([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], dtype=np.float32)
+
+
+class Tracker:
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_missed: int = 2,
+        position_noise: float = 1 / 20,
+        velocity_noise: float = 1 / 160
+    ):
+        """
+        IoU tracker with a constant-velocity Kalman filter per track.
+
+        predict() advances every track by one frame and update() associates
+        the detections of a keyframe with the predicted tracks. Matching is
+        greedy on a class-aware IoU matrix; noise scales with box size as in
+        SORT/DeepSORT.
+
+        Args:
+            iou_threshold (float): Minimum IoU between a predicted track and a detection
+            max_missed (int): Keyframes a track may go unmatched before it is dropped
+            position_noise (float): Position noise relative to box size
+            velocity_noise (float): Velocity noise relative to box size
+        """
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.position_noise = position_noise
+        self.velocity_noise = velocity_noise
+        self.tracks: List[Track] = []
+        self._next_id = 1
+        # Outcome of the last update, used by KeyframePolicy
+        self.last_match_iou = 0.0
+        self.last_created = 0
+        self.last_lost = 0
+
+    def _noise(self, mean: np.ndarray) -> np.ndarray:
+        size = np.tile(np.abs(mean[2:4]), 2)
+        return np.concatenate([self.position_noise * size, self.velocity_noise * size]) ** 2
+
+    def predict(self) -> None:
+        """Advance all tracks by one frame."""
+        for track in self.tracks:
+            track.mean = _TRANSITION @ track.mean
+            track.covariance = (_TRANSITION @ track.covariance @ _TRANSITION.T
+                                + np.diag(self._noise(track.mean)))
+            track.mean[2:4] = np.maximum(track.mean[2:4], 1.0)
+
+    def update(self, boxes: np.ndarray, class_ids: np.ndarray,
+               confidences: np.ndarray) -> np.ndarray:
+        """
+        Associate keyframe detections with the tracks.
+
+        Unmatched detections start new tracks; tracks unmatched for more than
+        max_missed keyframes are dropped.
+
+        Args:
+            boxes (np.ndarray): (N, 4) [x1, y1, x2, y2] boxes
+            class_ids (np.ndarray): (N,) class ids
+            confidences (np.ndarray): (N,) confidences
+
+        Returns:
+            np.ndarray: (N,) track id of each detection
+        """
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        track_ids = np.zeros(len(boxes), dtype=np.int64)
+        matched_tracks = np.zeros(len(self.tracks), dtype=bool)
+        matched_detections = np.zeros(len(boxes), dtype=bool)
+        ious = []
+
+        if self.tracks and len(boxes):
+            track_boxes = np.stack([track.box for track in self.tracks])
+            track_classes = np.array([track.class_id for track in self.tracks])
+            iou = box_iou(track_boxes, boxes)
+            iou[track_classes[:, None] != np.asarray(class_ids)[None, :]] = 0
+            # Greedy: best remaining pair first
+            candidates = np.argwhere(iou >= self.iou_threshold)
+            for t, d in candidates[np.argsort(-iou[candidates[:, 0], candidates[:, 1]])]:
+                if matched_tracks[t] or matched_detections[d]:
+                    continue
+                matched_tracks[t] = matched_detections[d] = True
+                ious.append(iou[t, d])
+                track = self.tracks[t]
+                self._correct(track, boxes[d])
+                track.confidence = float(confidences[d])
+                track.hits += 1
+                track.missed = 0
+                track_ids[d] = track.track_id
+
+        for track, matched in zip(self.tracks, matched_tracks):
+            if not matched:
+                track.missed += 1
+        survivors = [track for track in self.tracks if track.missed <= self.max_missed]
+        self.last_lost = len(self.tracks) - len(survivors)
+        self.tracks = survivors
+
+        for d in np.flatnonzero(~matched_detections):
+            track_ids[d] = self._start(boxes[d], int(class_ids[d]), float(confidences[d]))
+        self.last_created = int((~matched_detections).sum())
+        self.last_match_iou = float(np.mean(ious)) if ious else 0.0
+        return track_ids
+
+    def _start(self, box: np.ndarray, class_id: int, confidence: float) -> int:
+        mean = np.concatenate([_xyxy_to_cxcywh(box)[0], np.zeros(4)])
+        size = np.tile(mean[2:4], 2)
+        std = np.concatenate([2 * self.position_noise * size, 10 * self.velocity_noise * size])
+        track = Track(self._next_id, class_id, confidence, mean, np.diag(std ** 2))
+        self.tracks.append(track)
+        self._next_id += 1
+        return track.track_id
+
+    def _correct(self, track: Track, box: np.ndarray) -> None:
+        measurement = _xyxy_to_cxcywh(box)[0]
+        noise = np.diag(self._noise(track.mean)[:4])
+        projected = _OBSERVATION @ track.covariance @ _OBSERVATION.T + noise
+        gain = np.linalg.solve(projected, _OBSERVATION @ track.covariance).T
+        track.mean = track.mean + gain @ (measurement - _OBSERVATION @ track.mean)
+        track.covariance = (np.eye(8) - gain @ _OBSERVATION) @ track.covariance
+
+
+class KeyframePolicy:
+    def __init__(
+        self,
+        min_interval: int = 1,
+        max_interval: int = 8,
+        idle_interval: int = 4,
+        stable_iou: float = 0.6
+    ):
+        """
+        Choose how many frames to wait between model runs.
+
+        Without tracks the interval stays at idle_interval. While tracks are
+        active it grows by one after each keyframe where every track was found
+        again close to its prediction, and halves when tracks appear, get lost
+        or drift.
+
+        Args:
+            min_interval (int): Smallest interval (1 = every frame)
+            max_interval (int): Largest interval while tracks are stable
+            idle_interval (int): Interval while nothing is tracked
+            stable_iou (float): Mean prediction-to-detection IoU counted as stable
+        """
+        self.min_interval = max(1, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.idle_interval = min(max(idle_interval, self.min_interval), self.max_interval)
+        self.stable_iou = stable_iou
+        self.interval = self.idle_interval
+
+    def update(self, tracker: Tracker) -> int:
+        """Adjust the interval after a keyframe and return it."""
+        if not tracker.tracks:
+            self.interval = self.idle_interval
+        elif tracker.last_created or tracker.last_lost or tracker.last_match_iou < self.stable_iou:
+            self.interval = max(self.min_interval, self.interval // 2)
+        else:
+            self.interval = min(self.max_interval, self.interval + 1)
+        return self.interval
+
+
+class KeyframeTracker:
+    def __init__(
+        self,
+        detector,
+        tracker: Optional[Tracker] = None,
+        policy: Optional[KeyframePolicy] = None
+    ):
+        """
+        Run the model on keyframes only and carry tracks forward in between.
+
+        Per frame, call next_frame(); if it returns True run the detector and
+        pass the result to update(), otherwise use carry(). detect() does both
+        for single-stream callers.
+
+        Args:
+            detector (Detector): Detector used for keyframes and the Fire/Smoke decision
+            tracker (Optional[Tracker]): Tracker, a default one if None
+            policy (Optional[KeyframePolicy]): Keyframe interval policy
+        """
+        self.detector = detector
+        self.tracker = tracker or Tracker()
+        self.policy = policy or KeyframePolicy()
+        self._since_keyframe = 0
+        self._last: Optional[Detections] = None
+        self.keyframes = 0
+        self.frames = 0
+
+    def next_frame(self) -> bool:
+        """Advance tracks by one frame; True if this frame should be inferred."""
+        self.frames += 1
+        self.tracker.predict()
+        self._since_keyframe += 1
+        return self._last is None or self._since_keyframe >= self.policy.interval
+
+    def update(self, detections: Detections) -> Detections:
+        """Feed a keyframe result; returns it with track ids filled in."""
+        self.keyframes += 1
+        self._since_keyframe = 0
+        detections.track_ids = self.tracker.update(
+            detections.boxes, detections.class_ids, detections.confidences)
+        self.policy.update(self.tracker)
+        self._last = detections
+        return detections
+
+    def carry(self) -> Detections:
+        """Detections for a non-keyframe, from the tracks matched on the last keyframe."""
+        tracks = [track for track in self.tracker.tracks if track.missed == 0]
+        tracks.sort(key=lambda track: -track.confidence)
+        last = self._last
+        height, width = last.frame_shape
+        boxes = np.stack([track.box for track in tracks]) if tracks \
+            else np.zeros((0, 4), dtype=np.float32)
+        class_ids = np.array([track.class_id for track in tracks], dtype=np.int32)
+        confidences = np.array([track.confidence for track in tracks], dtype=np.float32)
+        return replace(
+            last,
+            boxes=np.clip(boxes, 0, [width, height, width, height]).astype(np.float32),
+            class_ids=class_ids,
+            confidences=confidences,
+            track_ids=np.array([track.track_id for track in tracks], dtype=np.int64),
+            detection=self.detector._decide(class_ids, confidences),
+        )
+
+    def detect(self, frame: np.ndarray) -> Detections:
+        """Detections for the next frame of the stream, inferred or carried."""
+        if self.next_frame():
+            return self.update(self.detector.detect(frame))
+        return self.carry()
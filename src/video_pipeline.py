@@ -0,0 +1,181 @@
+import cv2
+import numpy as np
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+from .metrics import metrics
+
+_END = object()  # Sentinel marking the end of the stream
+
+
+@dataclass
+class StageStats:
+    """Time accounting for one pipeline stage."""
+    name: str
+    items: int = 0
+    busy_time: float = 0.0     # Seconds spent doing the stage's own work
+    starved_time: float = 0.0  # Seconds waiting for input from the previous stage
+    blocked_time: float = 0.0  # Seconds waiting for room in the next stage's queue
+
+    def utilization(self, wall_time: float) -> float:
+        return self.busy_time / wall_time if wall_time > 0 else 0.0
+
+
+@dataclass
+class PipelineReport:
+    frames: int
+    wall_time: float
+    stages: Dict[str, StageStats]
+
+    @property
+    def bottleneck(self) -> str:
+        """Name of the stage with the highest utilization."""
+        return max(self.stages.values(), key=lambda s: s.busy_time).name
+
+    def log(self, logger: logging.Logger) -> None:
+        fps = self.frames / self.wall_time if self.wall_time > 0 else 0.0
+        logger.info(f"Pipeline: {self.frames} frames in {self.wall_time:.1f}s ({fps:.1f} FPS)")
+        for stage in self.stages.values():
+            logger.info(
+                f"  {stage.name:<8} utilization {stage.utilization(self.wall_time):6.1%} | "
+                f"busy {stage.busy_time:.1f}s, starved {stage.starved_time:.1f}s, "
+                f"blocked {stage.blocked_time:.1f}s")
+        logger.info(f"  Bottleneck stage: {self.bottleneck}")
+
+
+class FramePipeline:
+    def __init__(
+        self,
+        process: Callable[[np.ndarray], Any],
+        write: Callable[[Any], None],
+        queue_size: int = 8
+    ):
+        """
+        Three-stage decode / process / encode pipeline with bounded queues.
+
+        A decoder thread feeds frames to the processing stage, which runs on the
+        calling thread, and an encoder thread consumes its outputs. There is a
+        single worker per stage and FIFO queues between them, so frame order is
+        preserved. When a queue is full the stage in front of it blocks, which
+        bounds memory use (backpressure).
+
+        Args:
+            process (Callable): Called with each decoded frame; returns the item to write
+            write (Callable): Called on the encoder thread with each processed item
+            queue_size (int): Capacity of each inter-stage queue
+        """
+        self.logger = logging.getLogger(__name__)
+        self.process = process
+        self.write = write
+        self.queue_size = max(1, queue_size)
+
+    def run(self, cap: cv2.VideoCapture, max_frames: int = 0) -> PipelineReport:
+        """
+        Run the pipeline until the capture ends, max_frames frames were
+        processed (0 = all) or a stage fails.
+
+        Args:
+            cap (cv2.VideoCapture): Opened capture to decode from
+
+        Returns:
+            PipelineReport: Frame count, wall time and per-stage statistics
+        """
+        stats = {name: StageStats(name) for name in ('decode', 'infer', 'encode')}
+        decoded = queue.Queue(maxsize=self.queue_size)
+        processed = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors = []
+
+        def put(q: queue.Queue, item, stage: StageStats) -> bool:
+            start = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    stage.blocked_time += time.perf_counter() - start
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q: queue.Queue, stage: StageStats):
+            start = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    item = q.get(timeout=0.1)
+                    stage.starved_time += time.perf_counter() - start
+                    return item
+                except queue.Empty:
+                    continue
+            return _END
+
+        def decoder():
+            stage = stats['decode']
+            try:
+                while not max_frames or stage.items < max_frames:
+                    start = time.perf_counter()
+                    ret, frame = cap.read()
+                    elapsed = time.perf_counter() - start
+                    stage.busy_time += elapsed
+                    metrics.observe('decode', elapsed)
+                    if not ret or not put(decoded, frame, stage):
+                        break
+                    stage.items += 1
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(decoded, _END, stage)
+
+        def encoder():
+            stage = stats['encode']
+            try:
+                while (item := get(processed, stage)) is not _END:
+                    start = time.perf_counter()
+                    self.write(item)
+                    elapsed = time.perf_counter() - start
+                    stage.busy_time += elapsed
+                    metrics.observe('encode', elapsed)
+                    stage.items += 1
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        threads = [threading.Thread(target=decoder, name='decoder', daemon=True),
+                   threading.Thread(target=encoder, name='encoder', daemon=True)]
+        wall_start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        stage = stats['infer']
+        try:
+            while (frame := get(decoded, stage)) is not _END:
+                start = time.perf_counter()
+                item = self.process(frame)
+                elapsed = time.perf_counter() - start
+                stage.busy_time += elapsed
+                stage.items += 1
+                if metrics.enabled:
+                    metrics.observe('process', elapsed)
+                    metrics.set('queue_depth', decoded.qsize(), queue='decoded')
+                    metrics.set('queue_depth', processed.qsize(), queue='processed')
+                    metrics.set('frames_processed_total', stage.items, kind='counter')
+                if not put(processed, item, stage):
+                    break
+                if stage.items % 50 == 0:
+                    self.logger.info(f"Processed {stage.items} frames")
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            put(processed, _END, stage)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return PipelineReport(stats['encode'].items, time.perf_counter() - wall_start, stats)
@@ -0,0 +1,45 @@
+import pytest
+import cv2
+import numpy as np
+from src.fire_detector import Detector
+from src.config import Config
+
+
+@pytest.fixture
+def fire_detector():
+    return Detector(Config.MODEL_PATH)
+
+
+@pytest.fixture
+def sample_frame(fire_detector):
+    return fire_detector.resize_frame(cv2.imread('data/house.png'))
+
+
+def test_renderer_matches_draw_detection(fire_detector, sample_frame):
+    """Test cached rendering is pixel-identical to per-box drawing"""
+    boxes = np.array([[100, 120, 400, 500], [5, 3, 300, 200],       # label below the box
+                      [-30, 400, 200, 700], [900, 10, 1300, 300]])  # clipped at the edges
+    names = ['Fire', 'Smoke', 'Fire', 'Smoke']
+    confidences = [0.91, 0.8, 0.55, 0.776]
+
+    expected = sample_frame.copy()
+    for box, name, confidence in zip(boxes, names, confidences):
+        fire_detector.draw_detection(expected, box, name, confidence)
+
+    for _ in range(2):  # Second pass uses the cached label sprites
+        rendered = sample_frame.copy()
+        fire_detector.renderer.draw_boxes(rendered, boxes, names, confidences)
+        assert np.array_equal(rendered, expected)
+
+
+def test_footer_is_cached(fire_detector, sample_frame):
+    """Test the footer darkens the bottom band and is rendered once"""
+    first = sample_frame.copy()
+    fire_detector._add_frame_info(first, 'Fire')
+    second = sample_frame.copy()
+    fire_detector._add_frame_info(second, 'Fire')
+
+    assert np.array_equal(first, second)
+    assert len(fire_detector.renderer._footers) == 1
+    assert np.array_equal(first[:-40], sample_frame[:-40])
+    assert first[-40:].mean() < sample_frame[-40:].mean()
@@ -0,0 +1,68 @@
+import json
+import os
+import shutil
+
+import cv2
+import numpy as np
+import pytest
+from src.batch_runner import BatchRunner, discover_inputs
+from src.config import Config
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """Two images and a short video in nested directories, plus a file to ignore"""
+    (tmp_path / 'cams' / 'north').mkdir(parents=True)
+    shutil.copy('data/test_image.png', tmp_path / 'a.png')
+    shutil.copy('data/test_image.png', tmp_path / 'cams' / 'north' / 'b.PNG')
+    (tmp_path / 'notes.txt').write_text('not media')
+    writer = cv2.VideoWriter(str(tmp_path / 'cams' / 'clip.mp4'),
+                             cv2.VideoWriter_fourcc(*'mp4v'), 10, (160, 120))
+    for _ in range(6):
+        writer.write(np.full((120, 160, 3), 100, dtype=np.uint8))
+    writer.release()
+    return tmp_path
+
+
+def test_discover_directories_and_globs(inputs):
+    """Test directories are searched recursively, globs expand and duplicates collapse"""
+    found = discover_inputs([str(inputs), str(inputs / '*.png')])
+    assert [path.name for path in found] == ['a.png', 'clip.mp4', 'b.PNG']
+    assert discover_inputs([str(inputs / 'cams' / '**' / '*.mp4')]) == [found[1]]
+
+
+def test_resumes_from_manifest(inputs):
+    """Test a rerun only redoes changed files and keeps one summary line per file"""
+    out = inputs / 'out' / 'batch.jsonl'
+    runner = BatchRunner(Config.MODEL_PATH, out, workers=0, stride=2)
+    files = discover_inputs([str(inputs)])
+    stats = runner.run(files)
+    assert (stats.done, stats.failed, stats.skipped) == (3, 0, 0)
+    summaries = {json.loads(line)['path']: json.loads(line) for line in out.read_text().splitlines()}
+    video = summaries[str(inputs / 'cams' / 'clip.mp4')]
+    assert (video['frames'], video['inferred']) == (6, 3)
+
+    assert runner.run(files).skipped == 3  # Nothing left to do
+    os.utime(inputs / 'a.png', (0, 1))     # Changed since the last run
+    stats = runner.run(files)
+    assert (stats.done, stats.skipped) == (1, 2)
+    lines = out.read_text().splitlines()
+    assert sorted(json.loads(line)['path'] for line in lines) == sorted(map(str, files))
+
+    # Interrupted after the manifest was updated but before the line was written
+    out.write_text(''.join(line + '\n' for line in lines[:-1]))
+    assert runner.run(files).skipped == 3
+    assert sorted(out.read_text().splitlines()) == sorted(lines)
+
+    # Results with other settings are not re-used
+    assert BatchRunner(Config.MODEL_PATH, out, workers=0, stride=1).run(files).done == 3
+
+
+def test_process_pool(inputs):
+    """Test files are processed by worker processes"""
+    out = inputs / 'pool.jsonl'
+    stats = BatchRunner(Config.MODEL_PATH, out, workers=1).run(
+        discover_inputs([str(inputs / '*.png'), str(inputs / 'cams' / 'north')]))
+    assert (stats.done, stats.failed) == (2, 0)
+    pids = {json.loads(line)['worker'] for line in out.read_text().splitlines()}
+    assert os.getpid() not in pids
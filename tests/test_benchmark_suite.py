@@ -0,0 +1,31 @@
+from scripts.benchmark_suite import compare
+
+
+def stats(p50):
+    return {'mean_ms': p50, 'p50_ms': p50, 'p95_ms': p50, 'p99_ms': p50}
+
+
+def statuses(rows):
+    return {row['stage']: row['status'] for row in rows}
+
+
+def test_regression_threshold():
+    """Test only slowdowns beyond the threshold count as regressions"""
+    baseline = {'resize': stats(10.0), 'encode': stats(4.0), 'draw': stats(2.0)}
+    current = {'resize': stats(11.5), 'encode': stats(4.3), 'draw': stats(1.0)}
+    rows = compare(current, baseline, 'p50_ms', threshold=10)
+    assert statuses(rows) == {'resize': 'REGRESSION', 'encode': 'ok', 'draw': 'ok'}
+    assert [round(row['change_%']) for row in rows] == [15, 7, -50]
+    assert statuses(compare(current, baseline, 'p50_ms', threshold=20))['resize'] == 'ok'
+
+
+def test_missing_and_skipped_stages_are_flagged():
+    """Test dropped, renamed and newly skipped stages do not pass silently"""
+    baseline = {'inference': stats(80.0), 'save': stats(3.0), 'labels': {'skipped': 'no data'},
+                'resize': stats(1.0)}
+    current = {'inference_v2': stats(80.0), 'save': {'skipped': 'no disk'},
+               'labels': {'skipped': 'no data'}, 'resize': stats(1.0)}
+    rows = compare(current, baseline, 'p50_ms', threshold=10)
+    assert statuses(rows) == {'inference': 'MISSING', 'save': 'MISSING', 'labels': 'skipped',
+                              'resize': 'ok', 'inference_v2': 'NO BASELINE'}
+    assert rows[0]['current_p50_ms'] == '-' and rows[-1]['baseline_p50_ms'] == '-'
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import cv2
+from src.config import Config
+from src.detection_zones import DetectionZones
+from src.fire_detector import Detector
+
+
+@pytest.fixture
+def zones():
+    # Bottom-right quarter of the frame
+    return DetectionZones([[(0.5, 0.5), (1.0, 0.5), (1.0, 1.0), (0.5, 1.0)]])
+
+
+def test_mask_and_bounding_rect(zones):
+    """Test zones are rasterized at the frame resolution"""
+    mask = zones.mask((200, 400, 3))
+    assert mask.shape == (200, 400)
+    assert mask[150, 300] == 1 and mask[50, 100] == 0
+    assert zones.bounding_rect((200, 400, 3)) == (200, 100, 400, 200)
+
+
+def test_coverage_is_share_of_box_inside(zones):
+    """Test the overlap test on boxes inside, outside and across the zone border"""
+    boxes = np.array([[250, 120, 350, 180], [0, 0, 100, 50], [100, 100, 300, 200]])
+    coverage = zones.coverage(boxes, (200, 400))
+    assert coverage == pytest.approx([1.0, 0.0, 0.5], abs=0.02)
+    assert zones.contains(boxes, (200, 400)).tolist() == [True, False, True]
+
+
+def test_detect_with_zones_maps_boxes_to_frame(zones):
+    """Test zone-restricted detections are in full-frame coordinates and inside the zones"""
+    detector = Detector(Config.MODEL_PATH)
+    frame = cv2.imread('data/test_image.png')
+    detections = detector.detect(frame, zones)
+
+    assert detections.frame_shape == frame.shape[:2]
+    assert zones.contains(detections.boxes, frame.shape).all()
+    x1, y1, _, _ = zones.bounding_rect(frame.shape)
+    assert (detections.boxes[:, :2] >= [x1, y1]).all()
+
+
+def test_zone_outside_frame_skips_inference():
+    """Test zones covering no pixel return an empty result without running the model"""
+    detector = Detector(Config.MODEL_PATH)
+    outside = DetectionZones([[(1.2, 1.2), (1.5, 1.2), (1.5, 1.5)]])
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    assert outside.bounding_rect(frame.shape) is None
+    detections = detector.detect(frame, outside)
+    assert len(detections) == 0 and detections.detection is None
+
+
+def test_zone_crop_boxes_map_back_to_frame(monkeypatch):
+    """Test boxes predicted on a zone crop land at the right frame position"""
+    detector = Detector(Config.MODEL_PATH)
+    right_half = DetectionZones([[(0.5, 0.0), (1.0, 0.0), (1.0, 1.0), (0.5, 1.0)]])
+    frame = np.zeros((400, 800, 3), dtype=np.uint8)
+    fire = next(i for i, name in detector.names.items() if name.lower() == "fire")
+
+    seen = []
+
+    def predict(images, imgsz=None):
+        seen.extend((image.shape[:2], imgsz) for image in images)
+        return [np.array([[64, 64, 128, 128, 0.9, fire]], dtype=np.float32)]
+
+    monkeypatch.setattr(detector, "_predict", predict)
+    detections = detector.detect(frame, right_half)
+
+    # The whole frame goes in as 640x320, so its right half as 320x320
+    assert seen == [((320, 320), 320)]
+    assert detections.boxes.tolist() == [[480, 80, 560, 160]]
+    assert detections.detection == "Fire"
+
+    # A zone covering the whole frame costs no more than no zone at all
+    seen.clear()
+    whole = DetectionZones([[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]])
+    detector.detect(np.zeros((1080, 1920, 3), dtype=np.uint8), whole)
+    assert seen == [((360, 640), 640)]
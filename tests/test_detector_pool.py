@@ -0,0 +1,82 @@
+import os
+import queue
+import signal
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+from src.config import Config
+from src.detector_pool import DetectorPool, _Task
+from src.fire_detector import Detector
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with DetectorPool(Config.MODEL_PATH, workers=2, max_frame_shape=(720, 1280, 3),
+                      min_confidence=0.001) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def frames():
+    image = cv2.imread('data/test_image.png')
+    # Distinct frames, so a result handed to the wrong frame would show
+    return [cv2.resize(image, (640 + 32 * i, 360 + 18 * i)) for i in range(6)]
+
+
+def test_pool_matches_in_process_detector_in_order(pool, frames):
+    """Test results come back per source in submission order and match Detector.detect"""
+    for frame in frames:
+        pool.submit("cam0", frame)
+        pool.submit("cam1", frame[:, ::-1].copy())
+    results = pool.results(wait=True)
+    for source in ("cam0", "cam1"):
+        assert [r.index for r in results if r.source == source] == list(range(len(frames)))
+
+    detector = Detector(Config.MODEL_PATH, min_confidence=0.001)
+    for frame, result in zip(frames, [r for r in results if r.source == "cam0"]):
+        expected = detector.detect(frame)
+        assert result.detections.frame_shape == frame.shape[:2]
+        np.testing.assert_allclose(result.detections.boxes, expected.boxes, atol=1e-3)
+
+
+def test_crashed_worker_is_restarted(pool, frames):
+    """Test frames in flight on a killed worker are re-run on its replacement"""
+    for i, frame in enumerate(frames):
+        pool.submit("crash", frame)
+        if i == 1:
+            os.kill(pool._processes[0].pid, signal.SIGKILL)
+    results = pool.results(wait=True, source="crash")
+    assert [r.index for r in results] == list(range(len(frames)))
+    assert pool.restarts == 1
+    assert len(pool.detect_batch(frames[:3])) == 3
+
+
+def test_frame_larger_than_slot_is_rejected(pool):
+    """Test a frame that does not fit a shared-memory slot raises instead of overflowing"""
+    with pytest.raises(ValueError):
+        pool.submit("cam0", np.zeros((1080, 1920, 3), dtype=np.uint8))
+
+
+def test_crash_only_counts_against_the_running_frame(monkeypatch):
+    """Test frames queued behind a crashing one are re-run, not given up"""
+    pool = DetectorPool(Config.MODEL_PATH, workers=1, max_attempts=2)
+    requeued = queue.Queue()
+
+    def spawn(index):
+        pool._processes[index] = SimpleNamespace(is_alive=lambda: True)
+        pool._task_queues[index] = requeued
+
+    monkeypatch.setattr(pool, "_spawn", spawn)
+    for index in range(3):
+        pool._pending[("cam0", index)] = _Task(index, (4, 4, 3), 0, queued=next(pool._queued))
+    pool._pending[("cam0", 2)].attempts = 2  # Would be given up if it had been running
+
+    for _ in range(2):  # Frame 0 crashes two workers in a row
+        pool._processes[0] = SimpleNamespace(is_alive=lambda: False, exitcode=-9)
+        pool._check_workers()
+
+    assert list(pool._pending) == [("cam0", 1), ("cam0", 2)]
+    assert [task.attempts for task in pool._pending.values()] == [1, 2]
+    assert len(pool._done["cam0"][0][0]) == 0  # Given up with an empty result
@@ -32,3 +32,70 @@ def test_process_frame(fire_detector, sample_frame):
     processed_frame, detection = fire_detector.process_frame(sample_frame)
     assert isinstance(processed_frame, np.ndarray)
     assert isinstance(detection, (str, type(None)))
+
+
+def test_process_batch(fire_detector, sample_frame):
+    """Test batched processing of frames with different sizes"""
+    frames = [sample_frame, cv2.resize(sample_frame, (640, 360))]
+    outputs = fire_detector.process_batch(frames)
+    assert len(outputs) == len(frames)
+    for processed_frame, detection in outputs:
+        assert processed_frame.shape[0] == 640
+        assert isinstance(detection, (str, type(None)))
+
+
+def test_detect_returns_structured_result(fire_detector, sample_frame):
+    """Test detect() returns frame-coordinate arrays without drawing"""
+    original = sample_frame.copy()
+    detections = fire_detector.detect(sample_frame)
+    assert np.array_equal(sample_frame, original)
+    assert detections.frame_shape == sample_frame.shape[:2]
+    assert detections.input_shape[0] == 640
+    assert detections.boxes.shape == (len(detections), 4)
+    assert len(detections.class_ids) == len(detections.confidences) == len(detections)
+    assert detections.detection in ("Fire", "Smoke", None)
+
+
+def test_decide_uses_class_thresholds(fire_detector):
+    """Test Fire/Smoke decision follows the most confident qualifying box"""
+    fire_id = int(np.flatnonzero(fire_detector._is_fire)[0])
+    smoke_id = int(np.flatnonzero(fire_detector._is_smoke)[0])
+    # Smoke below smoke_confidence is ignored even when it is the most confident box
+    weak_smoke = np.array([fire_detector.smoke_confidence - 0.01, 0.6], dtype=np.float32)
+    assert fire_detector._decide(np.array([smoke_id, fire_id]), weak_smoke) == "Fire"
+    strong_smoke = np.array([0.9, 0.6], dtype=np.float32)
+    assert fire_detector._decide(np.array([smoke_id, fire_id]), strong_smoke) == "Smoke"
+    assert fire_detector._decide(np.array([smoke_id]), np.array([0.6], dtype=np.float32)) is None
+
+
+def test_annotate_rescales_to_frame(fire_detector, sample_frame):
+    """Test annotation on a display frame of a different size"""
+    detections = fire_detector.detect(sample_frame)
+    display = cv2.resize(sample_frame, (580, 348))
+    annotated = fire_detector.annotate(display, detections)
+    assert annotated.shape == (348, 580, 3)
+
+
+def test_letterbox_preprocess(sample_frame):
+    """Test single-pass letterboxing maps boxes back to the original frame"""
+    detector = Detector(Config.MODEL_PATH, preprocess="letterbox", output_height=0)
+    image, scale, pad = detector.letterbox_frame(sample_frame)
+    assert max(image.shape[:2]) == detector.target_height
+    assert image.shape[0] % 32 == 0 and image.shape[1] % 32 == 0
+    # The buffer is reused between calls
+    assert detector.letterbox_frame(sample_frame)[0] is image
+
+    detections = detector.detect(sample_frame)
+    height, width = sample_frame.shape[:2]
+    assert detections.frame_shape == (height, width)
+    assert detections.pad == pad
+    assert (detections.boxes <= [width, height, width, height]).all()
+
+    processed_frame, detection = detector.process_frame(sample_frame)
+    assert processed_frame.shape == sample_frame.shape
+
+
+def test_warmup_runs_dummy_inference(fire_detector):
+    """Test warmup accepts the configured frame shape and falls back for unknown sizes"""
+    assert fire_detector.warmup((480, 640, 3), runs=1) > 0
+    assert fire_detector.warmup((0, 0), runs=1) > 0
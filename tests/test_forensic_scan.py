@@ -0,0 +1,68 @@
+import cv2
+import numpy as np
+import pytest
+from src.detections import Detections
+from src.forensic_scan import ForensicScanner, format_timestamp
+
+FIRE_FRAMES = set(range(47, 89)) | set(range(118, 126))
+
+
+class RedDetector:
+    """Stand-in detector reporting Fire on mostly red frames"""
+
+    def __init__(self):
+        self.inferred = 0
+
+    def detect_batch(self, frames):
+        self.inferred += len(frames)
+        results = []
+        for frame in frames:
+            result = Detections.empty(frame.shape, frame.shape)
+            if frame[..., 2].mean() > 150 and frame[..., 1].mean() < 100:
+                result.detection = "Fire"
+                result.confidences = np.array([0.9], dtype=np.float32)
+            results.append(result)
+        return results
+
+
+@pytest.fixture(scope="module")
+def recording(tmp_path_factory):
+    """Five seconds at 30 FPS; red frames in FIRE_FRAMES, noisy gray otherwise"""
+    path = tmp_path_factory.mktemp("scan") / "recording.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), 30, (160, 120))
+    rng = np.random.default_rng(0)
+    for index in range(150):
+        frame = rng.integers(90, 110, (120, 160, 3), dtype=np.uint8)
+        if index in FIRE_FRAMES:
+            frame[..., 2], frame[..., 1] = 220, 40
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def test_events_refined_to_exact_frames(recording):
+    """Test the coarse pass finds both events and the fine pass pins their boundaries"""
+    detector = RedDetector()
+    report = ForensicScanner(detector, interval=1.0, merge_gap=1.0).scan(
+        cv2.VideoCapture(str(recording)))
+
+    assert [(e.first_frame, e.last_frame) for e in report.events] == [(47, 88), (118, 125)]
+    assert report.events[0].start == pytest.approx(47 / 30)
+    assert report.events[0].to_dict()['start_timestamp'] == '00:00:01.567'
+    assert report.frames == 150 and report.coarse_inferred == 5
+    # Only the samples and the refine windows were decoded and inferred
+    assert detector.inferred == report.coarse_inferred + report.refine_inferred < 150
+    assert report.decoded == detector.inferred
+
+
+def test_flicker_merges_and_max_frames(recording):
+    """Test a wide merge gap joins nearby events and max_frames bounds the scan"""
+    merged = ForensicScanner(RedDetector(), interval=1.0, merge_gap=2.0).scan(
+        cv2.VideoCapture(str(recording)))
+    assert [(e.first_frame, e.last_frame) for e in merged.events] == [(47, 125)]
+
+    partial = ForensicScanner(RedDetector(), interval=0.4).scan(
+        cv2.VideoCapture(str(recording)), max_frames=60)
+    assert partial.frames == 60
+    assert [(e.first_frame, e.last_frame) for e in partial.events] == [(47, 59)]
+    assert format_timestamp(3725.5) == '01:02:05.500'
@@ -0,0 +1,64 @@
+import multiprocessing as mp
+import sys
+
+import cv2
+import pytest
+from src.config import Config
+from src.fork_launcher import ForkLauncher, process_memory
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"),
+                                reason="fork and /proc are Linux only")
+
+
+def detect_and_report(detector, image_path, results):
+    """Worker: run the inherited detector once and report the result"""
+    detections = detector.detect(cv2.imread(image_path))
+    results.put((detections.frame_shape, process_memory().uss))
+
+
+def test_process_memory_reads_smaps_rollup():
+    """Test RSS, PSS and USS are read for the current process"""
+    usage = process_memory()
+    assert usage is not None
+    assert 0 < usage.uss <= usage.rss and 0 < usage.pss <= usage.rss
+
+
+def test_forked_workers_share_the_warm_model():
+    """Test forked workers use the parent's detector without a private copy of it"""
+    launcher = ForkLauncher(Config.MODEL_PATH)
+    detector = launcher.prepare()
+    results = mp.get_context("fork").Queue()
+    try:
+        launcher.start(detect_and_report, [("data/test_image.png", results)] * 2)
+        reports = [results.get(timeout=60) for _ in range(2)]
+        launcher.join(timeout=10)
+    finally:
+        launcher.stop()
+
+    shape = cv2.imread("data/test_image.png").shape[:2]
+    assert all(frame_shape == shape for frame_shape, _ in reports)
+    # A worker's own memory is a fraction of the parent's, which holds the model
+    parent_uss = process_memory().uss
+    assert all(uss < parent_uss / 2 for _, uss in reports)
+    assert detector is launcher.detector
+
+
+def test_prepare_leaves_gc_on_and_start_refuses_threads():
+    """Test prepare() alone re-enables GC and start() does not fork beside other threads"""
+    import gc
+    import threading
+
+    launcher = ForkLauncher(Config.MODEL_PATH)
+    launcher.prepare()
+    assert gc.isenabled()
+
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, name="reader")
+    thread.start()
+    try:
+        with pytest.raises(RuntimeError, match="reader"):
+            launcher.start(detect_and_report, [("data/test_image.png", None)])
+        assert launcher.processes == []
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,102 @@
+import cv2
+import numpy as np
+import pytest
+from src.config import Config
+from src.detection_zones import DetectionZones
+from src.detections import Detections
+from src.fire_detector import Detector
+from src.frame_cache import FrameCache
+
+
+@pytest.fixture
+def frame():
+    return cv2.imread('data/test_image.png')
+
+
+def result(frame):
+    return Detections.empty(frame.shape, (640, 640))
+
+
+def test_duplicate_and_noisy_frames_hit(frame):
+    """Test identical frames and re-encoded copies are answered from the cache"""
+    cache = FrameCache(max_distance=4)
+    cached, key = cache.lookup(frame)
+    assert cached is None
+    cache.store(key, result(frame))
+
+    assert cache.lookup(frame.copy())[0] is not None
+    _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+    assert cache.lookup(cv2.imdecode(jpeg, cv2.IMREAD_COLOR))[0] is not None
+    assert cache.lookup(np.ascontiguousarray(frame[:, ::-1]))[0] is None  # Different content
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+
+def test_hamming_tolerance_and_context(frame):
+    """Test max_distance bounds the accepted hash difference and contexts never mix"""
+    exact = FrameCache(max_distance=0)
+    exact.store(exact.lookup(frame)[1], result(frame))
+    shifted = np.roll(frame, 40, axis=1)
+    distance = (exact.frame_hash(shifted) ^ exact.frame_hash(frame)).bit_count()
+    assert distance > 0 and exact.lookup(shifted)[0] is None
+
+    tolerant = FrameCache(max_distance=distance)
+    tolerant.store(tolerant.lookup(frame)[1], result(frame))
+    assert tolerant.lookup(shifted)[0] is not None
+    assert tolerant.lookup(frame, context="other camera")[0] is None
+
+
+def test_entries_expire_and_are_evicted(frame, monkeypatch):
+    """Test results expire after the TTL even when hit, and the LRU bound holds"""
+    now = [100.0]
+    monkeypatch.setattr('src.frame_cache.time.monotonic', lambda: now[0])
+    cache = FrameCache(max_entries=2, ttl=1.0)
+    cache.store(cache.lookup(frame)[1], result(frame))
+    now[0] += 0.9
+    assert cache.lookup(frame)[0] is not None
+    now[0] += 0.2  # 1.1 s after the inference
+    assert cache.lookup(frame)[0] is None and cache.stats.expired == 1
+
+    for i in range(3):
+        image = np.full((64, 64, 3), 0, dtype=np.uint8)
+        image[:, 16 * (i + 1):] = 255  # dHash bits need left-to-right brightening
+        cache.store(cache.lookup(image)[1], result(image))
+    assert len(cache) == 2 and cache.stats.evicted == 1
+
+
+def test_detector_skips_inference_for_duplicates(frame, monkeypatch):
+    """Test Detector only runs the model for frames not in its cache"""
+    detector = Detector(Config.MODEL_PATH, frame_cache=FrameCache())
+    calls = []
+    predict = detector.model_handle.predict
+    monkeypatch.setattr(detector.model_handle, 'predict',
+                        lambda images, *args, **kwargs: calls.append(len(images))
+                        or predict(images, *args, **kwargs))
+
+    first = detector.detect(frame)
+    results = detector.detect_batch([frame, np.zeros_like(frame), frame])
+    assert calls == [1, 1]  # Only the black frame was inferred the second time
+    np.testing.assert_array_equal(results[0].boxes, first.boxes)
+    assert results[2] is not results[0]
+    processed, _ = detector.process_frame(frame)
+    assert processed.shape[0] == 640 and calls == [1, 1]
+
+
+def test_cache_keeps_sources_and_zones_apart(frame, monkeypatch):
+    """Test a shared cache never answers one camera or zone set with another's result"""
+    detector = Detector(Config.MODEL_PATH, frame_cache=FrameCache())
+    calls = []
+    predict = detector.model_handle.predict
+    monkeypatch.setattr(detector.model_handle, 'predict',
+                        lambda images, *args, **kwargs: calls.append(len(images))
+                        or predict(images, *args, **kwargs))
+
+    detector.detect_batch([frame, frame], sources=['cam0', 'cam1'])
+    assert calls == [2]
+    detector.detect(frame, source='cam1')
+    assert calls == [2]
+
+    square = [(0, 0), (0.5, 0), (0.5, 0.5), (0, 0.5)]
+    detector.detect(frame, DetectionZones([square]), source='cam0')
+    detector.detect(frame, DetectionZones([square]), source='cam0')  # Equal, not identical
+    detector.detect(frame, DetectionZones([square], min_overlap=0.9), source='cam0')
+    assert calls == [2, 1, 1]
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import numpy as np
+from src.config import Config
+from src.frame_grabber import FrameGrabber
+from src.stream_scheduler import open_capture
+
+VIDEO = str(Config.PROJECT_ROOT / 'data' / 'gara.mp4')
+
+
+class CountingCapture:
+    """Stand-in capture producing numbered frames at a fixed rate"""
+
+    def __init__(self, frames, interval=0.0):
+        self.frames = frames
+        self.interval = interval
+        self.read_count = 0
+        self.released = False
+
+    def get(self, prop):
+        return 0
+
+    def read(self):
+        if self.read_count >= self.frames:
+            return False, None
+        time.sleep(self.interval)
+        self.read_count += 1
+        return True, np.full((4, 4, 3), self.read_count, dtype=np.uint8)
+
+    def release(self):
+        self.released = True
+
+
+def test_slow_consumer_gets_newest_frame():
+    """Test a consumer slower than the source skips stale frames and counts them"""
+    grabber = FrameGrabber(CountingCapture(20, interval=0.005)).start()
+    try:
+        ok, first = grabber.read()
+        time.sleep(0.05)  # Several frames arrive meanwhile
+        ok, frame = grabber.read()
+        assert ok and frame[0, 0, 0] - first[0, 0, 0] > 1
+        while grabber.read()[0]:
+            pass
+    finally:
+        grabber.stop()
+
+    stats = grabber.stats
+    assert stats.frames_read == 20 and stats.frames_dropped > 0
+    assert stats.frames_taken + stats.frames_dropped == 20
+    assert grabber.finished and grabber.cap.released
+    assert grabber.read() == (False, None)
+
+
+def test_ring_hands_out_oldest_in_order():
+    """Test take(oldest=True) keeps the ring order and only overflow is dropped"""
+    grabber = FrameGrabber(CountingCapture(5), buffer_size=3).start()
+    while not grabber._ended:
+        time.sleep(0.01)
+    taken = [grabber.take(oldest=True)[0][0, 0, 0] for _ in range(3)]
+    assert taken == [3, 4, 5] and grabber.stats.frames_dropped == 2
+    assert grabber.take() is None and grabber.finished
+    grabber.stop()
+
+
+def test_realtime_file_bounds_frame_age():
+    """Test a file paced like a camera yields fresh frames to a slow consumer"""
+    grabber = FrameGrabber(open_capture(VIDEO), realtime=True).start()
+    try:
+        for _ in range(3):
+            ok, frame = grabber.read(timeout=2)
+            assert ok and frame.ndim == 3
+            time.sleep(0.2)  # Inference slower than the source
+            assert grabber.frame_age >= 0.2
+        assert grabber.stats.max_age < 0.1  # Age when handed out, not when used
+        assert grabber.stats.frames_dropped > 0
+    finally:
+        grabber.stop()
+
+
+def test_stalled_read_is_not_released_underneath(monkeypatch):
+    """Test stop() leaves a capture blocked in read() to be released by the reader"""
+
+    class StalledCapture(CountingCapture):
+        def __init__(self):
+            super().__init__(frames=10)
+            self.unblock = threading.Event()
+
+        def read(self):
+            self.unblock.wait()
+            assert not self.released  # Would be a use-after-release in OpenCV
+            return super().read()
+
+    cap = StalledCapture()
+    grabber = FrameGrabber(cap, name="stalled").start()
+    thread = grabber._thread
+    with monkeypatch.context() as patch:
+        patch.setattr(thread, "join", lambda timeout=None: None)  # stop() gives up at once
+        grabber.stop()
+    assert thread.is_alive() and not cap.released
+
+    cap.unblock.set()
+    thread.join(timeout=2)
+    assert cap.released and cap.read_count == 1
@@ -0,0 +1,75 @@
+import shutil
+import cv2
+import numpy as np
+import pytest
+from pathlib import Path
+from src.config import Config
+from src.detections import box_iou
+from src.fire_detector import Detector
+
+pytest.importorskip("onnxruntime")
+
+
+@pytest.fixture(scope="module")
+def onnx_model(tmp_path_factory):
+    """The exported ONNX model, exported into a temporary directory if missing"""
+    path = Config.MODEL_PATH.with_suffix(".onnx")
+    if path.exists():
+        return path
+    pytest.importorskip("onnx")
+    from ultralytics import YOLO
+    weights = tmp_path_factory.mktemp("onnx") / Config.MODEL_PATH.name
+    shutil.copy(Config.MODEL_PATH, weights)
+    return Path(YOLO(str(weights)).export(format="onnx", dynamic=True))
+
+
+def test_backends_agree_on_sample_images(onnx_model):
+    """Test ultralytics and ONNX Runtime backends return the same detections"""
+    reference = Detector(Config.MODEL_PATH, min_confidence=0.25, backend="ultralytics")
+    onnx = Detector(onnx_model, min_confidence=0.25, backend="onnxruntime")
+    assert onnx.names == reference.names
+
+    for path in sorted(Path("data").glob("*.png")):
+        frame = cv2.imread(str(path))
+        expected, actual = reference.detect(frame), onnx.detect(frame)
+        assert len(actual) == len(expected), path.name
+        assert actual.detection == expected.detection, path.name
+        if len(expected):
+            iou = box_iou(expected.boxes, actual.boxes)
+            match = iou.argmax(axis=1)
+            assert (iou.max(axis=1) > 0.9).all(), path.name
+            assert (actual.class_ids[match] == expected.class_ids).all(), path.name
+            np.testing.assert_allclose(actual.confidences[match], expected.confidences, atol=0.02)
+
+
+def test_onnx_postprocess_decodes_and_suppresses(onnx_model):
+    """Test raw output decoding, the confidence filter and class-aware NMS"""
+    backend = Detector(onnx_model, backend="onnxruntime").backend
+    # Columns are anchors: [cx, cy, w, h, fire score, smoke score]
+    raw = np.array([
+        [50, 52, 50, 300],
+        [50, 50, 50, 300],
+        [20, 20, 20, 40],
+        [20, 20, 20, 40],
+        [0.9, 0.8, 0.1, 0.05],
+        [0.0, 0.0, 0.7, 0.02],
+    ], dtype=np.float32)
+    boxes = backend.postprocess(raw, iou=0.5, conf=0.25, gain=0.5, pad=(10, 0),
+                                image_shape=(400, 800))
+
+    # Anchor 1 overlaps anchor 0 of the same class; anchor 3 is below conf
+    assert boxes[:, 4].tolist() == pytest.approx([0.9, 0.7])
+    assert boxes[:, 5].tolist() == [0, 1]
+    # (x - pad) / gain: [40 - 10, 40, 60 - 10, 60] / 0.5
+    assert boxes[0, :4].tolist() == pytest.approx([60, 80, 100, 120])
+
+
+def test_incomplete_backend_fails_at_construction():
+    """Test a backend without predict() cannot be created"""
+    from src.inference_backends import InferenceBackend
+
+    class NoPredict(InferenceBackend):
+        names = {0: 'Fire'}
+
+    with pytest.raises(TypeError):
+        NoPredict()
@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+import numpy as np
+from src.config import Config
+from src.fire_detector import Detector
+from src.latency_governor import LatencyGovernor
+from src.tiling import TilingConfig
+
+
+def make_detector(tiling=None):
+    """Stand-in exposing the attributes the governor adjusts"""
+    return SimpleNamespace(target_height=640, output_height=None, tiling=tiling)
+
+
+def run_window(governor, seconds):
+    for _ in range(governor.window):
+        governor.record(seconds)
+
+
+def test_steps_down_over_budget_and_back_up_with_headroom():
+    """Test resolution drops while over budget and recovers once there is headroom"""
+    detector = make_detector()
+    governor = LatencyGovernor(detector, target_fps=10, window=5)
+    assert detector.output_height == 640  # Output size no longer follows target_height
+
+    run_window(governor, 0.2)
+    assert detector.target_height == 576 and governor.changes == 1
+    run_window(governor, 0.08)  # Within budget but above the low watermark: hold
+    assert detector.target_height == 576
+    run_window(governor, 0.02)
+    assert detector.target_height == 640 and governor.level == 0
+
+
+def test_ladder_ends_with_inference_stride():
+    """Test the cheapest levels keep the lowest height and skip frames"""
+    detector = make_detector()
+    governor = LatencyGovernor(detector, target_fps=10, window=2, min_height=512, max_stride=3)
+    for _ in range(len(governor.levels) + 2):
+        run_window(governor, 1.0)
+    assert detector.target_height == 512 and governor.settings.stride == 3
+    assert [governor.should_infer() for _ in range(6)] == [True, False, False] * 2
+
+
+def test_tiling_uses_fewer_larger_tiles_first():
+    """Test tiles grow before the resolution drops, at the original model input size"""
+    detector = make_detector(TilingConfig(tile_size=640, overlap=0.2))
+    governor = LatencyGovernor(detector, target_fps=10, window=2, tile_growth=(1.5,))
+
+    run_window(governor, 1.0)
+    assert detector.tiling.tile_size == 960 and detector.tiling.input_size == 640
+    assert detector.target_height == 640
+    run_window(governor, 1.0)
+    assert detector.target_height == 576 and detector.tiling.tile_size == 960
+
+
+def test_cpu_budget_limits_when_wall_time_fits():
+    """Test the CPU budget steps down even when wall time is within budget"""
+    detector = make_detector()
+    governor = LatencyGovernor(detector, target_fps=10, cpu_budget=0.5, window=3)
+    for _ in range(3):
+        governor.record(0.05, cpu_seconds=0.08)  # 0.08 s CPU vs 0.05 s per frame
+    assert governor.level == 1
+
+
+def test_failed_step_up_backs_off():
+    """Test a load that only fits the lower level does not make the settings oscillate"""
+    detector = make_detector()
+    governor = LatencyGovernor(detector, target_fps=10, window=2)
+    run_window(governor, 0.2)
+    assert governor.level == 1
+
+    levels = []
+    for _ in range(20):
+        # Cheap enough at the lower level, over budget at the higher one
+        run_window(governor, 0.05 if governor.level == 1 else 0.15)
+        levels.append(governor.level)
+    # Each failed step up doubles the wait, so most windows stay at the lower level
+    assert levels.count(0) <= 4
+    assert governor.changes <= 9
+
+
+def test_lower_height_shrinks_the_real_model_input(monkeypatch):
+    """Test a height step makes a real Detector's model input smaller in resize mode"""
+    detector = Detector(Config.MODEL_PATH)
+    governor = LatencyGovernor(detector, target_fps=10, window=1, height_step=320)
+    predict = detector.model_handle.predict
+    sizes = []
+
+    def record(images, iou, conf, imgsz=None):
+        sizes.append(imgsz)
+        return predict(images, iou, conf, imgsz)
+
+    monkeypatch.setattr(detector.model_handle, "predict", record)
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    detector.detect(frame)
+    governor.record(1.0)
+    detections = detector.detect(frame)
+    assert sizes == [640, 320] and detections.frame_shape == (1080, 1920)
+
+
+def test_stride_applies_with_tracking():
+    """Test the stride level skips frames in --track mode too, re-drawing the tracked result"""
+    from scripts.run_headless import FrameProcessor
+    from src.tracker import KeyframeTracker
+
+    detector = Detector(Config.MODEL_PATH)
+    tracker = KeyframeTracker(detector)
+    governor = LatencyGovernor(detector, target_fps=10, window=100, max_stride=3)
+    governor._apply(len(governor.levels) - 1, "forced for the test")  # Stride 3
+    process = FrameProcessor(detector, tracker=tracker, governor=governor)
+
+    frame = np.zeros((360, 640, 3), dtype=np.uint8)
+    outputs = [process(frame) for _ in range(6)]
+    assert governor.settings.stride == 3 and tracker.frames == 2
+    assert all(output.shape == outputs[0].shape for output in outputs)
@@ -0,0 +1,73 @@
+import urllib.error
+import urllib.request
+
+import cv2
+import pytest
+from src.config import Config
+from src.fire_detector import Detector
+from src.metrics import Metrics, RollingHistogram, metrics
+
+
+@pytest.fixture
+def enabled_metrics():
+    """The shared instance, collecting for one test only"""
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.enabled = False
+    metrics.reset()
+
+
+def test_disabled_metrics_record_nothing():
+    """Test the disabled instance hands out one shared no-op timer and keeps no data"""
+    disabled = Metrics()
+    assert disabled.timer("a") is disabled.timer("b", camera="cam0")
+    with disabled.timer("a"):
+        pass
+    disabled.inc("frames_total")
+    disabled.set("queue_depth", 3)
+    assert disabled.render() == "\n"
+
+
+def test_histogram_buckets_and_rolling_quantiles():
+    """Test cumulative buckets keep growing while quantiles follow the recent window"""
+    histogram = RollingHistogram(buckets=(0.01, 0.1), window=4)
+    for value in (0.005, 0.01, 0.05, 0.5, 0.5, 0.5, 0.5):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 4] and histogram.count == 7
+    assert histogram.quantiles((0.5,)) == {0.5: 0.5}
+
+
+def test_render_prometheus_text():
+    """Test histograms, summaries, counters and gauges in the exposition format"""
+    m = Metrics(prefix="test", enabled=True)
+    m.observe("inference", 0.02, camera='cam"0')
+    m.inc("alerts_total", camera="cam1")
+    m.inc("alerts_total", camera="cam1")
+    m.set("frames_dropped_total", 5, kind="counter", camera="cam1")
+    text = m.render()
+    assert '# TYPE test_stage_seconds histogram' in text
+    assert 'test_stage_seconds_bucket{camera="cam\\"0",stage="inference",le="0.025"} 1' in text
+    assert 'test_stage_seconds_bucket{camera="cam\\"0",stage="inference",le="+Inf"} 1' in text
+    assert 'test_stage_recent_seconds{camera="cam\\"0",stage="inference",quantile="0.5"} 0.02' \
+        in text
+    assert '# TYPE test_alerts_total counter\ntest_alerts_total{camera="cam1"} 2' in text
+    assert 'test_frames_dropped_total{camera="cam1"} 5' in text
+
+
+def test_detector_stages_served_over_http(enabled_metrics):
+    """Test process_frame stages are recorded and served at /metrics"""
+    detector = Detector(Config.MODEL_PATH)
+    detector.process_frame(cv2.imread('data/test_image.png'))
+    for stage in ("preprocess", "inference", "postprocess", "output_frame", "draw"):
+        assert enabled_metrics.quantiles(stage)[0.5] > 0
+
+    server = enabled_metrics.serve(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        body = urllib.request.urlopen(f"{url}/metrics").read().decode()
+        assert 'flareguard_stage_seconds_count{stage="inference"} 1' in body
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/other")
+    finally:
+        enabled_metrics.stop()
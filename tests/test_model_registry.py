@@ -0,0 +1,86 @@
+import os
+import shutil
+import time
+import cv2
+import pytest
+from src.config import Config
+from src.fire_detector import Detector
+from src.model_registry import registry
+
+
+@pytest.fixture
+def weights(tmp_path):
+    """A private copy of the weights, so tests can replace the file"""
+    path = tmp_path / Config.MODEL_PATH.name
+    shutil.copy(Config.MODEL_PATH, path)
+    return path
+
+
+def test_detectors_share_one_model():
+    """Test detectors with different thresholds re-use the loaded model"""
+    strict = Detector(Config.MODEL_PATH, min_confidence=0.8)
+    loose = Detector(Config.MODEL_PATH, min_confidence=0.2)
+    assert strict.model_handle is loose.model_handle
+    assert strict.backend is loose.backend
+    assert (strict.min_confidence, loose.min_confidence) == (0.8, 0.2)
+
+
+def test_hot_swap_between_frames(weights):
+    """Test replaced weights are swapped in while frames keep being processed"""
+    detector = Detector(weights)
+    handle = detector.model_handle
+    frame = cv2.imread('data/test_image.png')
+    detector.detect(frame)
+    old_backend = handle.backend
+
+    handle.watch(interval=0.05)
+    try:
+        shutil.copy(Config.MODEL_PATH, weights)
+        os.utime(weights, (time.time() + 10, time.time() + 10))
+
+        processed = 0
+        deadline = time.time() + 60
+        while handle.version == 1 and time.time() < deadline:
+            assert detector.detect(frame).frame_shape == frame.shape[:2]
+            processed += 1
+    finally:
+        handle.stop_watching()
+
+    assert handle.version == 2
+    assert handle.backend is not old_backend
+    assert processed > 0  # Frames were served by the old model during the reload
+    assert detector.detect(frame).frame_shape == frame.shape[:2]
+
+
+def test_failed_reload_keeps_current_model(weights):
+    """Test a broken weights file does not replace the working model"""
+    handle = registry.get(weights)
+    backend = handle.backend
+    weights.write_bytes(b"not a model")
+    handle.reload(wait=True)
+    assert handle.backend is backend and handle.version == 1
+
+
+def test_failed_reload_is_not_retried(weights, monkeypatch):
+    """Test the watcher tries a broken file once instead of on every poll"""
+    from src import model_registry
+    handle = registry.get(weights)
+    attempts = []
+
+    def create_backend(*args):
+        attempts.append(args)
+        raise ValueError("not a model")
+
+    monkeypatch.setattr(model_registry, "create_backend", create_backend)
+    os.utime(weights, (time.time() + 10, time.time() + 10))
+    handle.watch(interval=0.02)
+    try:
+        time.sleep(0.5)
+    finally:
+        handle.stop_watching()
+    assert len(attempts) == 1 and handle.version == 1
+
+
+def test_auto_backend_shares_the_explicit_one(weights):
+    """Test "auto" and the backend it resolves to map to the same handle"""
+    assert registry.get(weights, "auto") is registry.get(weights, "ultralytics")
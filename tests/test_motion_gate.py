@@ -0,0 +1,34 @@
+import pytest
+import numpy as np
+from src.motion_gate import MotionGate
+
+
+@pytest.fixture
+def static_frame():
+    return np.full((360, 640, 3), 90, dtype=np.uint8)
+
+
+def test_gate_skips_static_frames(static_frame):
+    """Test unchanged frames re-use the last result"""
+    gate = MotionGate(max_skip_frames=100)
+    assert gate.should_infer(static_frame)
+    assert not any(gate.should_infer(static_frame.copy()) for _ in range(10))
+    assert gate.stats.skipped == 10
+    assert gate.stats.hit_rate == pytest.approx(10 / 11)
+
+
+def test_gate_detects_change(static_frame):
+    """Test a changed region triggers inference"""
+    gate = MotionGate(max_skip_frames=100)
+    gate.should_infer(static_frame)
+    changed = static_frame.copy()
+    changed[100:160, 200:300] = 250
+    assert gate.should_infer(changed)
+
+
+def test_gate_forces_minimum_interval(static_frame):
+    """Test inference is forced after max_skip_frames skipped frames"""
+    gate = MotionGate(max_skip_frames=3)
+    decisions = [gate.should_infer(static_frame) for _ in range(9)]
+    assert decisions == [True, False, False, False, True, False, False, False, True]
+    assert gate.stats.forced == 2
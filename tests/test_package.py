@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+
+def run(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+def test_package_import_is_lazy():
+    """Test importing the package or its config does not load OpenCV, telegram or the model stack"""
+    heavy = ['cv2', 'telegram', 'ultralytics', 'torch', 'onnxruntime', 'cvzone']
+    loaded = run(f"import sys, src, src.config; print([m for m in {heavy} if m in sys.modules])")
+    assert loaded == '[]'
+
+
+def test_lazy_exports_resolve():
+    """Test the package exports are still available as attributes"""
+    assert run("import src; print(src.Detector.__name__, src.Detections.__name__)") \
+        == 'Detector Detections'
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+from src import segment_runner
+from src.config import Config
+from src.segment_runner import SegmentRunner, plan_segments
+
+
+def test_plan_covers_every_frame_once():
+    """Test segments are contiguous, near-equal and warm up on the frames before them"""
+    plan = plan_segments(100, 3, overlap=10)
+    assert [(s.start, s.end, s.warmup_start) for s in plan] == \
+        [(0, 33, 0), (33, 67, 23), (67, 100, 57)]
+    assert sum(s.frames for s in plan) == 100
+    assert len(plan_segments(2, 4, overlap=10)) == 2
+
+
+@pytest.fixture
+def video(tmp_path):
+    """24 frames, each brighter than the one before"""
+    path = tmp_path / 'in.mp4'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), 10, (160, 120))
+    for index in range(24):
+        writer.write(np.full((120, 160, 3), 20 + index * 9, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_segments_stitched_in_order(tmp_path, video, monkeypatch):
+    """Test parallel segments are written once each and stitched back in frame order"""
+    commands = []
+
+    def ffmpeg(cmd, **kwargs):
+        commands.append((cmd, (tmp_path / 'segments' / 'concat.txt').read_text()))
+        return SimpleNamespace(returncode=1, stderr='unsupported')  # Falls back to OpenCV
+
+    monkeypatch.setattr(segment_runner.shutil, 'which', lambda name: '/usr/bin/ffmpeg')
+    monkeypatch.setattr(segment_runner.subprocess, 'run', ffmpeg)
+
+    runner = SegmentRunner(Config.MODEL_PATH, segments=2, overlap=4)
+    report = runner.run(video, tmp_path / 'segments')
+    assert [(r.frames, r.warmup_frames) for r in report.segments] == [(12, 0), (12, 4)]
+    assert report.work_seconds > 0 and report.events == []
+
+    out = tmp_path / 'out.mp4'
+    assert runner.stitch(report, out) == 24
+    [(cmd, listing)] = commands
+    assert cmd[cmd.index('-f') + 1] == 'concat' and cmd[cmd.index('-c') + 1] == 'copy'
+    assert listing.splitlines() == [f"file '{result.path.resolve()}'" for result in report.segments]
+    assert not list((tmp_path / 'segments').iterdir())
+    cap = cv2.VideoCapture(str(out))
+    brightness = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        brightness.append(frame[:frame.shape[0] // 2].mean())  # Above the footer overlay
+    assert len(brightness) == 24 and brightness == sorted(brightness)
+
+
+def test_unknown_frame_count_is_an_error(tmp_path, monkeypatch):
+    """Test a video without a frame count fails instead of writing nothing"""
+    capture = SimpleNamespace(isOpened=lambda: True, get=lambda prop: 0, release=lambda: None)
+    monkeypatch.setattr(segment_runner.cv2, 'VideoCapture', lambda path: capture)
+    with pytest.raises(IOError, match="frame count"):
+        SegmentRunner(Config.MODEL_PATH, segments=2).run(tmp_path / 'stream.mkv', tmp_path)
+
+
+class OvershootingCapture:
+    """Stand-in capture whose seeks land up to 10 frames late, like a keyframe seek"""
+
+    def __init__(self, frames=100, overshoot=lambda position: 10):
+        self.frames, self.overshoot, self.position, self.seeks = frames, overshoot, 0, []
+
+    def set(self, prop, position):
+        self.seeks.append(position)
+        self.position = min(self.frames, position + self.overshoot(position))
+
+    def get(self, prop):
+        return self.position
+
+    def grab(self):
+        if self.position >= self.frames:
+            return False
+        self.position += 1
+        return True
+
+
+def test_seek_past_target_steps_back_and_grabs_forward():
+    """Test a seek landing after the warm-up frame is redone earlier instead of skipping frames"""
+    cap = OvershootingCapture(overshoot=lambda position: 10 if position > 30 else 3)
+    assert segment_runner._seek(cap, 40, step=20) == 40 and cap.position == 40
+    assert cap.seeks == [40, 20]
+
+    with pytest.raises(IOError, match="frame 5"):
+        segment_runner._seek(OvershootingCapture(), 5, step=20)  # Even frame 0 overshoots
@@ -0,0 +1,36 @@
+import numpy as np
+from src.detections import merge_boxes
+from src.tiling import make_tiles
+
+
+def test_tiles_cover_frame_with_overlap():
+    """Test tiles stay inside the frame, cover it and overlap"""
+    tiles = make_tiles((2160, 3840, 3), 640, 0.2)
+    assert (tiles[:, 2] - tiles[:, 0] == 640).all()
+    assert (tiles[:, 3] - tiles[:, 1] == 640).all()
+    assert tiles[:, :2].min() == 0
+    assert tiles[:, 2].max() == 3840 and tiles[:, 3].max() == 2160
+
+    xs = np.unique(tiles[:, 0])
+    assert (np.diff(xs) <= 640 * 0.8).all()
+
+
+def test_small_frame_is_single_tile():
+    """Test a frame smaller than a tile is not split"""
+    assert make_tiles((300, 200), 640, 0.2).tolist() == [[0, 0, 200, 300]]
+
+
+def test_merge_boxes_is_class_aware():
+    """Test overlapping boxes are merged only within a class"""
+    boxes = np.array([[0, 0, 100, 100], [5, 5, 100, 100], [0, 0, 100, 100]], dtype=np.float32)
+    keep, _ = merge_boxes(boxes, np.array([0.9, 0.8, 0.7]), np.array([0, 0, 1]), 0.5)
+    assert keep.tolist() == [0, 2]
+
+
+def test_merge_boxes_fuses_partial_boxes():
+    """Test a box cut by a tile border is fused with the rest of the object"""
+    boxes = np.array([[0, 0, 100, 50], [60, 0, 100, 50]], dtype=np.float32)
+    keep, merged = merge_boxes(boxes, np.array([0.6, 0.9]), np.array([0, 0]), 0.5,
+                               metric="ios", fuse=True)
+    assert keep.tolist() == [1]
+    assert merged.tolist() == [[0, 0, 100, 50]]
@@ -0,0 +1,89 @@
+import json
+import logging
+from types import SimpleNamespace
+
+import cv2
+import pytest
+from src.config import Config
+from src.fire_detector import Detector
+from src.notification_service import FlareGuardBot, NotificationService
+from src.tracing import Tracer, span
+
+
+class FakeTelegram:
+    """Stands in for telegram.Bot: a session context and send_photo"""
+    def __init__(self):
+        self.sent = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def send_photo(self, chat_id, **kwargs):
+        self.sent.append(chat_id)
+
+
+@pytest.fixture
+def frame():
+    return cv2.imread('data/test_image.png')
+
+
+def test_spans_summary_and_export(tmp_path):
+    """Test spans, delivery latency percentiles and the JSON Lines export"""
+    tracer = Tracer(export_path=tmp_path / 'traces.jsonl')
+    quiet = tracer.start("cam1", capture_time=100.0)  # A frame without an alert
+    quiet.record("detect", 100.0, 100.75)
+    trace = tracer.start("cam0", capture_time=100.0)
+    trace.record("detect", 100.0, 100.25)
+    trace.alert(100.25, 100.5)
+    trace.record("telegram_send", 101.0, 101.5, channel="telegram")
+    tracer._observe_delivery(trace, "telegram", True, 102.0)
+    tracer._observe_delivery(trace, "whatsapp", False, 103.0)
+    with span(None, "ignored"):  # No trace: nothing recorded
+        pass
+
+    summary = tracer.summary()
+    assert summary['stages']['detect'] == {'count': 1, 'p50': 0.25, 'p95': 0.25, 'p99': 0.25}
+    assert summary['stages']['alert_decision']['p50'] == 0.25
+    assert summary['stages']['telegram_send[telegram]']['p50'] == 0.5
+    assert summary['capture_to_delivery']['telegram']['p50'] == 2.0
+    assert summary['failed_deliveries'] == {'whatsapp': 1}
+
+    lines = [json.loads(line) for line in (tmp_path / 'traces.jsonl').read_text().splitlines()]
+    assert [(line['channel'], line['success'], line['latency']) for line in lines] == \
+        [('telegram', True, 2.0), ('whatsapp', False, 3.0)]
+    assert lines[0]['trace_id'] == trace.trace_id and len(lines[0]['spans']) == 3
+
+    tracer.write_summary(tmp_path / 'summary.json')
+    assert json.loads((tmp_path / 'summary.json').read_text()) == summary
+
+
+def test_trace_follows_alert_to_each_channel(frame, tmp_path, monkeypatch):
+    """Test one trace spans process_frame, the executor, the upload and both channels"""
+    monkeypatch.setattr(Config, 'DETECTED_FIRES_DIR', tmp_path)
+    monkeypatch.setattr('src.notification_service.requests.get',
+                        lambda url, timeout: SimpleNamespace(status_code=200))
+    service = NotificationService(Config)
+    service.whatsapp_enabled, service.base_url = True, "http://localhost/whatsapp"
+    bot = object.__new__(FlareGuardBot)  # Skips the token and chat id storage setup
+    bot.logger, bot.chat_ids, bot.bot = logging.getLogger(__name__), [1, 2], FakeTelegram()
+    service.telegram_bot = bot
+
+    tracer = Tracer()
+    trace = tracer.start("cam0")
+    processed, _ = Detector(Config.MODEL_PATH).process_frame(frame, trace=trace)
+    try:
+        service.send_alert(processed, "Fire", trace)
+    finally:
+        service.cleanup()
+
+    assert bot.bot.sent == [1, 2]
+    names = [(s.name, s.channel) for s in trace.spans]
+    assert names == [("process_frame", None), ("save_frame", None), ("executor_queue", None),
+                     ("upload_image", "whatsapp"), ("whatsapp_send", "whatsapp"),
+                     ("telegram_send", "telegram"), ("telegram_send", "telegram")]
+    latency = tracer.summary()['capture_to_delivery']
+    assert latency['whatsapp']['count'] == latency['telegram']['count'] == 1
+    assert latency['telegram']['p50'] >= latency['whatsapp']['p50'] > 0
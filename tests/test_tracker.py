@@ -0,0 +1,113 @@
+import numpy as np
+from src.detections import Detections
+from src.tracker import KeyframePolicy, KeyframeTracker, Tracker
+
+
+def moving_box(frame):
+    """A 40x40 box moving 5 px right per frame"""
+    return np.array([[100 + 5 * frame, 100, 140 + 5 * frame, 140]], dtype=np.float32)
+
+
+def test_track_ids_are_stable():
+    """Test a moving object keeps its id and a second object gets a new one"""
+    tracker = Tracker()
+    ids = []
+    for frame in range(10):
+        tracker.predict()
+        ids.append(tracker.update(moving_box(frame), np.array([0]), np.array([0.9]))[0])
+    assert len(set(ids)) == 1
+
+    tracker.predict()
+    boxes = np.concatenate([moving_box(10), [[400, 400, 450, 450]]])
+    new_ids = tracker.update(boxes, np.array([0, 0]), np.array([0.9, 0.8]))
+    assert new_ids[0] == ids[0] and new_ids[1] != ids[0]
+
+
+def test_tracks_coast_with_velocity():
+    """Test predictions between keyframes follow the estimated motion"""
+    tracker = Tracker()
+    for frame in range(0, 20, 2):  # Keyframe every other frame
+        tracker.predict()
+        tracker.update(moving_box(frame), np.array([0]), np.array([0.9]))
+        tracker.predict()
+    tracker.predict()
+    # Two frames after the last keyframe at frame 18
+    np.testing.assert_allclose(tracker.tracks[0].box, moving_box(20)[0], atol=3)
+
+
+def test_matching_is_class_aware_and_lost_tracks_expire():
+    """Test a box of another class starts a new track and unmatched tracks are dropped"""
+    tracker = Tracker(max_missed=1)
+    tracker.predict()
+    first = tracker.update(moving_box(0), np.array([0]), np.array([0.9]))[0]
+    tracker.predict()
+    second = tracker.update(moving_box(0), np.array([1]), np.array([0.9]))[0]
+    assert second != first
+
+    for _ in range(2):
+        tracker.predict()
+        tracker.update(np.zeros((0, 4)), np.zeros(0, dtype=int), np.zeros(0))
+    assert tracker.tracks == []
+
+
+def test_keyframe_interval_adapts():
+    """Test the interval grows while tracks are stable and resets when they change"""
+    tracker, policy = Tracker(), KeyframePolicy(max_interval=5, idle_interval=3)
+    tracker.predict()
+    tracker.update(moving_box(0), np.array([0]), np.array([0.9]))
+    assert policy.update(tracker) == 1  # New track: infer often
+
+    for frame in range(1, 10):
+        tracker.predict()
+        tracker.update(moving_box(frame), np.array([0]), np.array([0.9]))
+        policy.update(tracker)
+    assert policy.interval == 5
+
+    tracker.predict()
+    tracker.update(np.zeros((0, 4)), np.zeros(0, dtype=int), np.zeros(0))
+    assert policy.update(tracker) == 2  # Track lost: halve
+
+
+class FakeDetector:
+    """Returns the moving box for each detect call and counts calls"""
+    def __init__(self):
+        self.calls = 0
+        self.frame = 0
+
+    def detect(self, frame):
+        self.calls += 1
+        detections = Detections.empty((480, 640), (480, 640))
+        detections.boxes = moving_box(self.frame)
+        detections.class_ids = np.array([0], dtype=np.int32)
+        detections.confidences = np.array([0.9], dtype=np.float32)
+        detections.detection = "Fire"
+        return detections
+
+    def _decide(self, class_ids, confidences):
+        return "Fire" if len(class_ids) else None
+
+
+def test_keyframe_tracker_skips_inference():
+    """Test only keyframes are inferred and carried frames keep track ids"""
+    detector = FakeDetector()
+    tracker = KeyframeTracker(detector, policy=KeyframePolicy(max_interval=4))
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    ids = set()
+    for index in range(40):
+        detector.frame = index
+        detections = tracker.detect(frame)
+        assert detections.detection == "Fire" and len(detections) == 1
+        ids.update(detections.track_ids.tolist())
+
+    assert ids == {1}
+    assert detector.calls < 20
+
+
+def test_track_alerts_keep_a_camera_cooldown():
+    """Test new track ids alert once each, but not more often than the cooldown"""
+    from src.main import CameraAlertState
+    state = CameraAlertState()
+    assert state.should_alert_tracks([1], 100.0, cooldown=10)
+    assert not state.should_alert_tracks([1], 120.0, cooldown=10)  # Already alerted
+    assert not state.should_alert_tracks([2], 105.0, cooldown=10)  # Flicker, new id
+    assert state.should_alert_tracks([2], 111.0, cooldown=10)      # Not lost, only delayed
@@ -0,0 +1,33 @@
+import pytest
+import cv2
+from src.config import Config
+from src.video_pipeline import FramePipeline
+
+
+@pytest.fixture
+def capture():
+    cap = cv2.VideoCapture(str(Config.PROJECT_ROOT / 'data' / 'gara.mp4'))
+    yield cap
+    cap.release()
+
+
+def test_pipeline_preserves_order(capture):
+    """Test frames reach the encoder in decode order"""
+    counter = iter(range(1000))
+    written = []
+    pipeline = FramePipeline(lambda frame: next(counter), written.append, queue_size=2)
+    report = pipeline.run(capture, max_frames=30)
+
+    assert written == list(range(30))
+    assert report.frames == 30
+    assert set(report.stages) == {'decode', 'infer', 'encode'}
+    assert report.bottleneck in report.stages
+
+
+def test_pipeline_propagates_encoder_errors(capture):
+    """Test a failing encoder stops the pipeline"""
+    def fail(item):
+        raise IOError("writer failed")
+
+    with pytest.raises(IOError):
+        FramePipeline(lambda frame: frame, fail).run(capture, max_frames=30)